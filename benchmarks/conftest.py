@@ -0,0 +1,142 @@
+import functools
+import http.server
+import json
+import logging
+import pathlib
+import statistics
+import threading
+import time
+import pytest
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DIR = pathlib.Path(__file__).parent
+PAGES_DIR = BENCHMARK_DIR / "pages"
+BASELINES_FILE = BENCHMARK_DIR / "baselines.json"
+RESULTS_FILE = pathlib.Path("reports") / "benchmark_results.json"
+
+# Median timings of the current run, keyed by benchmark name
+BENCHMARK_RESULTS = {}
+# Benchmarks of the current run skipped for want of a stored baseline
+MISSING_BASELINES = []
+# Command recording the baselines of the local machine
+UPDATE_COMMAND = "pytest --headless benchmarks/ --benchmark-update"
+
+
+def pytest_addoption(parser):
+    """Adds command-line options for baseline comparison."""
+    parser.addoption("--benchmark-rounds", action="store", type=int, default=5, help="timed rounds per benchmark")
+    parser.addoption("--benchmark-threshold", action="store", type=float, default=0.3,
+                     help="allowed slowdown over the stored baseline (0.3 = 30%)")
+    parser.addoption("--benchmark-min-slack", action="store", type=float, default=0.05,
+                     help="allowed slowdown in seconds, whichever of threshold and slack is larger")
+    parser.addoption("--benchmark-update", action="store_true", default=False,
+                     help="store the medians of this run as the new baselines")
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    """
+    Serves the static replica pages of benchmarks/pages over http.server on a free port.
+    Returns the base URL of the server.
+    """
+    handler = functools.partial(_QuietHandler, directory=str(PAGES_DIR))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    logger.info(f"Benchmark fixture pages served at {base_url}")
+
+    yield base_url
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    """Loads the stored baseline medians (seconds) keyed by benchmark name."""
+    if BASELINES_FILE.exists():
+        with open(BASELINES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+@pytest.fixture
+def action_benchmark(request, baselines):
+    """
+    Times a primitive over several rounds and fails when its median regresses past the threshold.
+    A primitive without a stored baseline is skipped with a pointer to --benchmark-update.
+
+    The allowed median is max(baseline * (1 + threshold), baseline + min_slack), so millisecond-scale
+    primitives are not failed by scheduler noise.
+
+    Usage:
+        action_benchmark("click", lambda: click(login_button), setup=lambda: load_url(login_page))
+    """
+    rounds = request.config.getoption("--benchmark-rounds")
+    threshold = request.config.getoption("--benchmark-threshold")
+    min_slack = request.config.getoption("--benchmark-min-slack")
+    update = request.config.getoption("--benchmark-update")
+
+    def run(name, func, setup=None):
+        timings = []
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        BENCHMARK_RESULTS[name] = round(median, 4)
+        baseline = baselines.get(name)
+        logger.info(f"Benchmark {name}: median {median * 1000:.1f} ms over {rounds} rounds (baseline: {baseline})")
+        if update:
+            return median
+        if baseline is None:
+            MISSING_BASELINES.append(name)
+            pytest.skip(
+                f"Benchmark '{name}' has no baseline in {BASELINES_FILE.name}, nothing to compare against; "
+                f"record baselines with `{UPDATE_COMMAND}` and commit them."
+            )
+        limit = max(baseline * (1 + threshold), baseline + min_slack)
+        assert median <= limit, (
+            f"Benchmark '{name}' regressed: median {median:.4f}s exceeds baseline {baseline:.4f}s "
+            f"by more than {threshold:.0%} and {min_slack}s"
+        )
+        return median
+
+    return run
+
+
+def pytest_sessionfinish(session):
+    """Writes the medians of this run and, with --benchmark-update, stores them as baselines."""
+    if not BENCHMARK_RESULTS:
+        return
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_FILE, "w", encoding="utf-8") as f:
+        json.dump(BENCHMARK_RESULTS, f, indent=4)
+    if session.config.getoption("--benchmark-update"):
+        stored = {}
+        if BASELINES_FILE.exists():
+            with open(BASELINES_FILE, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        stored.update(BENCHMARK_RESULTS)
+        with open(BASELINES_FILE, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(stored.items())), f, indent=4)
+        logger.info(f"Benchmark baselines updated in {BASELINES_FILE}")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Makes benchmarks that compared against nothing hard to miss."""
+    if MISSING_BASELINES:
+        terminalreporter.section("benchmark baselines missing", yellow=True)
+        terminalreporter.write_line(
+            f"{len(MISSING_BASELINES)} benchmark(s) were not checked for regressions: {', '.join(MISSING_BASELINES)}"
+        )
+        terminalreporter.write_line(f"Record baselines with `{UPDATE_COMMAND}` and commit {BASELINES_FILE}.")
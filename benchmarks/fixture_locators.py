@@ -0,0 +1,21 @@
+from selenium.webdriver.common.by import By
+xpath = By.XPATH
+css_selector = By.CSS_SELECTOR
+
+# login.html (herokuapp login replica)
+username = (xpath, "//input[@id='username']")
+password = (xpath, "//input[@id='password']")
+login_button = (xpath, "//button[@class='radius']")
+login_msg = (xpath, "//div[@id='flash-messages']/div")
+
+# yatra.html (calendar, autocomplete, sidebar and results replica)
+date_cell = (xpath, "//div[@aria-label='{}']")
+calendar_next_button = (xpath, "//button[@aria-label='Next Month']")
+calendar_prev_button = (xpath, "//button[@aria-label='Previous Month']")
+city_input = (xpath, "//input[@id='input-with-icon-adornment']")
+city_option = (xpath, "(//span[contains(text(),'{}')])[1]")
+sidebar = (css_selector, "#sidebar")
+sidebar_option = (xpath, "//div[@class='filter-option'][{}]")
+result_rows = (css_selector, "div.flightItem")
+depart_details = (css_selector, "div.depart-details")
+missing_element = (css_selector, "#not-on-the-page")
@@ -0,0 +1,100 @@
+import logging
+from helpers.webdriver_actions import *
+from helpers.page_helpers import (
+    get_formatted_date_in_days,
+    navigate_calendar_to_date,
+    scroll_element_into_view_in_side_bar,
+)
+from fixture_locators import *
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_DAYS_AHEAD = 120
+
+
+def test_click_benchmark(driver, fixture_server, action_benchmark):
+    action_benchmark(
+        "click",
+        lambda: click(login_button),
+        setup=lambda: load_url(f"{fixture_server}/login.html"),
+    )
+
+
+def test_type_value_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/login.html")
+    action_benchmark("type_value", lambda: type_value(username, "tomsmith"))
+
+
+def test_wait_for_element_to_be_visible_benchmark(driver, fixture_server, action_benchmark):
+    def setup():
+        load_url(f"{fixture_server}/login.html")
+        type_value(username, "tomsmith")
+        type_value(password, "SuperSecretPassword!")
+
+    def login_and_wait():
+        click(login_button)
+        wait_for_element_to_be_visible(login_msg)
+
+    action_benchmark("wait_for_element_to_be_visible", login_and_wait, setup=setup)
+
+
+def test_absent_element_check_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/login.html")
+    action_benchmark("is_element_present_absent", lambda: is_element_present(missing_element, timeout=0))
+
+
+def test_bulk_text_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/yatra.html?rows=500")
+    action_benchmark("get_elements_text_bulk", lambda: get_elements_text(result_rows, bulk=True, normalize=True))
+
+
+def test_per_element_text_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/yatra.html?rows=100")
+    action_benchmark("get_elements_text_per_element", lambda: get_elements_text(result_rows))
+
+
+def test_batch_query_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/yatra.html?rows=100")
+    queries = {
+        "rows": (result_rows, ["visible", "text"]),
+        "depart": (depart_details, ["visible", "count"]),
+        "sidebar": (sidebar, ["visible"]),
+    }
+    action_benchmark("query_elements", lambda: query_elements(queries))
+
+
+def test_calendar_navigation_benchmark(driver, fixture_server, action_benchmark):
+    target_date = get_formatted_date_in_days(CALENDAR_DAYS_AHEAD)
+
+    def navigate():
+        assert navigate_calendar_to_date(
+            date_cell, target_date, CALENDAR_DAYS_AHEAD, calendar_next_button, calendar_prev_button
+        ), f"{target_date} was not reached in the calendar."
+
+    action_benchmark(
+        "navigate_calendar_to_date",
+        navigate,
+        setup=lambda: load_url(f"{fixture_server}/yatra.html"),
+    )
+
+
+def test_autocomplete_benchmark(driver, fixture_server, action_benchmark):
+    def select_city():
+        type_value(city_input, "Bangalore")
+        wait_for_element_to_be_visible(city_option, replace_value="Bangalore")
+        click(city_option, "Bangalore")
+
+    action_benchmark(
+        "autocomplete_select",
+        select_city,
+        setup=lambda: load_url(f"{fixture_server}/yatra.html"),
+    )
+
+
+def test_sidebar_scroll_benchmark(driver, fixture_server, action_benchmark):
+    load_url(f"{fixture_server}/yatra.html")
+    target = (sidebar_option[0], sidebar_option[1].format(180))
+    action_benchmark(
+        "scroll_element_into_view_in_side_bar",
+        lambda: scroll_element_into_view_in_side_bar(driver, sidebar, target),
+    )
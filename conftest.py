@@ -1,4 +1,5 @@
 import logging
+import os
 import pathlib
 import sys
 import time
@@ -6,12 +7,22 @@ import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 from configparser import ConfigParser
 
 # Ensure these imports point to your actual file
-from helpers.webdriver_actions import set_driver, clear_driver, load_url, get_driver
+from helpers.webdriver_actions import (
+    set_driver, reset_driver, load_url, get_driver, wait_timeout, get_wait_timeout,
+    wait_for_network_idle, reset_network_tracking,
+)
+from helpers.browser_pool import BrowserPool
+from helpers.driver_resolver import launch_with_driver_binary
+from helpers import command_metrics, traffic_metrics
+from helpers.ad_block_rules import BLOCKING_MODE
+from helpers.cdp_network import enable_request_blocking, supports_cdp
+from helpers.nuisance_suppression import install_nuisance_suppression
+from helpers.har_archive import has_archives
+from helpers.load_profiles import DEFAULT_PROFILE, apply_load_profile, resolve_profile
+from helpers.proxy_launcher import start_worker_proxy
 from pages.yatra_common_object import close_ads_iframe, close_yatra_login_popup
 from pages.yatra_flight_object import remove_webklipper_iframe
 
@@ -26,24 +37,45 @@ CONFIG.read('config.ini')
 BASE_URL = CONFIG.get('BASE_URL', 'Settings', fallback='https://www.yatra.com')
 # Get default reports path (screenshots path is handled by CLI option)
 REPORT_PATH_FALLBACK = './reports/'
+# Number of browsers kept ready per worker, overridable with --browser-pool-size
+BROWSER_POOL_SIZE = CONFIG.getint('Settings', 'browser_pool_size', fallback=1)
+# Browsers run without implicit wait; webdriver_actions gives every lookup an explicit deadline
+DEFAULT_IMPLICIT_WAIT = 0
+# "normal" waits for the load event on navigation, "eager" returns at DOMContentLoaded (pair with wait_for_network_idle)
+PAGE_LOAD_STRATEGY = CONFIG.get('Settings', 'page_load_strategy', fallback='normal')
+# The home page never goes fully quiet; waiting longer than this for it only slows every test down
+HOME_PAGE_IDLE_TIMEOUT = 5
 
 # --- Helper Functions for WebDriver Setup ---
 
-def _create_webdriver(browser: str, headless: bool) -> webdriver.Remote:
+def _create_webdriver(browser: str, headless: bool, proxy: str = None) -> webdriver.Remote:
     """
     Initializes and returns a configured WebDriver instance based on browser and headless options.
+    When proxy ("host:port") is given, all browser traffic is routed through it.
     """
     if browser == "firefox":
         logger.info("Setting up Firefox WebDriver...")
         options = FirefoxOptions()
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
         if headless:
             options.add_argument("--headless")
-        service = webdriver.firefox.service.Service(GeckoDriverManager().install())
-        driver_instance = webdriver.Firefox(service=service, options=options)
+        if proxy:
+            proxy_host, proxy_port = proxy.rsplit(":", 1)
+            options.set_preference("network.proxy.type", 1)
+            for scheme in ("http", "ssl"):
+                options.set_preference(f"network.proxy.{scheme}", proxy_host)
+                options.set_preference(f"network.proxy.{scheme}_port", int(proxy_port))
+            options.accept_insecure_certs = True
+        driver_instance = launch_with_driver_binary(
+            "firefox", lambda path: webdriver.Firefox(service=webdriver.firefox.service.Service(path), options=options)
+        )
 
     elif browser == "chrome":
         logger.info("Setting up Chrome WebDriver (default)...")
         options = ChromeOptions()
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        # CDP Network events in the performance log let wait_for_network_idle follow in-flight requests
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         # Use a common, current User-Agent string
         user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         options.add_argument(f"user-agent={user_agent}")
@@ -66,9 +98,15 @@ def _create_webdriver(browser: str, headless: bool) -> webdriver.Remote:
         # General best practices arguments
         options.add_argument("--no-sandbox")
         options.add_argument("--window-size=1920,1080")
+        if proxy:
+            options.add_argument(f"--proxy-server={proxy}")
+            # The proxy re-signs HTTPS traffic with its own certificate
+            options.add_argument("--ignore-certificate-errors")
         
-        service = webdriver.chrome.service.Service(ChromeDriverManager().install())
-        driver_instance = webdriver.Chrome(service=service, options=options)
+        # A pinned chromedriver left behind by a Chrome auto-update is re-resolved and the launch retried
+        driver_instance = launch_with_driver_binary(
+            "chrome", lambda path: webdriver.Chrome(service=webdriver.chrome.service.Service(path), options=options)
+        )
         """Selenium sets a JavaScript property called navigator.webdriver to true. Many bot detection scripts check for this. I need to remove this property immediately after the browser launches."""
         driver_instance.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
@@ -80,12 +118,16 @@ def _create_webdriver(browser: str, headless: bool) -> webdriver.Remote:
             """
             }
         )
+        # Popups and notification iframes are hidden/closed by the page itself as they appear
+        install_nuisance_suppression(driver_instance)
+        if BLOCKING_MODE == "cdp":
+            enable_request_blocking(driver_instance)
     
     else:
         raise ValueError(f"Unsupported browser specified: {browser}. Must be 'chrome' or 'firefox'.")
 
     # Common driver settings
-    driver_instance.implicitly_wait(5)
+    driver_instance.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
     try:
         if not headless:
             driver_instance.maximize_window()
@@ -93,14 +135,26 @@ def _create_webdriver(browser: str, headless: bool) -> webdriver.Remote:
     except Exception as e:
         logger.warning(f"Could not maximize window (might be headless or remote): {e}")
 
+    # Time every WebDriver command for the per-test latency breakdown
+    command_metrics.instrument_driver(driver_instance)
     return driver_instance
 
+# Per-test WebDriver command summaries of this worker, written to JSON at session end
+COMMAND_METRICS_RESULTS = {}
+# Per-test and whole-worker blocked-traffic summaries of the worker's proxy, written to JSON at session end
+TRAFFIC_METRICS_RESULTS = {"tests": {}, "worker": None}
+
 # --- Pytest Hooks ---
 def pytest_addoption(parser):
     """Adds command-line options for browser, headless mode, and screenshot directory."""
     parser.addoption("--browser", action="store", default="chrome", help="browser: chrome or firefox")
     parser.addoption("--headless", action="store_true", default=False, help="run browsers in headless mode")
     parser.addoption("--screenshots-dir", action="store", default="screenshots", help="directory to save failure screenshots")
+    parser.addoption("--replay", action="store", default=None, help="directory of HAR archives to record into or replay from")
+    parser.addoption("--replay-mode", action="store", default="auto", choices=["auto", "record", "replay"],
+                     help="auto records when the replay directory has no archives yet, otherwise replays")
+    parser.addini("load_profile", default=DEFAULT_PROFILE, help="resource load profile of tests without a profile marker")
+    parser.addoption("--browser-pool-size", action="store", type=int, default=BROWSER_POOL_SIZE, help="number of pre-launched browsers kept ready per worker")
 
 
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
@@ -113,6 +167,26 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     extra = getattr(report, 'extra', [])
+    # Attach the WebDriver command latency breakdown of the test to the HTML report
+    metrics = getattr(item, 'command_metrics', None)
+    if report.when == 'call' and metrics is not None:
+        # Stop before teardown, so the JSON and HTML reports both leave out the pool reset commands
+        command_metrics.activate(None)
+        summary = metrics.summary()
+        if summary["count"]:
+            COMMAND_METRICS_RESULTS[item.nodeid] = summary
+        if summary["count"] and pytest_html is not None:
+            extra.append(pytest_html.extras.html(command_metrics.summary_to_html(summary)))
+            report.extra = extra
+    # Attach the traffic blocked/allowed by the worker's proxy during the test
+    proxy_address = getattr(item, 'traffic_proxy', None)
+    if report.when == 'call' and proxy_address:
+        snapshot = traffic_metrics.fetch_snapshot(proxy_address)
+        if snapshot is not None:
+            TRAFFIC_METRICS_RESULTS["tests"][item.nodeid] = snapshot["test"]
+            if pytest_html is not None:
+                extra.append(pytest_html.extras.html(traffic_metrics.summary_to_html(snapshot["test"])))
+                report.extra = extra
     # Check if the test failed during the 'call' phase (the actual test execution)
     if report.when == 'call' and report.failed:
         # Access the driver instance from the test function's arguments
@@ -154,34 +228,120 @@ def pytest_runtest_makereport(item, call):
             print(f"\nFailed to take screenshot: {e}")
 
 
+def pytest_sessionfinish(session):
+    """Writes the per-test WebDriver command and proxy traffic metrics of this worker as JSON."""
+    report_dir = pathlib.Path(REPORT_PATH_FALLBACK)
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    if COMMAND_METRICS_RESULTS:
+        report_dir.mkdir(parents=True, exist_ok=True)
+        command_metrics.write_json(report_dir / f"command_metrics_{worker_id}.json", COMMAND_METRICS_RESULTS)
+    if TRAFFIC_METRICS_RESULTS["tests"]:
+        report_dir.mkdir(parents=True, exist_ok=True)
+        traffic_metrics.write_json(report_dir / f"traffic_metrics_{worker_id}.json", TRAFFIC_METRICS_RESULTS)
+
+
 # --- Fixtures ---
 
 @pytest.fixture(scope="session")
-def driver(request):
+def worker_proxy(request):
     """
-    Creates and manages the WebDriver instance for the entire test session.
-    It registers the driver globally and handles screenshot saving on failure
-    and proper teardown.
+    Starts a dedicated proxy on a free port for the current worker, so every
+    xdist worker gets its own proxy instead of sharing a single mitmdump.
+    The proxy is started when [AdBlock] mode is "proxy" or with --replay=<dir>, where it
+    records all HTTP traffic into <dir>/<worker>.har or serves every response from the archives of <dir>.
+    Yields the proxy address, or None when no proxy is needed.
+    """
+    replay_dir = request.config.getoption("--replay")
+    if BLOCKING_MODE != "proxy" and not replay_dir:
+        yield None
+        return
+    options = {}
+    if replay_dir:
+        mode = request.config.getoption("--replay-mode")
+        if mode == "auto":
+            mode = "replay" if has_archives(replay_dir) else "record"
+        logger.info(f"Starting {mode} proxy for replay directory: {replay_dir}")
+        options = {
+            "replay_dir": replay_dir,
+            "replay_mode": mode,
+            "replay_name": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+        }
+    proxy = start_worker_proxy(options)
+
+    yield proxy.address
+
+    # Keep the worker-wide traffic totals before the proxy goes away
+    snapshot = traffic_metrics.fetch_snapshot(proxy.address)
+    if snapshot is not None:
+        TRAFFIC_METRICS_RESULTS["worker"] = snapshot["worker"]
+    proxy.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, worker_proxy):
+    """
+    Creates the pool of pre-launched browsers for the current worker.
+    Browsers are launched once per session and recycled between tests,
+    and all of them are quit on teardown.
     """
     # 1. Setup: Parse options and configure screenshot directory
     browser = request.config.getoption("--browser").lower()
     headless = request.config.getoption("--headless")
+    pool_size = request.config.getoption("--browser-pool-size")
     screenshots_dir = pathlib.Path(request.config.getoption("--screenshots-dir"))
     screenshots_dir.mkdir(parents=True, exist_ok=True)
-    
-    # 2. Driver Creation using helper function
-    driver_instance = _create_webdriver(browser, headless)
-    
-    # 3. Register Driver
-    set_driver(driver_instance)
-    logger.info("WebDriver instance registered with webdriver_actions.")
 
-    yield driver_instance # Provide the driver to the tests
+    # 2. Pool Creation: every browser is built by the same helper function
+    pool = BrowserPool(
+        lambda: _create_webdriver(browser, headless, proxy=worker_proxy),
+        size=pool_size,
+        implicit_wait=DEFAULT_IMPLICIT_WAIT,
+    )
+    pool.warm_up()
+    logger.info(f"Browser pool ready with {pool_size} {browser} browser(s).")
+
+    yield pool
+
+    # --- Teardown: Runs after all tests of the session are complete ---
+    logger.info("Starting browser pool teardown...")
+    pool.close()
+    logger.info("All pooled browsers quit.")
+
+
+@pytest.fixture(scope="function")
+def driver(request, browser_pool):
+    """
+    Leases a browser from the pool for a single test and registers it globally.
+    The resource load profile of the test (marker or load_profile ini option) is applied.
+    On teardown the browser is reset (tabs, cookies, storage, implicit wait)
+    and returned to the pool instead of being relaunched.
+    """
+    # 1. Lease a ready browser
+    driver_instance = browser_pool.lease()
+    load_profile = resolve_profile(request.node, request.config.getini("load_profile"))
+    profile_applied = load_profile != DEFAULT_PROFILE and apply_load_profile(driver_instance, load_profile)
+
+    # 2. Register Driver
+    driver_token = set_driver(driver_instance)
+    logger.info("Leased WebDriver instance registered with webdriver_actions.")
 
-    # --- Teardown: Runs after all tests using this session fixture are complete ---
-    logger.info("Starting WebDriver teardown...")
-    clear_driver()
-    logger.info("WebDriver instance cleared and browser quit.")
+    # Lookup deadline overrides made by the test do not leak into the next one
+    with wait_timeout(get_wait_timeout()):
+        yield driver_instance # Provide the driver to the test
+
+    # --- Teardown: Unregister the driver and hand it back to the pool ---
+    reset_driver(driver_token)
+    try:
+        reset_network_tracking(driver_instance)
+    except Exception as e:
+        logger.warning(f"Could not reset network tracking: {e}")
+    if profile_applied:
+        try:
+            apply_load_profile(driver_instance, DEFAULT_PROFILE)
+        except Exception as e:
+            logger.warning(f"Could not restore the default load profile: {e}")
+    browser_pool.release(driver_instance)
+    logger.info("WebDriver instance reset and released to the browser pool.")
 
 @pytest.fixture(scope="function")
 def load_base_url(driver):
@@ -190,11 +350,17 @@ def load_base_url(driver):
     """
     # The 'driver' fixture ensures the instance exists and is registered.
     logger.info(f"Loading base URL: {BASE_URL}")
-    time.sleep(2)
     load_url(BASE_URL)
-    remove_webklipper_iframe(driver)
-    close_yatra_login_popup()
-    close_ads_iframe()
+    try:
+        # Analytics beacons keep a couple of connections open on the home page
+        wait_for_network_idle(timeout=HOME_PAGE_IDLE_TIMEOUT, max_inflight=2)
+    except TimeoutError as e:
+        logger.warning(f"Continuing on a busy page: {e}")
+    if not supports_cdp(driver):
+        # No in-browser nuisance suppression: close popups through WebDriver
+        remove_webklipper_iframe(driver)
+        close_yatra_login_popup()
+        close_ads_iframe()
     logger.info(f"Current URL after loading base URL: {get_driver().current_url}")
 
 
@@ -208,6 +374,42 @@ def report_path():
     return str(path)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def record_command_metrics(request):
+    """
+    Records every WebDriver command issued during the test (setup included, teardown excluded)
+    and keeps the count, total latency and p50/p95 per command, helper and page function.
+    The call-phase report hook stops the recording and stores the summary.
+    Tests that do not use the driver (e.g. tests/unit) are not recorded.
+    """
+    if "driver" not in request.fixturenames:
+        yield None
+        return
+    metrics = command_metrics.CommandMetrics()
+    request.node.command_metrics = metrics
+    token = command_metrics.activate(metrics)
+
+    yield metrics
+
+    command_metrics.deactivate(token)
+    # Tests that failed in setup have no call phase
+    summary = metrics.summary()
+    if summary["count"]:
+        COMMAND_METRICS_RESULTS.setdefault(request.node.nodeid, summary)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def record_traffic_metrics(request, worker_proxy):
+    """
+    Starts a new per-test scope of the proxy traffic counters (requests blocked, bytes avoided,
+    top blocked hosts, TTFB of allowed requests); the call-phase report hook collects them.
+    """
+    if worker_proxy:
+        traffic_metrics.fetch_snapshot(worker_proxy, reset_test=True)
+        request.node.traffic_proxy = worker_proxy
+    yield
+
+
 @pytest.fixture(scope="function", autouse=True)
 def capture_test_level_logs(request):
     """
@@ -0,0 +1,130 @@
+import logging
+from configparser import ConfigParser
+
+try:
+    from helpers.url_matcher import UrlMatcher
+except ImportError:
+    # mitmdump -s puts only the script directory on sys.path
+    from url_matcher import UrlMatcher
+
+logger = logging.getLogger(__name__)
+
+CONFIG = ConfigParser()
+CONFIG.read('config.ini')
+
+# Where ads/trackers are blocked: "cdp" (inside Chrome), "proxy" (one mitmproxy addon per test worker) or "off"
+BLOCKING_MODE = CONFIG.get('AdBlock', 'mode', fallback='off').strip().lower()
+# Extra EasyList-style rule files shared by the proxy addon and the in-browser blocking
+RULE_FILES = [path.strip() for path in CONFIG.get('AdBlock', 'rules_files', fallback='').split(',') if path.strip()]
+
+# Common keywords found in URLs of dynamic ad providers
+AD_BLOCK_KEYWORDS = [
+    "adservice", 
+    "doubleclick", 
+    "googletagmanager",
+    "ads.", 
+    "pubads",
+    "adzerk",
+    "analytics",
+    "utm_campaign",
+    "utm_source",
+    "adclick",
+    "adtrack",
+    "adserver",
+    "adbanner",
+    "adnetwork",
+    "ad_impression",
+    "ad_pixel",
+    "ad_request",
+    "ad_display",
+    "ad_view",
+    "ad_interstitial",
+    "ad_overlay",
+    "ad_injection",
+    "ad_script",
+    "ad_tag",
+    "ad_content",
+    "ad_slot",
+    "ad_unit",
+    "ad_zone",
+    "ad_targeting",
+    "ad_performance",
+    "ad_revenue",
+    "ad_conversion",
+    "ad_click",
+    "ad_impressions",
+    "Offer",
+    "Promo",
+    "Banner",
+    "Affiliate",
+    "Sponsorship",
+    "Marketing",
+    "Advertisement",
+    "Monetization",
+    "Tracking",
+    "Retargeting",
+    "Behavioral",
+    "Contextual",
+    "NativeAd",
+    "VideoAd",
+    "InterstitialAd",
+    "Popunder",
+    "Skyscraper",
+    "Leaderboard",
+    "FooterAd",
+    "HeaderAd",
+    "SponsoredContent",
+    "BrandedContent",
+    "ContentRecommendation",
+    "AdExchange",
+    "RealTimeBidding",
+    "Programmatic",
+    "AdNetwork",
+    "AdTech",
+    "DSP",
+    "SSP",
+    "RTB",
+    "offer/details",
+    "promo/click",
+    "banner/view",
+    "affiliate/track",
+    "sponsorship/load",
+    "marketing/pixel",
+    "advertisement/fetch",
+    "monetization/script",
+    "tracking/collect",
+    "retargeting/show",
+    "behavioral/ad",
+    "contextual/ad",
+    "nativead/render",
+    "videoad/play",
+    "interstitialad/display",
+    "popunder/open",
+    "skyscraper/load",
+    "leaderboard/fetch",
+    "footerad/show",
+    "headerad/render",
+    "sponsoredcontent/load",
+    "brandedcontent/fetch",
+    "contentrecommendation/display",
+    "adexchange/request",
+    "realtimebidding/bid",
+    "programmatic/ad",
+    "adnetwork/fetch",
+    "adtech/serve",
+    "dsp/bid",
+    "ssp/offer",
+    "rtb/request"
+
+]
+
+
+def build_matcher(rule_files=()):
+    """
+    Compile the built-in keywords plus any EasyList-style rule files into one matcher.
+    Matching is case-insensitive.
+    """
+    matcher = UrlMatcher(keywords=AD_BLOCK_KEYWORDS)
+    for rule_file in rule_files:
+        matcher.load_rules(rule_file)
+    return matcher.compile()
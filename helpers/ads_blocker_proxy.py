@@ -1,119 +1,262 @@
-from mitmproxy import http
-
-# Common keywords found in URLs of dynamic ad providers
-AD_BLOCK_KEYWORDS = [
-    "adservice", 
-    "doubleclick", 
-    "googletagmanager",
-    "ads.", 
-    "pubads",
-    "adzerk",
-    "analytics",
-    "utm_campaign",
-    "utm_source",
-    "adclick",
-    "adtrack",
-    "adserver",
-    "adbanner",
-    "adnetwork",
-    "ad_impression",
-    "ad_pixel",
-    "ad_request",
-    "ad_display",
-    "ad_view",
-    "ad_interstitial",
-    "ad_overlay",
-    "ad_injection",
-    "ad_script",
-    "ad_tag",
-    "ad_content",
-    "ad_slot",
-    "ad_unit",
-    "ad_zone",
-    "ad_targeting",
-    "ad_performance",
-    "ad_revenue",
-    "ad_conversion",
-    "ad_click",
-    "ad_impressions"
-    "Offer",
-    "Promo",
-    "Banner",
-    "Affiliate",
-    "Sponsorship",
-    "Marketing",
-    "Advertisement",
-    "Monetization",
-    "Tracking",
-    "Retargeting",
-    "Behavioral",
-    "Contextual",
-    "NativeAd",
-    "VideoAd",
-    "InterstitialAd",
-    "Popunder",
-    "Skyscraper",
-    "Leaderboard",
-    "FooterAd",
-    "HeaderAd",
-    "SponsoredContent",
-    "BrandedContent",
-    "ContentRecommendation",
-    "AdExchange",
-    "RealTimeBidding",
-    "Programmatic",
-    "AdNetwork",
-    "AdTech",
-    "DSP",
-    "SSP",
-    "RTB",
-    "offer/details",
-    "promo/click",
-    "banner/view",
-    "affiliate/track",
-    "sponsorship/load",
-    "marketing/pixel",
-    "advertisement/fetch",
-    "monetization/script",
-    "tracking/collect",
-    "retargeting/show",
-    "behavioral/ad",
-    "contextual/ad",
-    "nativead/render",
-    "videoad/play",
-    "interstitialad/display",
-    "popunder/open",
-    "skyscraper/load",
-    "leaderboard/fetch",
-    "footerad/show",
-    "headerad/render",
-    "sponsoredcontent/load",
-    "brandedcontent/fetch",
-    "contentrecommendation/display",
-    "adexchange/request",
-    "realtimebidding/bid",
-    "programmatic/ad",
-    "adnetwork/fetch",
-    "adtech/serve",
-    "dsp/bid",
-    "ssp/offer",
-    "rtb/request"
-
-]
+import json
+import logging
+import os
+from mitmproxy import ctx, http
+
+try:
+    from helpers.ad_block_rules import RULE_FILES, build_matcher
+    from helpers.asset_cache import AssetCache, is_cacheable_url, is_cacheable_response
+    from helpers.har_archive import HarArchive
+    from helpers.traffic_metrics import METRICS_HOST, TrafficMetrics, resource_kind
+except ImportError:
+    # mitmdump -s puts only the script directory on sys.path
+    from ad_block_rules import RULE_FILES, build_matcher
+    from asset_cache import AssetCache, is_cacheable_url, is_cacheable_response
+    from har_archive import HarArchive
+    from traffic_metrics import METRICS_HOST, TrafficMetrics, resource_kind
+
+logger = logging.getLogger(__name__)
+
+
+def header_fields(headers):
+    """(name, value) string pairs as the bytes fields mitmproxy's Headers expect."""
+    return [(name.encode("utf-8", "surrogateescape"), value.encode("utf-8", "surrogateescape")) for name, value in headers]
+
 
 class AdBlocker:
+    def __init__(self, metrics=None):
+        self.matcher = build_matcher(RULE_FILES)
+        self.metrics = metrics
+
+    def load(self, loader):
+        loader.add_option(
+            name="adblock_rules",
+            typespec=str,
+            default="",
+            help="Comma-separated EasyList-style rule files to block in addition to the built-in keywords",
+        )
+
+    def configure(self, updates):
+        if "adblock_rules" in updates:
+            rule_files = [path.strip() for path in ctx.options.adblock_rules.split(",") if path.strip()]
+            self.matcher = build_matcher(RULE_FILES + rule_files)
+            logger.info(f"Ad blocker compiled {self.matcher.rule_count} rules.")
+
     def request(self, flow: http.HTTPFlow) -> None:
+        if flow.metadata.get("traffic_metrics"):
+            return
         url = flow.request.pretty_url
-        # Check if the URL contains any of the blocking keywords
-        if any(keyword in url for keyword in AD_BLOCK_KEYWORDS):
+        # Check the URL against the compiled keyword automaton and blocked domains
+        rule = self.matcher.match(url, flow.request.pretty_host)
+        if rule:
             # Block the request by responding with a 404 Not Found
             flow.response = http.Response.make(
                 404, 
                 b"Ad Request Blocked by Proxy", 
                 {"Content-Type": "text/plain"}
             )
-            print(f"🛑 Blocked Ad Request: {url}")
+            flow.metadata["blocked_by"] = rule
+            if self.metrics is not None:
+                self.metrics.record_blocked(
+                    flow.request.pretty_host, resource_kind(url, flow.request.headers.get("sec-fetch-dest", ""))
+                )
+
+
+class TrafficReporter:
+    """
+    Counts allowed responses (size, time to first byte) next to the requests blocked by
+    AdBlocker, and serves the counters on http://traffic-metrics.proxy/snapshot[?reset=1]
+    so the test session can collect them per test. http://traffic-metrics.proxy/instance
+    answers with the proxy_instance option, so a launcher can tell its own process apart.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def load(self, loader):
+        loader.add_option(
+            name="proxy_instance",
+            typespec=str,
+            default="",
+            help="Identifier of this proxy process, served on http://traffic-metrics.proxy/instance",
+        )
+
+    def request(self, flow: http.HTTPFlow) -> None:
+        if flow.request.pretty_host != METRICS_HOST:
+            return
+        flow.metadata["traffic_metrics"] = True
+        if flow.request.path == "/instance":
+            flow.response = http.Response.make(
+                200, ctx.options.proxy_instance.encode("utf-8"), {"Content-Type": "text/plain"}
+            )
+            return
+        reset = flow.request.query.get("reset") == "1"
+        flow.response = http.Response.make(
+            200, json.dumps(self.metrics.snapshot(reset_test=reset)).encode("utf-8"), {"Content-Type": "application/json"}
+        )
+
+    def response(self, flow: http.HTTPFlow) -> None:
+        metadata = flow.metadata
+        if metadata.get("traffic_metrics") or metadata.get("blocked_by"):
+            return
+        served_locally = metadata.get("asset_cache_hit") or metadata.get("replayed")
+        ttfb = None
+        if not served_locally and flow.response.timestamp_start and flow.request.timestamp_end:
+            ttfb = max(0.0, flow.response.timestamp_start - flow.request.timestamp_end)
+        self.metrics.record_allowed(
+            resource_kind(flow.request.pretty_url, flow.request.headers.get("sec-fetch-dest", "")),
+            len(flow.response.raw_content or b""),
+            ttfb,
+        )
+
+
+class StaticAssetCache:
+    """
+    Serves cacheable static assets (JS bundles, CSS, fonts, images) from a local
+    content-addressed cache, so repeated page loads across tests and workers
+    do not download them again.
+    """
+
+    def __init__(self):
+        self.cache = None
+
+    def load(self, loader):
+        loader.add_option(
+            name="asset_cache",
+            typespec=bool,
+            default=True,
+            help="Serve static assets from the local asset cache",
+        )
+        loader.add_option(
+            name="asset_cache_dir",
+            typespec=str,
+            default=".asset_cache",
+            help="Directory of the content-addressed static asset cache",
+        )
+        loader.add_option(
+            name="asset_cache_max_mb",
+            typespec=int,
+            default=500,
+            help="Size bound of the asset cache; least recently used assets are evicted beyond it",
+        )
+
+    def configure(self, updates):
+        if {"asset_cache", "asset_cache_dir", "asset_cache_max_mb"} & set(updates):
+            self.cache = (
+                AssetCache(ctx.options.asset_cache_dir, ctx.options.asset_cache_max_mb * 1024 * 1024)
+                if ctx.options.asset_cache
+                else None
+            )
+
+    def request(self, flow: http.HTTPFlow) -> None:
+        if self.cache is None or flow.response is not None or flow.request.method != "GET":
+            return
+        url = flow.request.pretty_url
+        if not is_cacheable_url(url):
+            return
+        cached = self.cache.get(url)
+        if cached is not None:
+            content, headers = cached
+            flow.response = http.Response.make(200, content, header_fields(headers))
+            flow.metadata["asset_cache_hit"] = True
+
+    def response(self, flow: http.HTTPFlow) -> None:
+        if self.cache is None or flow.metadata.get("asset_cache_hit") or flow.request.method != "GET":
+            return
+        url = flow.request.pretty_url
+        if is_cacheable_response(url, flow.response.status_code, flow.response.headers):
+            content = flow.response.get_content(strict=False)
+            if content:
+                self.cache.put(url, content, flow.response.headers.items(multi=True))
+
+    def done(self):
+        if self.cache is None:
+            return
+        self.cache.save_index()
+        logger.info(
+            f"Asset cache stats: {self.cache.stats}, hit ratio {self.cache.hit_ratio():.0%}, "
+            f"{self.cache.total_bytes} bytes cached"
+        )
+
+
+class HarReplay:
+    """
+    Records all HTTP traffic into a HAR archive, or serves every request from
+    previously recorded archives for deterministic, network-free runs.
+    """
+
+    def __init__(self):
+        self.archive = None
+        self.mode = "off"
+
+    def load(self, loader):
+        loader.add_option(
+            name="replay_dir",
+            typespec=str,
+            default="",
+            help="Directory holding the *.har archives to record into or replay from",
+        )
+        loader.add_option(
+            name="replay_mode",
+            typespec=str,
+            default="off",
+            help="off | record | replay",
+        )
+        loader.add_option(
+            name="replay_name",
+            typespec=str,
+            default="archive",
+            help="File name (without .har) of the archive written in record mode",
+        )
+
+    def configure(self, updates):
+        if {"replay_dir", "replay_mode"} & set(updates):
+            self.mode = ctx.options.replay_mode if ctx.options.replay_dir else "off"
+            if self.mode == "replay":
+                self.archive = HarArchive.load_dir(ctx.options.replay_dir)
+            elif self.mode == "record":
+                self.archive = HarArchive()
+            else:
+                self.archive = None
+
+    def request(self, flow: http.HTTPFlow) -> None:
+        if self.mode != "replay" or flow.response is not None:
+            return
+        recorded = self.archive.lookup(flow.request.method, flow.request.pretty_url)
+        if recorded is None:
+            # Never fall through to the network while replaying
+            flow.response = http.Response.make(
+                404, b"Not found in replay archive", {"Content-Type": "text/plain"}
+            )
+            return
+        status, headers, content = recorded
+        flow.response = http.Response.make(status, content, header_fields(headers))
+        flow.metadata["replayed"] = True
+
+    def response(self, flow: http.HTTPFlow) -> None:
+        if self.mode != "record" or flow.metadata.get("traffic_metrics"):
+            return
+        self.archive.record(
+            flow.request.method,
+            flow.request.pretty_url,
+            flow.response.status_code,
+            list(flow.response.headers.items(multi=True)),
+            flow.response.get_content(strict=False) or b"",
+            list(flow.request.headers.items(multi=True)),
+        )
+
+    def done(self):
+        if self.mode == "record":
+            self.archive.save(os.path.join(ctx.options.replay_dir, f"{ctx.options.replay_name}.har"))
+        elif self.mode == "replay":
+            logger.info(f"Replay stats: {self.archive.stats}")
+
+
+traffic_metrics = TrafficMetrics()
 
 addons = [
-    AdBlocker()
+    TrafficReporter(traffic_metrics),
+    HarReplay(),
+    AdBlocker(traffic_metrics),
+    StaticAssetCache(),
 ]
\ No newline at end of file
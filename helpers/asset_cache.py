@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Extensions of static assets that are safe to replay from disk
+CACHEABLE_EXTENSIONS = (
+    ".js", ".mjs", ".css", ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".avif", ".ico",
+)
+CACHEABLE_CONTENT_TYPES = (
+    "text/css", "javascript", "font/", "image/", "application/font",
+)
+# Response headers not replayed with a cached body: the body is stored decoded, hop-by-hop
+# headers belong to the original connection and cookies must not be set again
+SKIPPED_RESPONSE_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive", "set-cookie",
+}
+
+
+def is_cacheable_url(url):
+    path = urlsplit(url).path.lower()
+    return path.endswith(CACHEABLE_EXTENSIONS)
+
+
+def is_cacheable_response(url, status_code, headers):
+    """
+    True for successful static-asset responses that do not forbid caching.
+
+    Args:
+        url (str): Request URL.
+        status_code (int): Response status.
+        headers (Mapping): Response headers (case-insensitive mapping).
+    """
+    if status_code != 200:
+        return False
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return is_cacheable_url(url) or any(kind in content_type for kind in CACHEABLE_CONTENT_TYPES)
+
+
+class AssetCache:
+    """
+    Content-addressed on-disk cache of static assets with size-bounded LRU eviction.
+
+    Bodies are stored once per SHA-256 digest under <cache_dir>/objects, the URL index
+    (url -> digest, response headers, size) lives in <cache_dir>/index.json. The headers
+    (Access-Control-Allow-Origin, Cache-Control, Vary, ...) are replayed with the body,
+    so cross-origin fonts and scripts still pass CORS when served from the cache.
+    """
+
+    def __init__(self, cache_dir=".asset_cache", max_bytes=500 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._objects_dir = os.path.join(cache_dir, "objects")
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._index = OrderedDict()
+        self._refs = {}
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "bytes_served": 0}
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring unreadable asset cache index: {self._index_path}")
+            return
+        for url, entry in entries.items():
+            if "headers" not in entry:
+                # Index written before headers were stored
+                entry["headers"] = [["Content-Type", entry.pop("content_type", "")]]
+            if os.path.exists(self._object_path(entry["digest"])):
+                self._add_entry(url, entry)
+
+    def save_index(self):
+        tmp_path = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _object_path(self, digest):
+        return os.path.join(self._objects_dir, digest[:2], digest)
+
+    def _add_entry(self, url, entry):
+        self._index[url] = entry
+        if self._refs.get(entry["digest"], 0) == 0:
+            self.total_bytes += entry["size"]
+        self._refs[entry["digest"]] = self._refs.get(entry["digest"], 0) + 1
+
+    def _remove_entry(self, url):
+        entry = self._index.pop(url)
+        digest = entry["digest"]
+        self._refs[digest] -= 1
+        if self._refs[digest] == 0:
+            del self._refs[digest]
+            self.total_bytes -= entry["size"]
+            try:
+                os.remove(self._object_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def get(self, url):
+        """
+        Returns (content, headers) for a cached URL, headers as a list of (name, value), or None on a miss.
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        try:
+            with open(self._object_path(entry["digest"]), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            self._remove_entry(url)
+            self.stats["misses"] += 1
+            return None
+        self._index.move_to_end(url)
+        self.stats["hits"] += 1
+        self.stats["bytes_served"] += len(content)
+        return content, [tuple(header) for header in entry["headers"]]
+
+    def put(self, url, content, headers=()):
+        """
+        Store an asset body with its response headers and evict least recently used assets beyond max_bytes.
+
+        Args:
+            url (str): Request URL.
+            content (bytes): Decoded response body.
+            headers (iterable, optional): (name, value) pairs of the response; encoding, hop-by-hop
+                and cookie headers are dropped.
+        """
+        if len(content) > self.max_bytes:
+            return
+        digest = hashlib.sha256(content).hexdigest()
+        headers = [[name, value] for name, value in headers if name.lower() not in SKIPPED_RESPONSE_HEADERS]
+        if url in self._index:
+            if self._index[url]["digest"] == digest:
+                self._index[url]["headers"] = headers
+                self._index.move_to_end(url)
+                return
+            self._remove_entry(url)
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        self._add_entry(url, {"digest": digest, "headers": headers, "size": len(content)})
+        self.stats["stores"] += 1
+        while self.total_bytes > self.max_bytes and self._index:
+            oldest_url = next(iter(self._index))
+            self._remove_entry(oldest_url)
+            self.stats["evictions"] += 1
+
+    def hit_ratio(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
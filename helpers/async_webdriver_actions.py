@@ -0,0 +1,143 @@
+"""
+Asyncio counterpart of helpers/webdriver_actions.py.
+
+Every coroutine runs the matching blocking helper in a worker thread with the
+caller's context copied (asyncio.to_thread), so each asyncio task drives the
+browser bound to it through set_driver()/use_driver() while the event loop keeps
+serving the other sessions. Helpers that change the caller's context (driver
+binding, lookup deadline) run in the calling task instead.
+
+Example:
+    async def one_way_flow(driver):
+        with use_driver(driver):
+            await load_url(BASE_URL)
+            await click(search_flights_button)
+
+    await run_flows(drivers, one_way_flow)
+"""
+import asyncio
+import functools
+import logging
+
+from helpers import webdriver_actions
+from helpers.webdriver_actions import set_driver, reset_driver, get_driver, use_driver, wait_timeout, get_wait_timeout
+
+logger = logging.getLogger(__name__)
+
+
+def _to_async(func):
+    """Wrap a blocking webdriver_actions helper into a coroutine function."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+async def gather(*aws, return_exceptions=False):
+    """Run several actions or flows concurrently, e.g. one per browser or tab flow."""
+    return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+
+async def run_flows(drivers, flow, *args, return_exceptions=False, **kwargs):
+    """
+    Run the same async flow once per driver, concurrently.
+
+    Each flow runs in its own task with its driver bound, so the flow can call the
+    actions of this module without passing the driver around.
+
+    Args:
+        drivers (list): WebDriver instances to drive.
+        flow (coroutine function): Called as flow(driver, *args, **kwargs).
+        return_exceptions (bool, optional): Collect exceptions instead of failing fast. Defaults to False.
+
+    Returns:
+        list: Result of each flow in the order of drivers.
+    """
+
+    async def _run(driver):
+        with use_driver(driver):
+            return await flow(driver, *args, **kwargs)
+
+    return await asyncio.gather(*(_run(d) for d in drivers), return_exceptions=return_exceptions)
+
+
+async def clear_driver():
+    """Quit the driver bound to the current task (in a worker thread) and unbind it from the task."""
+    try:
+        driver = get_driver()
+    except RuntimeError:
+        return
+    await asyncio.to_thread(webdriver_actions.run_with_driver, driver, webdriver_actions.clear_driver)
+    set_driver(None)
+
+
+async def implicit_wait(seconds):
+    """Set the default lookup deadline of the current task; prefer `with wait_timeout(...)`."""
+    webdriver_actions.implicit_wait(seconds)
+
+
+async def iter_elements_text(locator, replace_value=None, chunk_size=500, normalize=False, text_property="innerText", timeout=None):
+    """
+    Async generator over the text chunks of webdriver_actions.iter_elements_text(),
+    each chunk fetched in a worker thread.
+    """
+    chunks = webdriver_actions.iter_elements_text(
+        locator, replace_value=replace_value, chunk_size=chunk_size, normalize=normalize,
+        text_property=text_property, timeout=timeout,
+    )
+    done = object()
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, done)
+        if chunk is done:
+            return
+        yield chunk
+
+
+find_element = _to_async(webdriver_actions.find_element)
+find_elements = _to_async(webdriver_actions.find_elements)
+click = _to_async(webdriver_actions.click)
+wait_for_element_to_be_visible = _to_async(webdriver_actions.wait_for_element_to_be_visible)
+select_element_from_dropdown = _to_async(webdriver_actions.select_element_from_dropdown)
+explicit_wait = _to_async(webdriver_actions.explicit_wait)
+wait_for_spinner_off = _to_async(webdriver_actions.wait_for_spinner_off)
+type_value = _to_async(webdriver_actions.type_value)
+is_element_present = _to_async(webdriver_actions.is_element_present)
+is_element_not_present = _to_async(webdriver_actions.is_element_not_present)
+get_element_text = _to_async(webdriver_actions.get_element_text)
+get_elements_text = _to_async(webdriver_actions.get_elements_text)
+mouse_over_click = _to_async(webdriver_actions.mouse_over_click)
+move_to_element = _to_async(webdriver_actions.move_to_element)
+move_to_element_and_click = _to_async(webdriver_actions.move_to_element_and_click)
+scroll_to_bottom = _to_async(webdriver_actions.scroll_to_bottom)
+scroll_to_top = _to_async(webdriver_actions.scroll_to_top)
+scroll_element_into_view = _to_async(webdriver_actions.scroll_element_into_view)
+refresh_page = _to_async(webdriver_actions.refresh_page)
+navigate_back = _to_async(webdriver_actions.navigate_back)
+navigate_forward = _to_async(webdriver_actions.navigate_forward)
+get_current_url = _to_async(webdriver_actions.get_current_url)
+get_page_title = _to_async(webdriver_actions.get_page_title)
+click_via_javascript = _to_async(webdriver_actions.click_via_javascript)
+set_element_attribute = _to_async(webdriver_actions.set_element_attribute)
+get_element_attribute = _to_async(webdriver_actions.get_element_attribute)
+iframe_switch = _to_async(webdriver_actions.iframe_switch)
+iframe_switch_back = _to_async(webdriver_actions.iframe_switch_back)
+accept_alert = _to_async(webdriver_actions.accept_alert)
+dismiss_alert = _to_async(webdriver_actions.dismiss_alert)
+get_alert_text = _to_async(webdriver_actions.get_alert_text)
+send_keys_to_alert = _to_async(webdriver_actions.send_keys_to_alert)
+take_screenshot = _to_async(webdriver_actions.take_screenshot)
+load_url = _to_async(webdriver_actions.load_url)
+clear_cookies = _to_async(webdriver_actions.clear_cookies)
+is_element_displayed = _to_async(webdriver_actions.is_element_displayed)
+double_click_on_element = _to_async(webdriver_actions.double_click_on_element)
+switch_to_new_tab = _to_async(webdriver_actions.switch_to_new_tab)
+switch_to_original_tab = _to_async(webdriver_actions.switch_to_original_tab)
+wait_until_page_ready = _to_async(webdriver_actions.wait_until_page_ready)
+scroll_to_center = _to_async(webdriver_actions.scroll_to_center)
+get_elements_count = _to_async(webdriver_actions.get_elements_count)
+query_elements = _to_async(webdriver_actions.query_elements)
+wait_for_network_idle = _to_async(webdriver_actions.wait_for_network_idle)
+wait_for_dom_settled = _to_async(webdriver_actions.wait_for_dom_settled)
+reset_network_tracking = _to_async(webdriver_actions.reset_network_tracking)
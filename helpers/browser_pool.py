@@ -0,0 +1,194 @@
+import logging
+import queue
+import threading
+
+from helpers.cdp_network import supports_cdp
+
+logger = logging.getLogger(__name__)
+
+# Script used to wipe per-origin storage of the page that is currently loaded.
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Origins the current page talked to: its own, its frames' and those of every loaded resource.
+PAGE_ORIGINS_SCRIPT = """
+var origins = {};
+function add(url) {
+    try { var origin = new URL(url, location.href).origin; if (origin !== 'null') { origins[origin] = 1; } } catch (e) {}
+}
+add(location.href);
+Array.prototype.forEach.call(document.querySelectorAll('iframe[src]'), function (frame) { add(frame.src); });
+performance.getEntriesByType('resource').forEach(function (entry) { add(entry.name); });
+return Object.keys(origins);
+"""
+
+
+class BrowserPool:
+    """
+    Keeps a fixed number of launched browsers ready for leasing.
+
+    Browsers are created once through the supplied factory and recycled between
+    tests: on release they are reset (extra tabs closed, cookies and storage
+    cleared, implicit wait restored) instead of being quit and relaunched.
+    A browser that crashed or cannot be reset is quit and replaced lazily.
+    """
+
+    def __init__(self, factory, size=1, implicit_wait=0, blank_url="about:blank"):
+        """
+        :param factory: Zero-argument callable returning a new WebDriver instance
+        :param size: Number of browsers kept ready in the pool
+        :param implicit_wait: Implicit wait (seconds) restored on every release
+        :param blank_url: URL loaded after reset so the next lease starts clean
+        """
+        if size < 1:
+            raise ValueError(f"Browser pool size must be at least 1, got: {size}")
+        self._factory = factory
+        self._size = size
+        self._implicit_wait = implicit_wait
+        self._blank_url = blank_url
+        self._idle = queue.LifoQueue()
+        self._leased = set()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def size(self):
+        return self._size
+
+    def warm_up(self):
+        """Launch browsers until the pool holds its configured size."""
+        while True:
+            with self._lock:
+                if self._created >= self._size:
+                    return
+                self._created += 1
+            try:
+                driver = self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._idle.put(driver)
+            logger.info(f"Browser pool warmed up {self._created}/{self._size} browsers.")
+
+    def lease(self, timeout=None):
+        """
+        Take a healthy browser out of the pool, launching one if none is ready.
+
+        :param timeout: Seconds to wait for a browser when all are leased (None waits forever)
+        :return: WebDriver instance
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed.")
+        while True:
+            driver = self._take(timeout)
+            if self._is_alive(driver):
+                with self._lock:
+                    self._leased.add(driver)
+                return driver
+            logger.warning("Discarding a dead browser from the pool.")
+            self._discard(driver)
+
+    def release(self, driver):
+        """
+        Reset a leased browser and return it to the pool.
+        Browsers that cannot be reset are quit and replaced on the next lease.
+        """
+        with self._lock:
+            self._leased.discard(driver)
+        if self._closed:
+            self._quit(driver)
+            return
+        try:
+            self.reset(driver)
+        except Exception as e:
+            logger.warning(f"Browser reset failed, recycling the browser: {e}")
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """Bring a browser back to a clean state without relaunching it."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        if supports_cdp(driver):
+            self._clear_browser_data(driver)
+        else:
+            # Other browsers: WebDriver only reaches the cookies of the current document's origin
+            driver.delete_all_cookies()
+        driver.implicitly_wait(self._implicit_wait)
+        driver.get(self._blank_url)
+
+    @staticmethod
+    def _clear_browser_data(driver):
+        """
+        Chromium: drop the cookies of every origin and the storage (local/session storage,
+        IndexedDB, cache storage, service workers) of every origin the current page used.
+        """
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in driver.execute_script(PAGE_ORIGINS_SCRIPT) or []:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+    def close(self):
+        """Quit every browser owned by the pool."""
+        self._closed = True
+        with self._lock:
+            leased = list(self._leased)
+            self._leased.clear()
+        for driver in leased:
+            self._quit(driver)
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        logger.info("Browser pool closed.")
+
+    def _take(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_launch = self._created < self._size
+            if can_launch:
+                self._created += 1
+        if can_launch:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser became available in the pool within {timeout} seconds.")
+
+    def _discard(self, driver):
+        self._quit(driver)
+        with self._lock:
+            self._created -= 1
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error quitting pooled driver: {e}")
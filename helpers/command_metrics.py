@@ -0,0 +1,169 @@
+import contextvars
+import json
+import logging
+import math
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Modules whose functions are reported as "helper" / "page function" of a WebDriver command
+HELPER_MODULE_PREFIX = "helpers."
+PAGE_MODULE_PREFIX = "pages."
+UNATTRIBUTED = "-"
+
+# Metrics of the current thread / asyncio task, like the driver binding of webdriver_actions:
+# commands issued from a thread started without the context are not recorded.
+_active_metrics = contextvars.ContextVar("active_metrics", default=None)
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _stats(durations):
+    durations = sorted(durations)
+    return {
+        "count": len(durations),
+        "total_ms": round(sum(durations) * 1000, 2),
+        "p50_ms": round(_percentile(durations, 50) * 1000, 2),
+        "p95_ms": round(_percentile(durations, 95) * 1000, 2),
+    }
+
+
+def _attribute_caller():
+    """
+    Walk the call stack of a WebDriver command and return (helper, page_function).
+
+    The helper is the outermost function of a helpers.* module (e.g. click rather than
+    find_element), the page function is the closest function of a pages.* module.
+    """
+    helper = UNATTRIBUTED
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(PAGE_MODULE_PREFIX):
+            return helper, f"{module[len(PAGE_MODULE_PREFIX):]}.{frame.f_code.co_name}"
+        if module.startswith(HELPER_MODULE_PREFIX) and module != __name__:
+            helper = frame.f_code.co_name
+        frame = frame.f_back
+    return helper, UNATTRIBUTED
+
+
+class CommandMetrics:
+    """
+    Collects the latency of every WebDriver command sent while it is active.
+
+    Commands are attributed to the action helper and the page-object function
+    that issued them, so a slow test can be broken down by where its time went.
+    """
+
+    def __init__(self):
+        self._samples = []
+        self._lock = threading.Lock()
+
+    def record(self, command, duration, helper=UNATTRIBUTED, page_function=UNATTRIBUTED):
+        with self._lock:
+            self._samples.append((command, helper, page_function, duration))
+
+    def reset(self):
+        with self._lock:
+            self._samples = []
+
+    def summary(self):
+        """
+        Aggregate the recorded commands.
+
+        Returns:
+            dict: Totals plus count/total_ms/p50_ms/p95_ms grouped by command, helper and page function.
+        """
+        with self._lock:
+            samples = list(self._samples)
+        groups = {"by_command": {}, "by_helper": {}, "by_page_function": {}}
+        for command, helper, page_function, duration in samples:
+            groups["by_command"].setdefault(command, []).append(duration)
+            groups["by_helper"].setdefault(helper, []).append(duration)
+            groups["by_page_function"].setdefault(page_function, []).append(duration)
+        result = _stats([sample[3] for sample in samples])
+        for name, group in groups.items():
+            result[name] = dict(
+                sorted(
+                    ((key, _stats(durations)) for key, durations in group.items()),
+                    key=lambda item: item[1]["total_ms"],
+                    reverse=True,
+                )
+            )
+        return result
+
+
+def activate(metrics):
+    """
+    Route the commands the current context sends through instrumented drivers to the
+    given CommandMetrics (None to stop recording).
+
+    Returns:
+        contextvars.Token: Token that can be passed to deactivate() to restore the previous metrics.
+    """
+    return _active_metrics.set(metrics)
+
+
+def deactivate(token):
+    """Restore the metrics that were active before the matching activate() call."""
+    _active_metrics.reset(token)
+
+
+def get_active_metrics():
+    return _active_metrics.get()
+
+
+def instrument_driver(driver):
+    """
+    Wrap the driver's command execution so every WebDriver command is timed.
+
+    WebElement commands go through the same driver.execute(), so they are captured too.
+    """
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        metrics = _active_metrics.get()
+        if metrics is None:
+            return execute(driver_command, params)
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            duration = time.perf_counter() - start
+            helper, page_function = _attribute_caller()
+            metrics.record(driver_command, duration, helper, page_function)
+
+    driver.execute = timed_execute
+    return driver
+
+
+def summary_to_html(summary, limit=10):
+    """Render a compact HTML table of the slowest helpers and page functions for the report."""
+    rows = []
+    for group, title in (("by_page_function", "Page function"), ("by_helper", "Helper"), ("by_command", "Command")):
+        for name, stats in list(summary[group].items())[:limit]:
+            rows.append(
+                f"<tr><td>{title}</td><td>{name}</td><td>{stats['count']}</td>"
+                f"<td>{stats['total_ms']}</td><td>{stats['p50_ms']}</td><td>{stats['p95_ms']}</td></tr>"
+            )
+    return (
+        f"<p>WebDriver commands: {summary['count']}, total {summary['total_ms']} ms</p>"
+        "<table><tr><th>Group</th><th>Name</th><th>Count</th><th>Total ms</th><th>p50 ms</th><th>p95 ms</th></tr>"
+        + "".join(rows)
+        + "</table>"
+    )
+
+
+def write_json(path, results):
+    """Write the per-test summaries of a run as machine-readable JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    logger.info(f"WebDriver command metrics written to {path}")
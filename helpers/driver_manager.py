@@ -1,14 +1,13 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.firefox import GeckoDriverManager
 from configparser import ConfigParser
-
-# --- Proxy Configuration ---
-PROXY_ADDRESS = "localhost:8080"
+from helpers.driver_resolver import launch_with_driver_binary
+from helpers.ad_block_rules import BLOCKING_MODE
+from helpers.cdp_network import enable_request_blocking
+from helpers.proxy_launcher import get_proxy_address
 
 class DriverManager:
     def __init__(self):
@@ -23,26 +22,33 @@ class DriverManager:
         :param browser_type: Type of browser ("chrome" or "firefox")
         :return: WebDriver instance
         """
+        page_load_strategy = self._config.get('Settings', 'page_load_strategy', fallback='normal')
         if browser_type.lower() == "chrome":
             options = ChromeOptions()
+            options.page_load_strategy = page_load_strategy
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
             if self._headless:
                 options.add_argument('--headless')
                 options.add_argument('--disable-gpu')
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
                 options.add_argument('--window-size=1920,1080')
-                options.add_argument(f'--proxy-server={PROXY_ADDRESS}')
-            self._driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=options
+                if BLOCKING_MODE != "cdp":
+                    # The worker's own proxy when one was started, else a shared mitmdump on localhost:8080
+                    options.add_argument(f'--proxy-server={get_proxy_address()}')
+            self._driver = launch_with_driver_binary(
+                "chrome", lambda path: webdriver.Chrome(service=Service(path), options=options)
             )
+            if BLOCKING_MODE == "cdp":
+                # Rules are enforced by Chrome itself, no proxy process needed
+                enable_request_blocking(self._driver)
         elif browser_type.lower() == "firefox":
             options = FirefoxOptions()
+            options.page_load_strategy = page_load_strategy
             if self._headless:
                 options.add_argument('--headless')
-            self._driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options
+            self._driver = launch_with_driver_binary(
+                "firefox", lambda path: webdriver.Firefox(service=FirefoxService(path), options=options)
             )
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
@@ -0,0 +1,303 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import time
+from configparser import ConfigParser
+
+logger = logging.getLogger(__name__)
+
+CONFIG = ConfigParser()
+CONFIG.read('config.ini')
+
+# Pinned driver versions, e.g. {"chrome": "120.0.6099.109", "firefox": "0.34.0"}
+LOCK_FILE = CONFIG.get('Drivers', 'lock_file', fallback='drivers.lock.json')
+# Local cache holding one resolved binary per browser and version
+CACHE_DIR = CONFIG.get('Drivers', 'cache_dir', fallback='.drivers')
+# When enabled the resolver never touches the network
+OFFLINE = CONFIG.getboolean('Drivers', 'offline', fallback=False)
+
+DRIVER_BINARIES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+}
+
+# Browser executables whose `--version` tells which driver major version is needed
+BROWSER_BINARIES = {
+    "chrome": (
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ),
+}
+
+_resolved = {}
+# Binaries that failed to start a session in this process, never handed out again
+_rejected = set()
+
+
+class FileLock:
+    """
+    Minimal cross-process lock based on atomic creation of a lock file.
+    Used so that concurrent xdist workers resolve a driver binary only once.
+    """
+
+    def __init__(self, path, timeout=120, poll_frequency=0.2, stale_after=300):
+        self.path = path
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.stale_after = stale_after
+        self._fd = None
+
+    def acquire(self):
+        end_time = time.time() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.time() > end_time:
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout} seconds.")
+                time.sleep(self.poll_frequency)
+
+    def release(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                logger.warning(f"Removing stale lock file: {self.path}")
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def _read_lock_file():
+    if os.path.exists(LOCK_FILE):
+        try:
+            with open(LOCK_FILE, "r") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring unreadable driver lock file: {LOCK_FILE}")
+    return {}
+
+
+def _write_lock_file(pins):
+    tmp_path = f"{LOCK_FILE}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(pins, f, indent=4)
+    os.replace(tmp_path, LOCK_FILE)
+
+
+def get_binary_version(binary_path):
+    """Returns the version reported by `<driver> --version`, or None if it cannot be read."""
+    try:
+        output = subprocess.run(
+            [binary_path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"\d+(\.\d+)+", output)
+    return match.group(0) if match else None
+
+
+def get_browser_major_version(browser):
+    """
+    Returns the major version of the installed browser (e.g. "120"), or None when it cannot
+    be determined. Only Chrome is checked: chromedriver must match the browser's major version.
+    """
+    for candidate in BROWSER_BINARIES.get(browser, ()):
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            version = get_binary_version(path)
+            if version:
+                return version.split(".")[0]
+    return None
+
+
+def _version_matches(version, pinned_version):
+    return version is not None and (version == pinned_version or version.startswith(f"{pinned_version}."))
+
+
+def _matches_browser(version, browser_major):
+    # Unknown versions are given the benefit of the doubt; a failing session re-resolves them
+    return browser_major is None or version is None or version == "unknown" or version.split(".")[0] == browser_major
+
+
+def _find_on_path(binary_name, pinned_version, browser_major):
+    path = shutil.which(binary_name)
+    if not path or os.path.abspath(path) in _rejected:
+        return None
+    version = get_binary_version(path)
+    if pinned_version and not _version_matches(version, pinned_version):
+        logger.info(f"{binary_name} on PATH does not match pinned version {pinned_version}, ignoring it.")
+        return None
+    if not _matches_browser(version, browser_major):
+        logger.info(f"{binary_name} on PATH does not match the installed browser (major {browser_major}), ignoring it.")
+        return None
+    return path
+
+
+def _usable_pin(browser, pinned_version, browser_major):
+    """The pinned version, or None when the browser has moved on to another major version."""
+    if pinned_version == "unknown":
+        # Written by older versions of this module; webdriver-manager cannot install it
+        return None
+    if pinned_version and not _matches_browser(pinned_version, browser_major):
+        logger.warning(
+            f"Pinned {DRIVER_BINARIES[browser]} {pinned_version} does not match the installed browser "
+            f"(major {browser_major}), re-resolving it."
+        )
+        return None
+    if pinned_version and os.path.abspath(_cached_binary(browser, pinned_version)) in _rejected:
+        return None
+    return pinned_version
+
+
+def _cached_binary(browser, version):
+    binary_name = DRIVER_BINARIES[browser] + (".exe" if os.name == "nt" else "")
+    return os.path.join(CACHE_DIR, browser, version, binary_name)
+
+
+def _download(browser, pinned_version):
+    """Installs the driver through webdriver-manager, honouring the pinned version."""
+    if browser == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        manager = ChromeDriverManager(driver_version=pinned_version) if pinned_version else ChromeDriverManager()
+    else:
+        from webdriver_manager.firefox import GeckoDriverManager
+        manager = GeckoDriverManager(version=pinned_version) if pinned_version else GeckoDriverManager()
+    return manager.install()
+
+
+def resolve_driver_binary(browser):
+    """
+    Resolves the driver binary for the given browser, going to the network only as a last resort.
+
+    Resolution order:
+        1. Binary already resolved in this process.
+        2. Binary on PATH (matching the pinned version, if any) - no network access.
+        3. Binary in the local cache for the pinned version.
+        4. Download through webdriver-manager under a file lock, then cache and pin it.
+
+    A pin (or a binary on PATH) whose major version no longer matches the installed Chrome,
+    e.g. after a browser auto-update, is skipped and the driver is resolved again.
+
+    Args:
+        browser (str): "chrome" or "firefox".
+
+    Returns:
+        str: Absolute path of the driver binary.
+
+    Raises:
+        ValueError: If the browser is not supported.
+        RuntimeError: If no binary is available locally while running offline.
+    """
+    browser = browser.lower()
+    if browser not in DRIVER_BINARIES:
+        raise ValueError(f"Unsupported browser specified: {browser}. Must be 'chrome' or 'firefox'.")
+    if browser in _resolved:
+        return _resolved[browser]
+
+    binary_name = DRIVER_BINARIES[browser]
+    browser_major = get_browser_major_version(browser)
+    pinned_version = _usable_pin(browser, _read_lock_file().get(browser), browser_major)
+
+    path = _find_on_path(binary_name, pinned_version, browser_major)
+    if path:
+        logger.info(f"Using {binary_name} found on PATH: {path}")
+        _resolved[browser] = path
+        return path
+
+    if pinned_version and os.path.exists(_cached_binary(browser, pinned_version)):
+        path = _cached_binary(browser, pinned_version)
+        logger.info(f"Using cached {binary_name} {pinned_version}: {path}")
+        _resolved[browser] = path
+        return path
+
+    if OFFLINE:
+        raise RuntimeError(
+            f"No {binary_name} found on PATH or in cache '{CACHE_DIR}' and offline mode is enabled."
+        )
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with FileLock(os.path.join(CACHE_DIR, f"{browser}.lock")):
+        # Another worker may have resolved the binary while we waited for the lock
+        pinned_version = _usable_pin(browser, _read_lock_file().get(browser), browser_major)
+        if pinned_version and os.path.exists(_cached_binary(browser, pinned_version)):
+            path = _cached_binary(browser, pinned_version)
+        else:
+            logger.info(f"Resolving {binary_name} through webdriver-manager...")
+            downloaded = _download(browser, pinned_version)
+            version = pinned_version or get_binary_version(downloaded) or "unknown"
+            path = _cached_binary(browser, version)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copy2(downloaded, path)
+            if not pinned_version and version != "unknown":
+                pins = _read_lock_file()
+                pins[browser] = version
+                _write_lock_file(pins)
+                logger.info(f"Pinned {binary_name} version {version} in {LOCK_FILE}")
+
+    logger.info(f"Using {binary_name}: {path}")
+    _resolved[browser] = path
+    return path
+
+
+def invalidate_driver_binary(browser):
+    """
+    Forget the binary resolved for browser and unpin its version, so the next
+    resolve_driver_binary() call resolves a driver matching the installed browser.
+    """
+    browser = browser.lower()
+    path = _resolved.pop(browser, None)
+    if not path:
+        return
+    _rejected.add(os.path.abspath(path))
+    version = get_binary_version(path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with FileLock(os.path.join(CACHE_DIR, f"{browser}.lock")):
+        pins = _read_lock_file()
+        # Keep a pin another worker has already replaced with a working version
+        if pins.get(browser) and _version_matches(version, pins[browser]):
+            del pins[browser]
+            _write_lock_file(pins)
+            logger.info(f"Unpinned {DRIVER_BINARIES[browser]} version {version} in {LOCK_FILE}")
+
+
+def launch_with_driver_binary(browser, launch):
+    """
+    Calls launch(driver_path) with the resolved driver binary. When the session cannot be
+    created (typically a browser that auto-updated past the pinned driver), the binary is
+    invalidated, resolved again and the launch retried once.
+
+    Args:
+        browser (str): "chrome" or "firefox".
+        launch (callable): Starts the WebDriver session from a driver path and returns it.
+
+    Returns:
+        WebDriver: The started session.
+    """
+    from selenium.common.exceptions import SessionNotCreatedException
+    try:
+        return launch(resolve_driver_binary(browser))
+    except SessionNotCreatedException as e:
+        logger.warning(f"Session could not be created with the resolved {browser} driver, re-resolving it: {e}")
+        invalidate_driver_binary(browser)
+        return launch(resolve_driver_binary(browser))
@@ -0,0 +1,144 @@
+import base64
+import glob
+import json
+import logging
+import os
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Query parameters whose values change on every request (cache busters, timestamps, tracking)
+# and are ignored when matching a request against the archive
+VOLATILE_QUERY_PARAMS = {
+    "_", "t", "ts", "time", "timestamp", "cb", "cachebuster", "cache_buster", "rand", "random",
+    "rnd", "nonce", "callback", "jsonp", "requestid", "gclid", "fbclid",
+}
+VOLATILE_QUERY_PREFIXES = ("utm_",)
+
+# Hop-by-hop / encoding headers that must not be replayed with a decoded body
+SKIPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def normalize_url(url):
+    """
+    Matching key of a URL: scheme, host and path plus the sorted, non-volatile query parameters.
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in VOLATILE_QUERY_PARAMS and not name.lower().startswith(VOLATILE_QUERY_PREFIXES)
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+class HarArchive:
+    """
+    Records HTTP exchanges as HAR 1.2 entries and serves them back by request.
+
+    Requests are matched on method and normalized URL (volatile query parameters ignored).
+    When the same request was recorded several times, the responses are replayed in
+    recorded order and the last one is repeated afterwards.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._by_key = defaultdict(list)
+        self._served = defaultdict(int)
+        self.stats = {"recorded": 0, "hits": 0, "misses": 0}
+
+    @staticmethod
+    def _key(method, url):
+        return method.upper(), normalize_url(url)
+
+    def _index(self, entry):
+        self._by_key[self._key(entry["request"]["method"], entry["request"]["url"])].append(entry)
+
+    def record(self, method, url, status, headers, content, request_headers=()):
+        """
+        Add one exchange.
+
+        Args:
+            method (str): Request method.
+            url (str): Full request URL.
+            status (int): Response status code.
+            headers (iterable): Response (name, value) header pairs.
+            content (bytes): Decoded response body.
+            request_headers (iterable, optional): Request (name, value) header pairs.
+        """
+        entry = {
+            "request": {
+                "method": method,
+                "url": url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": n, "value": v} for n, v in request_headers],
+                "queryString": [{"name": n, "value": v} for n, v in parse_qsl(urlsplit(url).query, keep_blank_values=True)],
+            },
+            "response": {
+                "status": status,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": n, "value": v} for n, v in headers],
+                "content": {
+                    "size": len(content),
+                    "mimeType": dict((n.lower(), v) for n, v in headers).get("content-type", ""),
+                    "text": base64.b64encode(content).decode("ascii"),
+                    "encoding": "base64",
+                },
+            },
+        }
+        self.entries.append(entry)
+        self._index(entry)
+        self.stats["recorded"] += 1
+
+    def lookup(self, method, url):
+        """
+        Returns (status, headers, content) of the recorded response for the request, or None.
+        """
+        key = self._key(method, url)
+        candidates = self._by_key.get(key)
+        if not candidates:
+            self.stats["misses"] += 1
+            return None
+        position = min(self._served[key], len(candidates) - 1)
+        self._served[key] += 1
+        self.stats["hits"] += 1
+        response = candidates[position]["response"]
+        content = response["content"]
+        body = content.get("text", "")
+        body = base64.b64decode(body) if content.get("encoding") == "base64" else body.encode("utf-8")
+        headers = [
+            (h["name"], h["value"]) for h in response["headers"] if h["name"].lower() not in SKIPPED_RESPONSE_HEADERS
+        ]
+        return response["status"], headers, body
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        har = {"log": {"version": "1.2", "creator": {"name": "pytest-selenium-ui-automation", "version": "1.0"}, "entries": self.entries}}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved {len(self.entries)} HTTP exchanges to {path}")
+
+    def load(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)["log"]["entries"]
+        for entry in entries:
+            self.entries.append(entry)
+            self._index(entry)
+        logger.info(f"Loaded {len(entries)} HTTP exchanges from {path}")
+        return len(entries)
+
+    @classmethod
+    def load_dir(cls, directory):
+        """Load every *.har file of a replay directory into one archive."""
+        archive = cls()
+        for path in sorted(glob.glob(os.path.join(directory, "*.har"))):
+            archive.load(path)
+        return archive
+
+
+def has_archives(directory):
+    """True if the replay directory already holds recorded *.har files."""
+    return bool(glob.glob(os.path.join(directory, "*.har")))
@@ -0,0 +1,100 @@
+import logging
+from functools import lru_cache
+
+from helpers.ad_block_rules import BLOCKING_MODE, RULE_FILES, build_matcher
+from helpers.cdp_network import set_blocked_urls, supports_cdp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "full"
+
+# File extensions of the resource types a profile can block
+RESOURCE_TYPE_EXTENSIONS = {
+    "images": (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico", ".bmp"),
+    "media": (".mp4", ".webm", ".ogg", ".mp3", ".wav", ".m3u8", ".mpd"),
+    "fonts": (".woff", ".woff2", ".ttf", ".otf", ".eot"),
+}
+
+
+def _extension_patterns(extensions):
+    # The URL either ends with the extension or continues with a query string
+    return [pattern for ext in extensions for pattern in (f"*{ext}", f"*{ext}?*")]
+
+
+# URL patterns (Network.setBlockedURLs wildcard syntax) of every blockable resource type
+RESOURCE_TYPE_PATTERNS = {
+    **{resource_type: _extension_patterns(extensions) for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()},
+    # Tag managers, analytics, chat and social widgets, i.e. scripts the pages under test never need
+    "third_party_scripts": [
+        "*googletagmanager.com/*", "*google-analytics.com/*", "*googletagservices.com/*",
+        "*googlesyndication.com/*", "*connect.facebook.net/*", "*platform.twitter.com/*",
+        "*static.hotjar.com/*", "*clarity.ms/*", "*cdn.mxpnl.com/*", "*snap.licdn.com/*",
+        "*cdn.segment.com/*", "*widget.freshworks.com/*", "*wchat.freshchat.com/*", "*webengage.com/*",
+        "*moengage.com/*", "*clevertap-prod.com/*", "*bat.bing.com/*", "*criteo.net/*",
+    ],
+}
+
+# Named load profiles: the resource types each one blocks
+LOAD_PROFILES = {
+    "full": (),
+    "no_media": ("images", "media"),
+    "lean_page": ("images", "media", "fonts", "third_party_scripts"),
+}
+
+
+def get_profile_patterns(profile):
+    """
+    Returns the URL patterns blocked by a load profile.
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    if profile not in LOAD_PROFILES:
+        raise ValueError(f"Unknown load profile '{profile}'. Available: {', '.join(LOAD_PROFILES)}")
+    patterns = []
+    for resource_type in LOAD_PROFILES[profile]:
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    return patterns
+
+
+@lru_cache(maxsize=1)
+def _ad_block_patterns():
+    return tuple(build_matcher(RULE_FILES).to_url_patterns()) if BLOCKING_MODE == "cdp" else ()
+
+
+def apply_load_profile(driver, profile):
+    """
+    Block the resource types of a load profile inside the browser (Network.setBlockedURLs).
+
+    The patterns replace the blocked URL list of the tab, so the ad/tracker rules of
+    [AdBlock] mode = cdp are kept in the same list. Applying DEFAULT_PROFILE restores them alone.
+
+    Args:
+        driver: WebDriver instance.
+        profile (str): Name of a profile of LOAD_PROFILES.
+
+    Returns:
+        bool: True if the profile was applied, False if the browser does not support CDP.
+    """
+    patterns = get_profile_patterns(profile)
+    if not supports_cdp(driver):
+        if patterns:
+            logger.warning(f"Load profile '{profile}' needs a Chromium-based browser; loading all resources.")
+        return False
+    set_blocked_urls(driver, list(_ad_block_patterns()) + patterns)
+    logger.info(f"Load profile '{profile}' applied, {len(patterns)} resource URL patterns blocked.")
+    return True
+
+
+def resolve_profile(item, default=DEFAULT_PROFILE):
+    """
+    Profile selected for a test item: @pytest.mark.load_profile("name") or a marker named
+    after a profile (e.g. @pytest.mark.lean_page), falling back to default.
+    """
+    marker = item.get_closest_marker("load_profile")
+    if marker is not None and marker.args:
+        return marker.args[0]
+    for profile in LOAD_PROFILES:
+        if profile != DEFAULT_PROFILE and item.get_closest_marker(profile) is not None:
+            return profile
+    return default
@@ -0,0 +1,106 @@
+import json
+import logging
+
+from helpers.cdp_network import supports_cdp
+
+logger = logging.getLogger(__name__)
+
+# Known nuisances (popups, notification iframes, overlays) by name, see register_nuisance()
+_NUISANCES = {}
+
+# Runs in the top frame of every new document before any page script. Hides the registered
+# selectors with CSS, and a MutationObserver removes (or clicks) matching elements as soon as
+# they are inserted. window.__suppressedNuisances counts what was suppressed, per nuisance.
+SUPPRESSION_SCRIPT_TEMPLATE = """
+(function (nuisances) {
+    if (window.top !== window || window.__suppressedNuisances) { return; }
+    var suppressed = window.__suppressedNuisances = {};
+    var clicked = {};
+    var style = document.createElement('style');
+    style.textContent = nuisances.hide.map(function (n) {
+        return n.selector + ' { display: none !important; visibility: hidden !important; }';
+    }).join('\\n');
+
+    function count(name) { suppressed[name] = (suppressed[name] || 0) + 1; }
+
+    function each(selector, callback) {
+        try {
+            Array.prototype.forEach.call(document.querySelectorAll(selector), callback);
+        } catch (e) { /* invalid selector: skip it */ }
+    }
+
+    function sweep() {
+        if (!style.isConnected && (document.head || document.documentElement)) {
+            (document.head || document.documentElement).appendChild(style);
+        }
+        nuisances.remove.forEach(function (n) {
+            each(n.selector, function (el) { el.remove(); count(n.name); });
+        });
+        var now = performance.now();
+        nuisances.click.forEach(function (n, index) {
+            if (clicked[index] || now > n.within_ms) { return; }
+            var el = null;
+            try { el = document.querySelector(n.selector); } catch (e) { return; }
+            if (el) { clicked[index] = true; el.click(); count(n.name); }
+        });
+    }
+
+    new MutationObserver(sweep).observe(document, {childList: true, subtree: true});
+    sweep();
+})(__NUISANCES__);
+"""
+
+
+def register_nuisance(name, hide=(), remove=(), click=(), click_within=15):
+    """
+    Register a known nuisance of the application under test.
+
+    Args:
+        name (str): Name of the nuisance (used in logs and window.__suppressedNuisances).
+        hide (iterable, optional): CSS selectors hidden with a stylesheet.
+        remove (iterable, optional): CSS selectors of elements removed from the DOM as they appear.
+        click (iterable, optional): CSS selectors of close buttons, each clicked once per document.
+        click_within (float, optional): Seconds after document creation during which close buttons
+            are clicked, so that later, legitimate matches are left alone. Defaults to 15.
+    """
+    _NUISANCES[name] = {
+        "hide": list(hide),
+        "remove": list(remove),
+        "click": list(click),
+        "click_within_ms": int(click_within * 1000),
+    }
+
+
+def get_registered_nuisances():
+    return dict(_NUISANCES)
+
+
+def build_suppression_script(nuisances=None):
+    """Compile the registered nuisances (or the given name -> nuisance mapping) into one script."""
+    nuisances = _NUISANCES if nuisances is None else nuisances
+    compiled = {"hide": [], "remove": [], "click": []}
+    for name, nuisance in nuisances.items():
+        compiled["hide"].extend({"name": name, "selector": selector} for selector in nuisance["hide"])
+        compiled["remove"].extend({"name": name, "selector": selector} for selector in nuisance["remove"])
+        compiled["click"].extend(
+            {"name": name, "selector": selector, "within_ms": nuisance["click_within_ms"]}
+            for selector in nuisance["click"]
+        )
+    return SUPPRESSION_SCRIPT_TEMPLATE.replace("__NUISANCES__", json.dumps(compiled))
+
+
+def install_nuisance_suppression(driver, nuisances=None):
+    """
+    Inject the suppression script into every document the browser creates from now on
+    (Page.addScriptToEvaluateOnNewDocument), so nuisances never cost a WebDriver round trip.
+
+    Returns:
+        bool: True if installed, False if the browser does not support CDP.
+    """
+    if not supports_cdp(driver):
+        logger.warning("Nuisance suppression needs a Chromium-based browser; skipping it.")
+        return False
+    nuisances = _NUISANCES if nuisances is None else nuisances
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": build_suppression_script(nuisances)})
+    logger.info(f"Nuisance suppression installed for: {', '.join(nuisances) or 'nothing'}")
+    return True
@@ -2,8 +2,16 @@ import datetime
 import logging
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
-from helpers.webdriver_actions import get_driver, get_element_attribute
+from helpers.webdriver_actions import (
+    get_driver,
+    get_element_attribute,
+    find_element,
+    click,
+    is_element_present,
+    get_wait_timeout,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +62,104 @@ def get_formatted_date_in_days(days_offset=0):
     return date_format
 
 
+# Reads the months currently rendered by the date picker from the visible day cells,
+# whose aria-label follows get_formatted_date_in_days() (e.g. "Choose Sunday, November 2nd, 2025").
+DISPLAYED_CALENDAR_MONTHS_SCRIPT = """
+const months = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December'];
+const pattern = /^(?:Choose|Not available) \\w+, (\\w+) \\d{1,2}(?:st|nd|rd|th), (\\d{4})$/;
+const displayed = new Set();
+for (const cell of document.querySelectorAll('[aria-label]')) {
+    if (cell.offsetParent === null) continue;
+    const match = pattern.exec(cell.getAttribute('aria-label'));
+    if (match && months.indexOf(match[1]) >= 0) {
+        displayed.add(Number(match[2]) * 12 + months.indexOf(match[1]));
+    }
+}
+return Array.from(displayed).sort((a, b) => a - b);
+"""
+
+
+def get_displayed_calendar_months(timeout=0):
+    """
+    Returns the months currently displayed by the date picker, read in a single script call.
+
+    Args:
+        timeout (float, optional): Seconds to wait for an open calendar to render. Defaults to 0.
+
+    Returns:
+        list[int]: Sorted month indexes (year * 12 + zero-based month), empty if no calendar is open.
+    """
+    try:
+        return WebDriverWait(get_driver(), timeout, 0.2).until(
+            lambda driver: driver.execute_script(DISPLAYED_CALENDAR_MONTHS_SCRIPT)
+        )
+    except TimeoutException:
+        return []
+
+
+def calculate_calendar_clicks(displayed_months, days_offset):
+    """
+    Computes how many next (positive) or previous (negative) clicks bring the target month into view.
+
+    Args:
+        displayed_months (list[int]): Month indexes returned by get_displayed_calendar_months().
+        days_offset (int): The number of days from today of the target date.
+
+    Returns:
+        int: Number of clicks; 0 when the target month is already displayed.
+    """
+    target_date = datetime.date.today() + datetime.timedelta(days=days_offset)
+    target_month = target_date.year * 12 + target_date.month - 1
+    if target_month < displayed_months[0]:
+        return target_month - displayed_months[0]
+    if target_month > displayed_months[-1]:
+        return target_month - displayed_months[-1]
+    return 0
+
+
+def navigate_calendar_to_date(
+    date_locator, target_date, days_offset, next_button, prev_button, max_clicks=24
+):
+    """
+    Brings the target date of an open date picker into view with a bounded number of clicks.
+
+    The displayed months are read once and the number of next/previous clicks is computed
+    up front; the month-by-month probing is only used when the calendar cannot be read.
+
+    Args:
+        date_locator: Locator template of a day cell, formatted with target_date.
+        target_date (str): aria-label of the day cell, as returned by get_formatted_date_in_days().
+        days_offset (int): The number of days from today of the target date.
+        next_button: Locator of the calendar "next month" button.
+        prev_button: Locator of the calendar "previous month" button.
+        max_clicks (int, optional): Upper bound of navigation clicks. Defaults to 24.
+
+    Returns:
+        bool: True if the target date is present after navigating, False otherwise.
+    """
+    if is_element_present(date_locator, replace_value=target_date, timeout=0):
+        return True
+    button = prev_button if days_offset < 0 else next_button
+    displayed_months = get_displayed_calendar_months(timeout=get_wait_timeout())
+    if displayed_months:
+        clicks = calculate_calendar_clicks(displayed_months, days_offset)
+        button = prev_button if clicks < 0 else next_button
+        clicks = min(abs(clicks), max_clicks)
+        logger.info(f"Calendar needs {clicks} click(s) to reach {target_date}.")
+        for _ in range(clicks):
+            click(button)
+        if is_element_present(date_locator, replace_value=target_date, timeout=get_wait_timeout()):
+            return True
+        logger.warning(f"{target_date} not visible after computed navigation, probing month by month.")
+    for _ in range(max_clicks):
+        click(button)
+        if is_element_present(date_locator, replace_value=target_date, timeout=2):
+            return True
+    logger.error(f"{target_date} not found in calendar after {max_clicks} clicks.")
+    return False
+
+
 def calculate_x_offset(
     min_val: int,
     max_val: int,
@@ -119,7 +225,7 @@ def set_horizontal_slider(
         target_val: The desired value to set.
     """
     try:
-        slider_handle = driver.find_element(*handle_locator)
+        slider_handle = find_element(handle_locator)
         slider_handle_width = slider_handle.size["width"]
         logger.info(f"Slider handle width: {slider_handle_width} pixels")
 
@@ -156,8 +262,8 @@ def scroll_element_into_view_in_side_bar(
         target_element_locator: Tuple containing the By method and locator string for the target element.
     """
     try:
-        sidebar = driver.find_element(*sidebar_locator)
-        target_element = driver.find_element(*target_element_locator)
+        sidebar = find_element(sidebar_locator)
+        target_element = find_element(target_element_locator)
 
         ## 2. Execute JavaScript to Scroll the Container
 
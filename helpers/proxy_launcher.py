@@ -0,0 +1,183 @@
+import atexit
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+from helpers.traffic_metrics import METRICS_HOST
+
+logger = logging.getLogger(__name__)
+
+ADDON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ads_blocker_proxy.py")
+# Runs mitmdump from the current interpreter so the project's virtualenv is used
+MITMDUMP_COMMAND = [sys.executable, "-c", "from mitmproxy.tools.main import mitmdump; mitmdump()"]
+# Environment variable through which a worker's proxy address reaches drivers created outside the fixtures
+PROXY_ADDRESS_ENV = "SELENIUM_PROXY_ADDRESS"
+DEFAULT_PROXY_ADDRESS = "localhost:8080"
+# Root of the per-worker asset caches; every worker's proxy owns <root>/<worker>
+ASSET_CACHE_ROOT = ".asset_cache"
+
+
+def find_free_port(host="127.0.0.1"):
+    """Ask the OS for a free TCP port (it may be taken again before it is bound, see ProxyProcess.start)."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class ProxyPortTaken(RuntimeError):
+    """The proxy could not take its port, another process bound it first."""
+
+
+class ProxyProcess:
+    """
+    A mitmdump process running the project's addons (helpers/ads_blocker_proxy.py).
+
+    Example:
+        proxy = ProxyProcess(options={"replay_dir": "replays", "replay_mode": "record"}).start()
+        ... options.add_argument(f"--proxy-server={proxy.address}") ...
+        proxy.stop()
+    """
+
+    def __init__(self, port=None, host="127.0.0.1", options=None, log_file=None):
+        """
+        :param port: Port to listen on (a free port is allocated when None)
+        :param host: Interface to listen on
+        :param options: mitmproxy options passed as --set name=value
+        :param log_file: File receiving the proxy output (discarded when None)
+        """
+        self.host = host
+        self._auto_port = port is None
+        self.port = port or find_free_port(host)
+        self.options = options or {}
+        self.log_file = log_file
+        # Served back by the addon, so the readiness probe only accepts this process
+        self.instance_id = uuid.uuid4().hex
+        self._process = None
+        self._log_handle = None
+
+    @property
+    def address(self):
+        return f"{self.host}:{self.port}"
+
+    def start(self, timeout=30, attempts=3):
+        """
+        Start the proxy and wait until it answers as this instance.
+
+        A free port is only reserved until it is probed, so another process may bind it first;
+        with an automatically allocated port the launch is then retried on a new one.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                return self._launch(timeout)
+            except ProxyPortTaken as e:
+                if not self._auto_port or attempt == attempts:
+                    raise RuntimeError(str(e)) from e
+                logger.warning(f"{e}; retrying on another port.")
+                self.port = find_free_port(self.host)
+        return self
+
+    def _launch(self, timeout):
+        command = MITMDUMP_COMMAND + [
+            "--listen-host", self.host,
+            "--listen-port", str(self.port),
+            "-s", ADDON_SCRIPT,
+            "--set", f"proxy_instance={self.instance_id}",
+        ]
+        for name, value in self.options.items():
+            if isinstance(value, bool):
+                value = str(value).lower()
+            command += ["--set", f"{name}={value}"]
+        if self.log_file:
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            self._log_handle = open(self.log_file, "w", encoding="utf-8")
+        output = self._log_handle or subprocess.DEVNULL
+        self._process = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT, cwd=os.getcwd())
+        end_time = time.time() + timeout
+        while time.time() < end_time:
+            if self._process.poll() is not None:
+                returncode = self._process.returncode
+                self._process = None
+                self._close_log()
+                # Typically the port was bound by another process in the meantime
+                raise ProxyPortTaken(f"Proxy exited with code {returncode} while starting on {self.address}")
+            answer = self._probe_instance()
+            if answer == self.instance_id:
+                logger.info(f"Proxy listening on {self.address}")
+                # Never leave an orphaned proxy behind if the session dies before teardown
+                atexit.register(self.stop)
+                return self
+            if answer is not None:
+                self.stop()
+                raise ProxyPortTaken(f"Another proxy answered on {self.address}")
+            time.sleep(0.2)
+        self.stop()
+        raise TimeoutError(f"Proxy did not start on {self.address} within {timeout} seconds.")
+
+    def _probe_instance(self):
+        """Instance id of the proxy answering on the port, or None while nothing answers as a proxy."""
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": f"http://{self.address}"}))
+        try:
+            with opener.open(f"http://{METRICS_HOST}/instance", timeout=1) as response:
+                return response.read().decode("utf-8")
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+
+    def stop(self, timeout=15):
+        """Stop the proxy gracefully (so addons can flush archives/caches), killing it if needed."""
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.send_signal(signal.SIGINT if os.name != "nt" else signal.SIGTERM)
+            try:
+                self._process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Proxy on {self.address} did not stop in time, killing it.")
+                self._process.kill()
+                self._process.wait()
+        logger.info(f"Proxy on {self.address} stopped.")
+        self._process = None
+        self._close_log()
+        atexit.unregister(self.stop)
+        if os.environ.get(PROXY_ADDRESS_ENV) == self.address:
+            del os.environ[PROXY_ADDRESS_ENV]
+
+    def _close_log(self):
+        if self._log_handle:
+            self._log_handle.close()
+            self._log_handle = None
+
+
+def start_worker_proxy(options=None, log_dir="logs"):
+    """
+    Start a dedicated proxy for the current pytest-xdist worker on a free port,
+    so proxy throughput scales with the number of workers.
+
+    The address is exported in SELENIUM_PROXY_ADDRESS for get_proxy_address(). Every worker
+    gets its own asset cache directory (.asset_cache/<worker>), since the cache index of
+    one process cannot follow the evictions of another.
+
+    Args:
+        options (dict, optional): mitmproxy options passed to the addons.
+        log_dir (str, optional): Directory receiving proxy_<worker>.log.
+
+    Returns:
+        ProxyProcess: The started proxy; call stop() on teardown.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    options = {"asset_cache_dir": os.path.join(ASSET_CACHE_ROOT, worker_id), **(options or {})}
+    proxy = ProxyProcess(options=options, log_file=os.path.join(log_dir, f"proxy_{worker_id}.log")).start()
+    os.environ[PROXY_ADDRESS_ENV] = proxy.address
+    logger.info(f"Worker {worker_id} proxy started on {proxy.address}")
+    return proxy
+
+
+def get_proxy_address(default=DEFAULT_PROXY_ADDRESS):
+    """Address of the current worker's proxy, or default when no worker proxy is running."""
+    return os.environ.get(PROXY_ADDRESS_ENV, default)
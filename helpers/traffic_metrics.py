@@ -0,0 +1,156 @@
+import json
+import logging
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+from helpers.command_metrics import _percentile
+
+logger = logging.getLogger(__name__)
+
+# Pseudo host answered by the proxy addon itself with the current counters
+METRICS_HOST = "traffic-metrics.proxy"
+TOP_BLOCKED_HOSTS = 10
+
+# Typical transfer sizes (bytes) used for blocked requests until real responses of the kind were seen
+DEFAULT_RESOURCE_SIZES = {
+    "script": 40 * 1024,
+    "image": 15 * 1024,
+    "stylesheet": 20 * 1024,
+    "font": 30 * 1024,
+    "document": 50 * 1024,
+    "other": 2 * 1024,
+}
+_EXTENSION_KINDS = {
+    ".js": "script", ".mjs": "script",
+    ".css": "stylesheet",
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image", ".svg": "image",
+    ".webp": "image", ".avif": "image", ".ico": "image",
+    ".woff": "font", ".woff2": "font", ".ttf": "font", ".otf": "font", ".eot": "font",
+    ".html": "document", ".htm": "document",
+}
+_FETCH_DEST_KINDS = {
+    "script": "script", "image": "image", "style": "stylesheet", "font": "font",
+    "document": "document", "iframe": "document", "frame": "document",
+}
+
+
+def resource_kind(url, fetch_dest=""):
+    """Classify a request as script/image/stylesheet/font/document/other (Sec-Fetch-Dest first, then extension)."""
+    kind = _FETCH_DEST_KINDS.get(fetch_dest.lower())
+    if kind:
+        return kind
+    path = urlsplit(url).path.lower()
+    return _EXTENSION_KINDS.get(path[path.rfind("."):] if "." in path else "", "other")
+
+
+class TrafficCounters:
+    """Blocked/allowed request counters of one scope (a test or the whole worker)."""
+
+    def __init__(self):
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_received = 0
+        self.bytes_avoided = 0
+        self.blocked_hosts = Counter()
+        self.ttfb = []
+
+    def summary(self):
+        ttfb = sorted(self.ttfb)
+        return {
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "bytes_received": self.bytes_received,
+            "bytes_avoided_estimate": self.bytes_avoided,
+            "top_blocked_hosts": self.blocked_hosts.most_common(TOP_BLOCKED_HOSTS),
+            "ttfb_ms": {
+                "count": len(ttfb),
+                "p50": round(_percentile(ttfb, 50) * 1000, 1),
+                "p95": round(_percentile(ttfb, 95) * 1000, 1),
+            },
+        }
+
+
+class TrafficMetrics:
+    """
+    Aggregates what request blocking buys, per test and for the whole proxy (worker).
+
+    Bytes avoided by a blocked request are estimated from the average size of the
+    allowed responses of the same resource kind seen so far (DEFAULT_RESOURCE_SIZES before that).
+    """
+
+    def __init__(self):
+        self.test = TrafficCounters()
+        self.worker = TrafficCounters()
+        self._size_totals = defaultdict(lambda: [0, 0])
+
+    def _estimated_size(self, kind):
+        total, count = self._size_totals[kind]
+        return total // count if count else DEFAULT_RESOURCE_SIZES[kind]
+
+    def record_blocked(self, host, kind):
+        size = self._estimated_size(kind)
+        for counters in (self.test, self.worker):
+            counters.requests_blocked += 1
+            counters.bytes_avoided += size
+            counters.blocked_hosts[host] += 1
+
+    def record_allowed(self, kind, size, ttfb=None):
+        """
+        Args:
+            kind (str): Resource kind (see resource_kind).
+            size (int): Transferred response body size in bytes.
+            ttfb (float, optional): Seconds from request sent to first response byte; None for locally served responses.
+        """
+        totals = self._size_totals[kind]
+        totals[0] += size
+        totals[1] += 1
+        for counters in (self.test, self.worker):
+            counters.requests_allowed += 1
+            counters.bytes_received += size
+            if ttfb is not None:
+                counters.ttfb.append(ttfb)
+
+    def snapshot(self, reset_test=False):
+        """Returns {"test": summary, "worker": summary}, optionally starting a new test scope."""
+        snapshot = {"test": self.test.summary(), "worker": self.worker.summary()}
+        if reset_test:
+            self.test = TrafficCounters()
+        return snapshot
+
+
+def fetch_snapshot(proxy_address, reset_test=False, timeout=5):
+    """
+    Ask the proxy at proxy_address for its traffic counters.
+
+    Returns:
+        dict: {"test": summary, "worker": summary}, or None if the proxy could not be reached.
+    """
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": f"http://{proxy_address}"}))
+    url = f"http://{METRICS_HOST}/snapshot?reset={int(reset_test)}"
+    try:
+        with opener.open(url, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        logger.warning(f"Could not read traffic metrics from proxy {proxy_address}: {e}")
+        return None
+
+
+def summary_to_html(summary):
+    """Render a compact HTML table of the blocked traffic of a test for the report."""
+    hosts = "".join(f"<tr><td>{host}</td><td>{count}</td></tr>" for host, count in summary["top_blocked_hosts"])
+    ttfb = summary["ttfb_ms"]
+    return (
+        f"<p>Proxy traffic: {summary['requests_allowed']} allowed ({summary['bytes_received']} bytes), "
+        f"{summary['requests_blocked']} blocked (~{summary['bytes_avoided_estimate']} bytes avoided), "
+        f"TTFB p50 {ttfb['p50']} ms / p95 {ttfb['p95']} ms over {ttfb['count']} responses</p>"
+        "<table><tr><th>Blocked host</th><th>Requests</th></tr>" + hosts + "</table>"
+    )
+
+
+def write_json(path, results):
+    """Write the per-test and per-worker traffic summaries of a run as machine-readable JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    logger.info(f"Traffic metrics written to {path}")
@@ -0,0 +1,228 @@
+import logging
+from collections import deque
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton: finds whether any of many substrings occurs in a text
+    in a single pass over the text, independent of the number of patterns.
+    """
+
+    def __init__(self, patterns=()):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+        self._patterns = set()
+        self._compiled = True
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    @property
+    def patterns(self):
+        return sorted(self._patterns)
+
+    def add(self, pattern):
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._goto[node][char] = next_node
+            node = next_node
+        self._output[node] = pattern
+        self._patterns.add(pattern)
+        self._compiled = False
+
+    def compile(self):
+        """Compute failure links (breadth first) and propagate outputs along them."""
+        queue = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            queue.append(node)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if self._output[child] is None:
+                    self._output[child] = self._output[self._fail[child]]
+        self._compiled = True
+
+    def search(self, text):
+        """Returns the first pattern found in text, or None."""
+        if not self._compiled:
+            self.compile()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node] is not None:
+                return output[node]
+        return None
+
+
+class HostnameSuffixTrie:
+    """Matches a hostname against blocked domains, including all of their subdomains."""
+
+    _TERMINAL = ""
+
+    def __init__(self, domains=()):
+        self._root = {}
+        self._domains = set()
+        for domain in domains:
+            self.add(domain)
+
+    def __len__(self):
+        return len(self._domains)
+
+    @property
+    def domains(self):
+        return sorted(self._domains)
+
+    def add(self, domain):
+        labels = domain.strip(".").lower().split(".")
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        if self._TERMINAL not in node:
+            node[self._TERMINAL] = domain
+            self._domains.add(domain)
+
+    def search(self, hostname):
+        """Returns the blocked domain that hostname equals or is a subdomain of, or None."""
+        node = self._root
+        for label in reversed(hostname.lower().split(".")):
+            node = node.get(label)
+            if node is None:
+                return None
+            if self._TERMINAL in node:
+                return node[self._TERMINAL]
+        return None
+
+
+class UrlMatcher:
+    """
+    Case-insensitive URL matcher combining substring rules (Aho-Corasick) and
+    domain rules (hostname suffix trie), with EasyList-style exception rules.
+    """
+
+    def __init__(self, keywords=(), domains=()):
+        self._keywords = AhoCorasick()
+        self._domains = HostnameSuffixTrie()
+        self._allowed_keywords = AhoCorasick()
+        self._allowed_domains = HostnameSuffixTrie()
+        # Spellings of each blocking keyword as written in the rules, for case-sensitive consumers
+        self._keyword_spellings = {}
+        for keyword in keywords:
+            self.add_keyword(keyword)
+        for domain in domains:
+            self.add_domain(domain)
+
+    @property
+    def rule_count(self):
+        return len(self._keywords) + len(self._domains)
+
+    def add_keyword(self, keyword, allow=False):
+        (self._allowed_keywords if allow else self._keywords).add(keyword.lower())
+        if not allow:
+            self._keyword_spellings.setdefault(keyword.lower(), set()).add(keyword)
+
+    def add_domain(self, domain, allow=False):
+        (self._allowed_domains if allow else self._domains).add(domain.lower())
+
+    def to_url_patterns(self):
+        """
+        Express the blocking rules as wildcard URL patterns (e.g. for Chrome's Network.setBlockedURLs).
+        Exception rules cannot be expressed this way and are not included.
+
+        Wildcard matching is case-sensitive, so a keyword is emitted both as written in the
+        rules and in lowercase; domains are lowercase, like the hostnames of canonical URLs.
+        """
+        patterns = []
+        for domain in self._domains.domains:
+            patterns.extend([f"*://{domain}/*", f"*.{domain}/*"])
+        for keyword in self._keywords.patterns:
+            spellings = self._keyword_spellings.get(keyword, set()) | {keyword}
+            patterns.extend(f"*{spelling}*" for spelling in sorted(spellings))
+        return patterns
+
+    def compile(self):
+        for automaton in (self._keywords, self._allowed_keywords):
+            automaton.compile()
+        return self
+
+    def match(self, url, hostname=None):
+        """
+        Returns the rule that blocks url, or None if it is allowed.
+
+        Args:
+            url (str): Full request URL.
+            hostname (str, optional): Request host, parsed from url when omitted.
+        """
+        url = url.lower()
+        if hostname is None:
+            hostname = urlsplit(url).hostname or ""
+        rule = self._domains.search(hostname) or self._keywords.search(url)
+        if rule is None:
+            return None
+        if self._allowed_domains.search(hostname) or self._allowed_keywords.search(url):
+            return None
+        return rule
+
+    def load_rules(self, path):
+        """
+        Load an EasyList-style rule file.
+
+        Supported: '||domain^' domain rules, plain and '|'-anchored substring rules,
+        '@@' exception rules and trailing '$options' (ignored). Comments, element hiding
+        ('##') and regex rules are skipped; for wildcard rules the longest literal part is used.
+
+        Returns:
+            int: Number of rules loaded.
+        """
+        loaded = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if self._add_rule(line.strip()):
+                    loaded += 1
+        logger.info(f"Loaded {loaded} URL rules from {path}")
+        return loaded
+
+    def _add_rule(self, rule):
+        if not rule or rule.startswith(("!", "[")) or "##" in rule or "#@#" in rule or "#?#" in rule:
+            return False
+        allow = rule.startswith("@@")
+        if allow:
+            rule = rule[2:]
+        if rule.startswith("/") and rule.endswith("/") and len(rule) > 1:
+            return False  # Regex rules are not supported
+        rule = rule.split("$", 1)[0]
+        if rule.startswith("||"):
+            body = rule[2:]
+            domain = body.rstrip("^")
+            if domain and all(c not in domain for c in "/^*"):
+                self.add_domain(domain, allow)
+                return True
+            rule = body
+        rule = rule.strip("|").replace("^", "")
+        literal = max(rule.split("*"), key=len)
+        if len(literal) < 3:
+            return False  # Too generic to be useful as a substring
+        self.add_keyword(literal, allow)
+        return True
@@ -1,41 +1,136 @@
+import contextlib
+import contextvars
+import json
 import logging
+import weakref
 from selenium.webdriver.common.action_chains import ActionChains
 import time
+from configparser import ConfigParser
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
+from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
 )
+from helpers.cdp_network import reapply_blocked_urls
 
 logger = logging.getLogger(__name__)
 
-_driver_instance = None
+CONFIG = ConfigParser()
+CONFIG.read('config.ini')
+
+# Drivers run with a zero implicit wait; every lookup gets an explicit per-call deadline instead.
+DEFAULT_WAIT_TIMEOUT = CONFIG.getfloat('Settings', 'implicit_wait', fallback=10)
+POLL_FREQUENCY = 0.2
+PAGE_LOAD_TIMEOUT = CONFIG.getfloat('Settings', 'page_load_timeout', fallback=30)
+# Mutation-free window (milliseconds) after which the DOM counts as settled
+DOM_SETTLE_MS = CONFIG.getint('Settings', 'dom_settle_ms', fallback=300)
+# Longest wait for the DOM to settle; below the driver's script timeout, which would abort the wait
+DOM_SETTLE_TIMEOUT = CONFIG.getfloat('Settings', 'dom_settle_timeout', fallback=5)
+# Selenium's default script timeout for execute_async_script (seconds)
+SCRIPT_TIMEOUT = 30
+# Quiet window after which the network counts as idle
+NETWORK_IDLE_TIME = CONFIG.getfloat('Settings', 'network_idle_time', fallback=0.5)
+# Requests open longer than this (long polling, streaming) do not keep the network busy
+LONG_REQUEST_TIMEOUT = 15
+
+# Driver bound to the current thread / asyncio task. Every helper in this module
+# resolves the browser through get_driver(), so independent flows running in
+# different threads or tasks can each drive their own browser concurrently.
+_current_driver = contextvars.ContextVar("current_driver", default=None)
 
 
 def set_driver(driver):
-    """Set the module-level driver (call once from your fixture)."""
-    global _driver_instance
-    _driver_instance = driver
+    """
+    Register the driver for the current context (call once from your fixture).
+
+    The binding is local to the calling thread or asyncio task; new threads start
+    without a driver and must call set_driver() (or use_driver()) themselves.
+
+    Returns:
+        contextvars.Token: Token that can be passed to reset_driver() to restore the previous binding.
+    """
+    return _current_driver.set(driver)
+
+
+def reset_driver(token):
+    """Restore the driver binding that was active before the matching set_driver() call."""
+    _current_driver.reset(token)
 
 
 def get_driver():
-    if _driver_instance is None:
+    driver = _current_driver.get()
+    if driver is None:
         raise RuntimeError(
             "Driver not set. Call set_driver(driver) before using webdriver_actions."
         )
-    return _driver_instance
+    return driver
 
 
 def clear_driver():
-    global _driver_instance
-    if _driver_instance:  # Check if driver exists before trying to quit
+    driver = _current_driver.get()
+    if driver:  # Check if driver exists before trying to quit
         try:
-            _driver_instance.quit()
+            driver.quit()
         except Exception as e:
             logger.error(f"Error quitting driver: {e}")
-    _driver_instance = None
+    _current_driver.set(None)
+
+
+@contextlib.contextmanager
+def use_driver(driver):
+    """
+    Temporarily bind a driver to the current context.
+
+    Example:
+        with use_driver(second_browser):
+            click(search_flights_button)
+    """
+    token = set_driver(driver)
+    try:
+        yield driver
+    finally:
+        reset_driver(token)
+
+
+def run_with_driver(driver, func, *args, **kwargs):
+    """
+    Call func with the given driver bound, e.g. as the target of a worker thread.
+
+    Example:
+        with ThreadPoolExecutor() as pool:
+            futures = [pool.submit(run_with_driver, d, flow) for d in drivers]
+    """
+    with use_driver(driver):
+        return func(*args, **kwargs)
+
+
+# Per-context override of DEFAULT_WAIT_TIMEOUT, set through wait_timeout()
+_wait_timeout = contextvars.ContextVar("wait_timeout", default=None)
+
+
+def get_wait_timeout():
+    """Returns the deadline (seconds) applied to lookups that do not pass an explicit timeout."""
+    timeout = _wait_timeout.get()
+    return DEFAULT_WAIT_TIMEOUT if timeout is None else timeout
+
+
+@contextlib.contextmanager
+def wait_timeout(seconds):
+    """
+    Temporarily override the default per-call deadline for the current context.
+
+    Example:
+        with wait_timeout(20):
+            set_price_filter(driver, target_price)
+    """
+    token = _wait_timeout.set(seconds)
+    try:
+        yield seconds
+    finally:
+        _wait_timeout.reset(token)
 
 
 def _format_locator(locator, replace_value=None):
@@ -46,22 +141,45 @@ def _format_locator(locator, replace_value=None):
     )
 
 
-def find_element(locator, replace_value=None, shadow_dom=False):
+def _poll_elements(formatted_locator, timeout):
+    """Poll find_elements until at least one element matches or the deadline passes."""
     driver = get_driver()
+    deadline = time.monotonic() + timeout
+    while True:
+        elements = driver.find_elements(*formatted_locator)
+        if elements or time.monotonic() >= deadline:
+            return elements
+        time.sleep(POLL_FREQUENCY)
+
+
+def find_element(locator, replace_value=None, shadow_dom=False, timeout=None):
+    """
+    Find an element, waiting up to timeout seconds for it to appear.
+
+    Raises:
+        NoSuchElementException: If the element is not found before the deadline.
+    """
     formatted_locator = _format_locator(locator, replace_value)
     if shadow_dom:
         # Implement shadow DOM logic if needed
         pass
-    return driver.find_element(*formatted_locator)
+    timeout = get_wait_timeout() if timeout is None else timeout
+    elements = _poll_elements(formatted_locator, timeout)
+    if not elements:
+        raise NoSuchElementException(
+            f"Element {formatted_locator} not found within {timeout} seconds"
+        )
+    return elements[0]
 
 
-def find_elements(locator, shadow_dom=False, replace_value=None):
-    driver = get_driver()
+def find_elements(locator, shadow_dom=False, replace_value=None, timeout=None):
+    """Find all matching elements, waiting up to timeout seconds for the first one to appear."""
     formatted_locator = _format_locator(locator, replace_value)
     if shadow_dom:
         # Implement shadow DOM logic if needed
         pass
-    return driver.find_elements(*formatted_locator)
+    timeout = get_wait_timeout() if timeout is None else timeout
+    return _poll_elements(formatted_locator, timeout)
 
 
 def click(locator, replace_value=None, shadow_dom=False, max_retries=3):
@@ -77,7 +195,7 @@ def click(locator, replace_value=None, shadow_dom=False, max_retries=3):
                 f"⚠️ Attempt {attempt} failed: {type(e).__name__}. Retrying..."
             )
             if attempt < max_retries:
-                time.sleep(2)  # Wait 2 seconds before the next retry
+                wait_for_dom_settled(timeout=2)  # Let the re-render finish (at most 2 seconds) before the next retry
             else:
                 logger.error(
                     f"❌ All {max_retries} attempts failed for locator: {locator[1], replace_value}"
@@ -119,8 +237,17 @@ def select_element_from_dropdown(
 
 
 def implicit_wait(seconds):
-    """Set driver implicit wait (affects all find_element calls)."""
-    get_driver().implicitly_wait(seconds)
+    """
+    Deprecated: set the default lookup deadline for the rest of the current context.
+
+    Kept for compatibility: the driver's own implicit wait stays at zero so that
+    absence checks never block; use the scoped `with wait_timeout(...)` form instead.
+    """
+    logger.warning(
+        f"implicit_wait({seconds}) is deprecated and changes every later lookup deadline; "
+        "use `with wait_timeout(...)` instead."
+    )
+    _wait_timeout.set(seconds)
 
 
 def explicit_wait(
@@ -190,7 +317,7 @@ def type_value(locator, text, shadow_dom=False, replace_value=None):
     elem.send_keys(text)
 
 
-def is_element_present(locator, shadow_dom=False, replace_value=None):
+def is_element_present(locator, shadow_dom=False, replace_value=None, timeout=None):
     """
     Check if an element is present in the DOM.
 
@@ -198,21 +325,19 @@ def is_element_present(locator, shadow_dom=False, replace_value=None):
         locator (str): The locator used to find the element.
         shadow_dom (bool, optional): Indicates whether to search within a shadow DOM. Defaults to False.
         replace_value (any, optional): A value to replace in the locator if needed. Defaults to None.
+        timeout (float, optional): Seconds to wait for the element to appear. Defaults to the current
+            lookup deadline; pass 0 to fail fast when the element is expected to be absent.
 
     Returns:
         bool: True if the element is present, False otherwise.
-
-    Raises:
-        Exception: If the element cannot be found, an exception is raised.
     """
     try:
-        find_element(locator, replace_value, shadow_dom)
-        return True
+        return bool(find_elements(locator, shadow_dom, replace_value, timeout=timeout))
     except Exception:
         return False
 
 
-def is_element_not_present(locator, shadow_dom=False, replace_value=None):
+def is_element_not_present(locator, shadow_dom=False, replace_value=None, timeout=0):
     """
     Check if an element is not present in the DOM.
 
@@ -220,15 +345,22 @@ def is_element_not_present(locator, shadow_dom=False, replace_value=None):
         locator (str): The locator used to find the element.
         shadow_dom (bool, optional): Indicates whether to search within a shadow DOM. Defaults to False.
         replace_value (any, optional): A value to replace in the locator if needed. Defaults to None.
+        timeout (float, optional): Seconds to wait for the element to disappear. Defaults to 0 (fail fast).
 
     Returns:
         bool: True if the element is not present, False otherwise.
     """
-    try:
-        find_element(locator, replace_value, shadow_dom)
-        return False
-    except Exception:
-        return True
+    formatted_locator = _format_locator(locator, replace_value)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if not get_driver().find_elements(*formatted_locator):
+                return True
+        except Exception:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_FREQUENCY)
 
 
 def get_element_text(locator, shadow_dom=False, replace_value=None):
@@ -246,7 +378,7 @@ def get_element_text(locator, shadow_dom=False, replace_value=None):
     return find_element(locator, replace_value, shadow_dom).text
 
 
-def get_elements_text(locator, shadow_dom=False, replace_value=None):
+def get_elements_text(locator, shadow_dom=False, replace_value=None, bulk=False, normalize=False, text_property="innerText"):
     """
     Return the visible text for all elements found by the given locator.
 
@@ -261,16 +393,56 @@ def get_elements_text(locator, shadow_dom=False, replace_value=None):
     replace_value : Any, optional
         Optional value used to replace placeholders in the locator prior to searching
         (useful when locators are templates that require runtime values). Defaults to None.
+    bulk : bool, optional
+        If True, collect the text of all matches inside the browser in a single call
+        instead of one .text round trip per element. Defaults to False.
+    normalize : bool, optional
+        If True, replace newlines with spaces (only applies to bulk mode). Defaults to False.
+    text_property : str, optional
+        'innerText' or 'textContent', used in bulk mode. Defaults to 'innerText'.
 
     Returns
     -------
     list[str]
-        A list containing the .text value of each matched element. If no elements are found,
+        A list containing the text of each matched element. If no elements are found,
         an empty list is returned.
     """
+    if bulk:
+        texts = []
+        for chunk in iter_elements_text(locator, replace_value=replace_value, normalize=normalize, text_property=text_property):
+            texts.extend(chunk)
+        return texts
     return [e.text for e in find_elements(locator, shadow_dom, replace_value)]
 
 
+def iter_elements_text(locator, replace_value=None, chunk_size=500, normalize=False, text_property="innerText", timeout=None):
+    """
+    Stream the text of all elements matched by the locator in chunks, one in-browser call per chunk.
+
+    Waits up to timeout seconds (default per-call deadline) for the first match.
+
+    Yields:
+        list[str]: Up to chunk_size texts, in document order.
+    """
+    if text_property not in ("innerText", "textContent"):
+        raise ValueError(f"Unsupported text property: {text_property}")
+    using, value = _to_script_locator(_format_locator(locator, replace_value))
+    driver = get_driver()
+    timeout = get_wait_timeout() if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    start = 0
+    while True:
+        result = driver.execute_script(BULK_TEXT_SCRIPT, using, value, text_property, normalize, start, chunk_size)
+        if result["total"] == 0 and start == 0 and time.monotonic() < deadline:
+            time.sleep(POLL_FREQUENCY)
+            continue
+        if result["texts"]:
+            yield result["texts"]
+        start += len(result["texts"])
+        if not result["texts"] or start >= result["total"]:
+            return
+
+
 def mouse_over_click(locator, shadow_dom=False, replace_value=None):
     """
     Simulates a mouse over action followed by a click on a specified element.
@@ -481,9 +653,18 @@ def take_screenshot(file_path):
     get_driver().save_screenshot(file_path)
 
 
-def load_url(url):
-    """Loads the specified URL in the browser."""
+def load_url(url, wait_for_idle=False):
+    """
+    Loads the specified URL in the browser.
+
+    Args:
+        url (str): The URL to load.
+        wait_for_idle (bool, optional): Also wait until the network has been idle for NETWORK_IDLE_TIME
+            (useful with the "eager" page load strategy). Defaults to False.
+    """
     get_driver().get(url)
+    if wait_for_idle:
+        wait_for_network_idle()
 
 
 def clear_cookies():
@@ -531,6 +712,8 @@ def switch_to_new_tab():
     driver = get_driver()
     logger.info("Switching to the newest browser tab.")
     driver.switch_to.window(driver.window_handles[-1])
+    # Blocked URLs (ad rules, load profile) are per tab
+    reapply_blocked_urls(driver)
 
 
 def switch_to_original_tab():
@@ -553,6 +736,121 @@ def wait_until_page_ready(timeout=10, poll_frequency=0.5):
     raise TimeoutError(f"Page did not reach 'complete' state within {timeout} seconds.")
 
 
+# Requests in flight per driver (requestId -> start time), followed through the CDP Network events
+# of Chrome's performance log; None marks a driver without a performance log.
+_network_inflight = weakref.WeakKeyDictionary()
+
+
+def _drain_network_events(driver):
+    """
+    Read the pending CDP Network events of the driver and update its in-flight requests.
+
+    Returns:
+        dict: The in-flight requests, or None if the driver has no performance log (e.g. Firefox).
+    """
+    if driver in _network_inflight and _network_inflight[driver] is None:
+        return None
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        logger.info("No performance log available, network idle is detected from the page instead.")
+        _network_inflight[driver] = None
+        return None
+    inflight = _network_inflight.setdefault(driver, {})
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method")
+        if method == "Network.requestWillBeSent":
+            inflight[message["params"]["requestId"]] = time.time()
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            inflight.pop(message["params"]["requestId"], None)
+    return inflight
+
+
+def reset_network_tracking(driver):
+    """Drop the buffered network events and in-flight requests of a driver (e.g. before reusing it)."""
+    inflight = _drain_network_events(driver)
+    if inflight is not None:
+        inflight.clear()
+
+
+def wait_for_network_idle(idle_time=None, timeout=None, max_inflight=0):
+    """
+    Waits until no request has been in flight for idle_time seconds.
+
+    On Chrome the in-flight requests are followed through CDP Network events (performance log),
+    elsewhere the page counts as idle when it is no longer loading and no new resource finished
+    during the idle window.
+
+    Args:
+        idle_time (float, optional): Quiet window in seconds. Defaults to network_idle_time from config.ini.
+        timeout (float, optional): Maximum time to wait. Defaults to page_load_timeout from config.ini.
+        max_inflight (int, optional): Number of in-flight requests still considered idle (e.g. 2 for
+            pages that keep analytics connections open). Defaults to 0.
+
+    Raises:
+        TimeoutError: If the network does not become idle within the timeout.
+    """
+    driver = get_driver()
+    idle_time = NETWORK_IDLE_TIME if idle_time is None else idle_time
+    timeout = PAGE_LOAD_TIMEOUT if timeout is None else timeout
+    end_time = time.time() + timeout
+    idle_since = None
+    last_activity = None
+    while True:
+        now = time.time()
+        inflight = _drain_network_events(driver)
+        if inflight is not None:
+            active = sum(1 for started in inflight.values() if now - started < LONG_REQUEST_TIMEOUT)
+            busy = active > max_inflight
+        else:
+            activity = driver.execute_script(PAGE_ACTIVITY_SCRIPT)
+            busy = activity[0] == "loading" or activity != last_activity
+            last_activity = activity
+        if busy:
+            idle_since = None
+        elif idle_since is None:
+            idle_since = now
+        elif now - idle_since >= idle_time:
+            logger.info("Network is idle.")
+            return
+        if now >= end_time:
+            raise TimeoutError(f"Network did not become idle for {idle_time} seconds within {timeout} seconds.")
+        time.sleep(POLL_FREQUENCY)
+
+
+def wait_for_dom_settled(quiet_ms=None, timeout=None, container=None, replace_value=None):
+    """
+    Waits until the DOM has not changed for quiet_ms milliseconds, e.g. after a click that
+    triggers a re-render.
+
+    A MutationObserver is injected once per document and the wait runs in the browser
+    in a single execute_async_script call, so it ends as soon as the UI is stable.
+
+    Args:
+        quiet_ms (int, optional): Mutation-free window in milliseconds. Defaults to dom_settle_ms from config.ini.
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to dom_settle_timeout from
+            config.ini; must stay below the driver's script timeout (30 seconds).
+        container (tuple, optional): Locator of the element to watch instead of the whole document.
+        replace_value (any, optional): An optional value to replace in the container locator. Defaults to None.
+
+    Returns:
+        bool: True if the DOM settled, False if it was still changing when the timeout expired.
+
+    Raises:
+        ValueError: If the timeout is not below the script timeout.
+    """
+    quiet_ms = DOM_SETTLE_MS if quiet_ms is None else quiet_ms
+    timeout = DOM_SETTLE_TIMEOUT if timeout is None else timeout
+    if timeout >= SCRIPT_TIMEOUT:
+        raise ValueError(f"DOM settle timeout ({timeout}s) must stay below the script timeout ({SCRIPT_TIMEOUT}s).")
+    scope = find_element(container, replace_value) if container else None
+    settled = get_driver().execute_async_script(DOM_SETTLED_SCRIPT, quiet_ms, int(timeout * 1000), scope)
+    if not settled:
+        logger.warning(f"DOM was still changing after {timeout} seconds.")
+    return settled
+
+
 def scroll_to_center(locator, shadow_dom=False, replace_value=None):
     """
     Scrolls the specified element to the center of the viewport.
@@ -570,7 +868,7 @@ def scroll_to_center(locator, shadow_dom=False, replace_value=None):
     get_driver().execute_script("arguments[0].scrollIntoView({block: 'center'});", elem)
 
 
-def get_elements_count(locator, shadow_dom=False, replace_value=None):
+def get_elements_count(locator, shadow_dom=False, replace_value=None, bulk=False):
     """
     Returns the count of elements found by the given locator.
 
@@ -585,10 +883,191 @@ def get_elements_count(locator, shadow_dom=False, replace_value=None):
     replace_value : Any, optional
         Optional value used to replace placeholders in the locator prior to searching
         (useful when locators are templates that require runtime values). Defaults to None.
+    bulk : bool, optional
+        If True, count the matches inside the browser without transferring element
+        references. Defaults to False.
 
     Returns
     -------
     int
         The count of elements found by the locator. Returns 0 if no elements are found.
     """
-    return len(find_elements(locator, shadow_dom, replace_value))
\ No newline at end of file
+    if bulk:
+        using, value = _to_script_locator(_format_locator(locator, replace_value))
+        driver = get_driver()
+        deadline = time.monotonic() + get_wait_timeout()
+        while True:
+            count = driver.execute_script(BULK_COUNT_SCRIPT, using, value)
+            if count or time.monotonic() >= deadline:
+                return count
+            time.sleep(POLL_FREQUENCY)
+    return len(find_elements(locator, shadow_dom, replace_value))
+
+# Evaluates several locators in the browser in a single round trip (see query_elements).
+BATCH_QUERY_SCRIPT = """
+const queries = arguments[0];
+const results = {};
+function findAll(using, value) {
+    if (using === 'xpath') {
+        const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    return Array.from(document.querySelectorAll(value));
+}
+for (const [name, query] of Object.entries(queries)) {
+    const elements = findAll(query.using, query.value);
+    const result = {present: elements.length > 0, count: elements.length};
+    for (const field of query.fields) {
+        if (field === 'visible') {
+            result.visible = elements.length > 0 && elements[0].offsetParent !== null;
+        } else if (field === 'text') {
+            result.text = elements.map(e => e.innerText);
+        } else if (field.startsWith('@')) {
+            result[field] = elements.length > 0 ? elements[0].getAttribute(field.slice(1)) : null;
+        }
+    }
+    results[name] = result;
+}
+return results;
+"""
+
+# Resolves once no mutation happened for arguments[0] ms (in the arguments[2] subtree when given),
+# or with false after arguments[1] ms. The observer is installed once per document and remembers
+# the time of the last mutation, so changes made before the call are taken into account.
+DOM_SETTLED_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], scope = arguments[2];
+var done = arguments[arguments.length - 1];
+var state = window.__domSettle;
+if (!state) {
+    state = window.__domSettle = {last: performance.now(), scopes: []};
+    new MutationObserver(function (records) {
+        var now = performance.now();
+        state.last = now;
+        state.scopes = state.scopes.filter(function (s) { return s.el.isConnected; });
+        state.scopes.forEach(function (s) {
+            for (var i = 0; i < records.length; i++) {
+                if (s.el.contains(records[i].target)) { s.last = now; return; }
+            }
+        });
+    }).observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+var tracked = state;
+if (scope) {
+    tracked = null;
+    for (var i = 0; i < state.scopes.length; i++) {
+        if (state.scopes[i].el === scope) { tracked = state.scopes[i]; }
+    }
+    if (!tracked) {
+        tracked = {el: scope, last: performance.now()};
+        state.scopes.push(tracked);
+    }
+}
+var start = performance.now();
+(function check() {
+    var now = performance.now();
+    var quiet = now - tracked.last;
+    if (quiet >= quietMs) { done(true); return; }
+    if (now - start >= timeoutMs) { done(false); return; }
+    setTimeout(check, Math.max(10, Math.min(quietMs - quiet, timeoutMs - (now - start))));
+})();
+"""
+
+# Ready state and number of finished resource loads, compared between polls when CDP events are unavailable
+PAGE_ACTIVITY_SCRIPT = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+# Collects the text of a slice of the matched elements: (using, value, property, normalize, start, limit).
+BULK_TEXT_SCRIPT = """
+const [using, value, property, normalize, start, limit] = arguments;
+let total, itemAt;
+if (using === 'xpath') {
+    const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    total = snapshot.snapshotLength;
+    itemAt = i => snapshot.snapshotItem(i);
+} else {
+    const nodes = document.querySelectorAll(value);
+    total = nodes.length;
+    itemAt = i => nodes[i];
+}
+const texts = [];
+for (let i = start; i < Math.min(total, start + limit); i++) {
+    const text = itemAt(i)[property] || '';
+    texts.push(normalize ? text.replace(/\\n/g, ' ') : text);
+}
+return {total: total, texts: texts};
+"""
+
+# Counts the matched elements without returning element references: (using, value).
+BULK_COUNT_SCRIPT = """
+const [using, value] = arguments;
+if (using === 'xpath') {
+    return document.evaluate('count(' + value + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue;
+}
+return document.querySelectorAll(value).length;
+"""
+
+_QUERY_FIELDS = ("present", "count", "visible", "text")
+
+
+def _to_script_locator(locator):
+    """Translate a Selenium locator into the (using, value) pair understood by the batch scripts."""
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by == By.TAG_NAME:
+        return "css", value
+    raise ValueError(f"Unsupported locator strategy for in-browser queries: {by}")
+
+
+def query_elements(queries, timeout=0, poll_frequency=POLL_FREQUENCY):
+    """
+    Evaluate several locators inside the browser in one execute_script round trip.
+
+    Args:
+        queries (dict): Maps a result name to (locator, fields) or (locator, fields, replace_value).
+            fields is a list of 'present', 'count', 'visible', 'text' and '@<attribute>'.
+        timeout (float, optional): Seconds to keep polling until every locator is present. Defaults to 0.
+        poll_frequency (float, optional): Seconds between polls. Defaults to POLL_FREQUENCY.
+
+    Returns:
+        dict: For each name a dict with 'present' and 'count' plus every requested field:
+            'visible' (bool, first match), 'text' (list of innerText of all matches)
+            and '@<attribute>' (attribute of the first match or None).
+
+    Example:
+        results = query_elements({
+            "sorting": (sorting_options, ["visible"]),
+            "prices": (prices_on_different_days, ["visible", "text"]),
+        })
+        results["prices"]["text"]
+    """
+    payload = {}
+    for name, query in queries.items():
+        locator, fields = query[0], query[1]
+        replace_value = query[2] if len(query) > 2 else None
+        for field in fields:
+            if field not in _QUERY_FIELDS and not field.startswith("@"):
+                raise ValueError(f"Unsupported query field '{field}' for '{name}'")
+        using, value = _to_script_locator(_format_locator(locator, replace_value))
+        payload[name] = {"using": using, "value": value, "fields": list(fields)}
+
+    driver = get_driver()
+    deadline = time.monotonic() + timeout
+    while True:
+        results = driver.execute_script(BATCH_QUERY_SCRIPT, payload)
+        if all(r["present"] for r in results.values()) or time.monotonic() >= deadline:
+            return results
+        time.sleep(poll_frequency)
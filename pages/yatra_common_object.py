@@ -1,10 +1,20 @@
 from helpers.page_helpers import *
 from helpers.webdriver_actions import *
+from helpers.nuisance_suppression import register_nuisance
 from locators.yatra_common_locators import *
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Suppressed in the browser itself when the driver supports CDP (see load_base_url in conftest.py);
+# the close_* functions below remain the fallback for other browsers.
+register_nuisance(
+    "webklipper_notification",
+    hide=["[id^='webklipper-publisher-widget-container']"],
+    remove=["#webklipper-publisher-widget-container-notification-frame"],
+)
+register_nuisance("yatra_login_popup", click=["img[alt='cross']"])
+
 
 def select_yatra_service(service_name):
     """Selects the specified Yatra service tab."""
@@ -12,22 +22,28 @@ def select_yatra_service(service_name):
     click(yatra_services, service_name)
 
 
-def close_yatra_login_popup():
+def close_yatra_login_popup(timeout=5):
     """Closes any initial login popup on the Yatra page if present."""
+    if not is_element_present(yatra_popup_close_button, timeout=timeout):
+        return  # Popup not present; nothing to close
     try:
         logger.info("Closing the Yatra Login Popup")
-        click(yatra_popup_close_button)
+        click(yatra_popup_close_button, max_retries=1)
     except Exception:
-        pass  # Popup not present; nothing to close
+        pass  # Popup disappeared before it could be closed
 
 
-def close_ads_iframe():
+def close_ads_iframe(timeout=5):
     """Closes the ads iframe if present."""
-    implicit_wait(10)
+    if not is_element_present(ads_iframe_img, timeout=timeout):
+        logger.info("No ads iframe found to close.")
+        return
     try:
         logger.info("Switching to ads iframe to close it.")
         iframe_switch(ads_iframe_img)
-        click(ads_iframe_close_btn)
+        click(ads_iframe_close_btn, max_retries=1)
         logger.info("Ads iframe closed successfully.")
     except Exception:
-        logger.info("No ads iframe found to close.")
\ No newline at end of file
+        logger.info("No ads iframe found to close.")
+    finally:
+        iframe_switch_back()
\ No newline at end of file
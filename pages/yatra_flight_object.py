@@ -13,12 +13,10 @@ def select_flight_way(way_type):
 
 
 def navigate_to_date_in_calendar(target_date, days_from_today):
-    """Navigate the calendar to the target date by clicking the next button until the date is visible."""
-    while is_element_not_present(date_input, replace_value=target_date):
-        if days_from_today < 0:
-            click(calendar_prev_button)
-        else:
-            click(calendar_next_button)
+    """Navigate the calendar to the target date with a computed, bounded number of next/previous clicks."""
+    return navigate_calendar_to_date(
+        date_input, target_date, days_from_today, calendar_next_button, calendar_prev_button
+    )
 
 def select_date(days_from_today, journey_type, index):
     """Selects a date based on days from today."""
@@ -28,7 +26,7 @@ def select_date(days_from_today, journey_type, index):
     logger.info("Opening the calendar.")
     selected_date = get_formatted_date_in_days(days_from_today)
     logger.info(f"Selecting the date: {selected_date}")
-    if not is_element_present(date_input, replace_value=selected_date):
+    if not is_element_present(date_input, replace_value=selected_date, timeout=0):
         logger.info(f"Date {selected_date} is not visible, navigating to the month in calendar.")
         navigate_to_date_in_calendar(selected_date, days_from_today)
     if days_from_today < 0:
@@ -93,33 +91,35 @@ def click_search_button():
 
 def is_search_results_displayed_for_one_way():
     """Checks if search results are displayed for one way flights."""
-    prices_on_different_dates = get_elements_text(prices_on_different_days)
-    departure_details = get_elements_text(depart_details_section)
-    arrival_details = get_elements_text(arrival_details_section)
-    logger.info(
-        f"Prices on different days: {[price.replace('\n', ' ') for price in prices_on_different_dates]}, \
-            Departure details: {[departure.replace('\n', ' ') for departure in departure_details]}, \
-            Arrival details: {[arrival.replace('\n', ' ') for arrival in arrival_details]}"
+    results = query_elements(
+        {
+            "sorting": (sorting_options, ["visible"]),
+            "prices": (prices_on_different_days, ["visible", "text"]),
+            "departure": (depart_details_section, ["visible", "text"]),
+            "arrival": (arrival_details_section, ["visible", "text"]),
+        },
+        timeout=get_wait_timeout(),
     )
-    return all(
-        [
-            is_element_displayed(sorting_options),
-            is_element_displayed(prices_on_different_days),
-            is_element_displayed(depart_details_section),
-            is_element_displayed(arrival_details_section),
-        ]
+    prices_on_different_dates = [price.replace("\n", " ") for price in results["prices"]["text"]]
+    departure_details = [departure.replace("\n", " ") for departure in results["departure"]["text"]]
+    arrival_details = [arrival.replace("\n", " ") for arrival in results["arrival"]["text"]]
+    logger.info(
+        f"Prices on different days: {prices_on_different_dates}, \
+            Departure details: {departure_details}, \
+            Arrival details: {arrival_details}"
     )
+    return all(result["visible"] for result in results.values())
 
 
 def is_search_results_displayed_for_round_trip():
     """Checks if search results are displayed for round trip flights."""
     wait_for_element_to_be_visible(round_trip_sorting_by_price, timeout=30)
-    price_based_sorting = get_elements_text(round_trip_sorting_by_price)
-    round_trip_details = get_elements_text(round_trip_details_section)
+    price_based_sorting = get_elements_text(round_trip_sorting_by_price, bulk=True, normalize=True)
+    round_trip_details = get_elements_text(round_trip_details_section, bulk=True, normalize=True)
     logger.info(
-        f"Prices based on value: {[price.replace('\n', ' ') for price in price_based_sorting]}, \
-            Round trip details: {[detail.replace('\n', ' ') for detail in round_trip_details]}, \
-            Number of flights: {len(find_elements(no_of_flights))}"
+        f"Prices based on value: {price_based_sorting}, \
+            Round trip details: {round_trip_details}, \
+            Number of flights: {get_elements_count(no_of_flights, bulk=True)}"
     )
     return all(
         [
@@ -133,7 +133,6 @@ def remove_webklipper_iframe(driver):
     """
     Removes the WebKlipper notification/ad iframe from the page using its fixed ID.
     """
-    implicit_wait(5)
     # Use the specific, unique ID of the iframe
     IFRAME_ID = "webklipper-publisher-widget-container-notification-frame"
 
@@ -198,14 +197,14 @@ def select_airlines(airline):
 def apply_multiple_filters_on_search_results(driver, target_price, airline, msg_no_flight):
     """Applies multiple filters on the search results."""
     click(more_filters)
-    implicit_wait(20)
-    logger.info(f"Setting price filter to: {target_price}")
-    set_price_filter(driver, target_price)
-    logger.info("Selecting departure time range filter: 6AM - 12PM")
-    select_departure_time_range()
-    logger.info(f"Selecting airline filter: {airline}")
-    select_airlines(airline)
-    if is_element_present(filter_no_flight_msg):
+    with wait_timeout(20):
+        logger.info(f"Setting price filter to: {target_price}")
+        set_price_filter(driver, target_price)
+        logger.info("Selecting departure time range filter: 6AM - 12PM")
+        select_departure_time_range()
+        logger.info(f"Selecting airline filter: {airline}")
+        select_airlines(airline)
+    if is_element_present(filter_no_flight_msg, timeout=2):
         assert get_element_text(filter_no_flight_msg) == msg_no_flight
     else:
         click(apply_filter_btn)
@@ -232,10 +231,8 @@ def select_multi_cities(cities_list, journey_type, default_city="Select City"):
 def is_search_results_displayed_for_multi_city():
     """Checks if search results are displayed for multi-city flights."""
     wait_for_element_to_be_visible(multi_city_results_section, timeout=30)
-    multi_city_elements = get_elements_text(multi_city_results_section)
-    logger.info(
-        f"Multi-city search results: {[element.replace('\n', ' ') for element in multi_city_elements]}"
-    )
+    multi_city_elements = get_elements_text(multi_city_results_section, bulk=True, normalize=True)
+    logger.info(f"Multi-city search results: {multi_city_elements}")
     return is_element_displayed(multi_city_results_section)
 
 
@@ -268,7 +265,6 @@ def select_passenger(adult_traveller, infant_traveller):
     wait_for_element_to_be_visible(traveller_filter)
     click(traveller_filter)
     click(adults)
-    implicit_wait(2)
     click(infants)
     wait_for_element_to_be_visible(apply_traveller_btn)
     click(apply_traveller_btn)
@@ -279,5 +275,4 @@ def enter_invalid_city_and_validate_msg(city_name, default_city):
     click(open_flight_input, default_city)
     wait_for_element_to_be_visible(flight_input)
     type_value(flight_input, city_name)
-    implicit_wait(1)
     return is_element_displayed(input_invalid_city)
\ No newline at end of file
@@ -14,19 +14,16 @@ def select_city(driver, city_name):
     click(open_hotel_city)
     wait_for_element_to_be_visible(hotel_city_input)
     type_value(hotel_city_input, city_name)
-    implicit_wait(5)
     wait_for_element_to_be_visible(select_hotel_city_list_dd_container)
     scroll_element_into_view_in_side_bar(driver, select_hotel_city_list_dd_container, city_name_option)
     click(city_name_option)
 
 
 def navigate_to_date_in_calendar(target_date, days_from_today):
-    """Navigate the calendar to the target date by clicking the next button until the date is visible."""
-    while is_element_not_present(select_date_in_calendar, replace_value=target_date):
-        if days_from_today < 0:
-            click(calendar_prev_btn)
-        else:
-            click(calendar_next_btn)
+    """Navigate the calendar to the target date with a computed, bounded number of next/previous clicks."""
+    return navigate_calendar_to_date(
+        select_date_in_calendar, target_date, days_from_today, calendar_next_btn, calendar_prev_btn
+    )
 
 
 def select_date(days_from_today, index):
@@ -35,7 +32,7 @@ def select_date(days_from_today, index):
     logger.info("Opening the calendar.")
     selected_date = get_formatted_date_in_days(days_from_today)
     logger.info(f"Selecting the date: {selected_date}")
-    if not is_element_present(select_date_in_calendar, replace_value=selected_date):
+    if not is_element_present(select_date_in_calendar, replace_value=selected_date, timeout=0):
         logger.info(f"Date {selected_date} is not visible, navigating to the month in calendar.")
         navigate_to_date_in_calendar(selected_date, days_from_today)
     if days_from_today < 0:
@@ -62,9 +59,16 @@ def verify_hotel_search_results_displayed():
     logger.info("Verifying that hotel search results are displayed.")
     wait_for_element_to_be_visible(hotel_search_results_section)
     scroll_element_into_view(hotel_search_results_section)
-    breadcrumb = get_element_text(search_result_breadcrumb)
+    results = query_elements(
+        {
+            "breadcrumb": (search_result_breadcrumb, ["text"]),
+            "available_hotels": (hotel_search_results_section, ["text"]),
+        },
+        timeout=get_wait_timeout(),
+    )
+    breadcrumb = "".join(results["breadcrumb"]["text"][:1])
     logger.info(f"Search Result Breadcrumb: {breadcrumb}")
-    available_hotel_text = get_element_text(hotel_search_results_section)
+    available_hotel_text = "".join(results["available_hotels"]["text"][:1])
     logger.info(f"Available Hotel Options: {available_hotel_text}")
     return "hotel options available" in available_hotel_text.lower() and "Bangalore" in breadcrumb
 
@@ -76,13 +80,16 @@ def apply_complex_filters_on_hotel_search(driver, localities, theme):
     theme_elem = (hotel_filter_option[0], hotel_filter_option[1].format(theme))
     scroll_element_into_view_in_side_bar(driver, filters_side_panel, star_5_rating_filter_option)
     click(star_5_rating_filter_option)
-    if is_element_present(localities_elem) is False:
+    wait_for_dom_settled(container=filters_side_panel)
+    if is_element_present(localities_elem, timeout=2) is False:
         scroll_element_into_view_in_side_bar(driver, filters_side_panel, localities_show_more_btn)
         click(localities_show_more_btn)
     scroll_element_into_view_in_side_bar(driver, filters_side_panel, localities_elem)
     click(localities_elem)
+    wait_for_dom_settled(container=filters_side_panel)
     scroll_element_into_view_in_side_bar(driver, filters_side_panel, theme_elem)
     click(theme_elem)
+    wait_for_dom_settled()
 
 
 def verify_applied_filters_on_hotel_search(driver, expected_filters):
@@ -90,7 +97,8 @@ def verify_applied_filters_on_hotel_search(driver, expected_filters):
     logger.info("Verifying the applied filters on hotel search results.")
     wait_for_element_to_be_visible(applied_filters_section)
     scroll_element_into_view_in_side_bar(driver, filters_side_panel, applied_filters_section)
-    applied_filters = get_elements_text(applied_filters_section)
+    # innerText keeps the chips' padding whitespace and line breaks, unlike WebElement.text
+    applied_filters = [text.strip() for text in get_elements_text(applied_filters_section, bulk=True, normalize=True)]
     logger.info(f"Applied Filters: {applied_filters}")
     for expected_filter in expected_filters:
         if expected_filter not in applied_filters:
@@ -114,7 +122,6 @@ def verify_the_invalid_city_search(city_name):
     click(open_hotel_city)
     wait_for_element_to_be_visible(hotel_city_input)
     type_value(hotel_city_input, city_name)
-    implicit_wait(5)
     wait_for_element_to_be_visible(invalid_city_search_with_empty_list)
     is_empty_list_displayed = is_element_present(invalid_city_search_with_empty_list)
     logger.info(f"Is invalid city search with empty list displayed: {is_empty_list_displayed}")
@@ -129,6 +136,7 @@ def select_the_search_with_max_room(driver, rooms_to_add, guests_per_room):
     for room in range(1, rooms_to_add + 1, 2):
         if room > 1:
             click(add_room_button)
+            wait_for_dom_settled(container=room_and_guests_popup)
             logger.info(f"Added room with Index:: {room}")
         adults = guests_per_room.get(str(room))
         if adults:
@@ -137,6 +145,7 @@ def select_the_search_with_max_room(driver, rooms_to_add, guests_per_room):
             click(select_adults_elem)
             logger.info(f"Selected {adults} adults for room index {room}.")
     click(apply_room_and_guest_button)
+    wait_for_dom_settled()
     logger.info("Applied room and guest selection.")
     actual_room_and_guests_info = get_element_text(selected_room_and_guests_info)
     logger.info(f"Selected Room and Guests Info: {actual_room_and_guests_info}")
@@ -148,10 +157,11 @@ def remove_room_and_guest_selection():
     logger.info("Removing all room except one default room from the room and guest selection.")
     click(open_room_and_guests_btn)
     wait_for_element_to_be_visible(room_and_guests_popup)
-    remove_btn_count = get_elements_count(remove_room_button)
+    remove_btn_count = get_elements_count(remove_room_button, bulk=True)
     if remove_btn_count > 0:
         for _ in range(remove_btn_count):
             click(remove_room_button)
+            wait_for_dom_settled(container=room_and_guests_popup)
     logger.info("All Room Removed Except Default One")
     click(apply_room_and_guest_button)
     logger.info("Applied room and guest selection after removal.")
@@ -171,7 +181,6 @@ def choose_room_and_get_the_rent_on_review_page(remove_coupan=False):
     """Chooses a room and return the rent on the review page."""
     logger.info("Choosing a room and get the rent on review page.")
     click(choose_room_btn)
-    implicit_wait(5)
     switch_to_new_tab()
     wait_until_page_ready()
     click(book_this_room_btn)
@@ -179,6 +188,7 @@ def choose_room_and_get_the_rent_on_review_page(remove_coupan=False):
         logger.info("Removing applied coupon before getting the rent.")
         scroll_to_center(remove_coupan_btn)
         click(remove_coupan_btn)
+        wait_for_dom_settled()
     wait_for_element_to_be_visible(total_room_rent)
     room_rent_on_review_page = get_element_attribute(total_room_rent, "aria-label").split("Total Amount-")[1].strip()
     logger.info(f"Room Rent on Review Page: {room_rent_on_review_page}")
@@ -208,6 +218,7 @@ def apply_coupan_and_get_discount_on_review_page():
     logger.info("Applying coupon on review page.")
     scroll_to_center(select_coupan_btn)
     click(select_coupan_btn)
+    wait_for_dom_settled()
     wait_for_element_to_be_visible(coupan_discount)
     discount_amount = get_element_text(coupan_discount)[6:].strip()
     logger.info(f"Discount Amount: {discount_amount}")
@@ -1,3 +1,4 @@
+import json
 import ollama
 import re
 import logging
@@ -13,13 +14,28 @@ class OllamaHealer:
         clean_html = re.sub(
             r"<(script|style).*?>.*?</\1>", "", page_source, flags=re.DOTALL
         )
+        # Truncate to stay within context limits
+        return self._generate(failed_locator, element_description, "Analyze this HTML snippet", clean_html[:15000])
 
+    def get_healed_locator_from_dom(self, failed_locator, dom_summary, element_description):
+        """
+        Heal from a distilled page (see dom_distiller.distill_dom): one element per line as
+        <tag attribute="value" ... label="..." text="..."> in <ancestry path>, most relevant first.
+        """
+        return self._generate(
+            failed_locator,
+            element_description,
+            "Analyze these page elements (one per line, most relevant first, 'in' gives the ancestor path)",
+            dom_summary,
+        )
+
+    def _generate(self, failed_locator, element_description, context_intro, context):
         prompt = f"""
         You are a Selenium Expert. A test failed because the locator '{failed_locator}' was not found.
         The element is described as: '{element_description}'.
         
-        Analyze this HTML snippet and find the most likely new XPath for this element:
-        {clean_html[:15000]}  # Truncate to stay within context limits
+        {context_intro} and find the most likely new XPath for this element:
+        {context}
 
         Rules for XPath Generation:
             1. Use 'normalize-space()' for all text comparisons to handle hidden spaces and newlines. 
@@ -35,18 +51,53 @@ class OllamaHealer:
         logger.info(f"Ollama raw XPath response: {raw_xpath}")
         return raw_xpath
 
+    def get_healed_locators_batch(self, failures, dom_summary):
         """
-        # SANITIZATION STEP:
-        # Remove markdown code blocks (```xpath ... ```)
-        clean_xpath = re.sub(r"```[a-z]*\n?", "", raw_xpath)
-        # Remove all backticks, quotes, and newlines
-        clean_xpath = (
-            clean_xpath.replace("`", "")
-            .replace('"', "")
-            .replace("'", "")
-            .replace("\n", "")
-            .strip()
+        Heal several broken locators of the same page with one generation.
+
+        Args:
+            failures (dict): name -> (failed_locator, element_description).
+            dom_summary (str): Distilled page (see dom_distiller.distill_dom).
+
+        Returns:
+            dict: name -> new XPath, for the names the model answered.
+        """
+        listed = "\n".join(
+            f"- {name}: locator '{failed_locator}', described as '{description}'"
+            for name, (failed_locator, description) in failures.items()
         )
+        prompt = f"""
+        You are a Selenium Expert. These locators were not found on the page:
+        {listed}
+
+        Analyze these page elements (one per line, most relevant first, 'in' gives the ancestor path)
+        and find the most likely new XPath for each of them:
+        {dom_summary}
+
+        Rules for XPath Generation:
+            1. Use 'normalize-space()' for all text comparisons to handle hidden spaces and newlines. 
+               Example: //button[contains(normalize-space(), 'Login')]
+            2. Avoid using exact text matches like text()='Value'.
+            3. If the element has a stable attribute like @type or @name, combine it with the text.
+            4. Return ONLY a JSON object mapping each name above to its XPath string. No explanations.
         """
-        #logger.info(f"Ollama cleaned XPath: {clean_xpath}")
-        
+
+        response = ollama.generate(model=self.model, prompt=prompt, format="json")
+        raw_answer = response["response"].strip()
+        logger.info(f"Ollama raw batch response: {raw_answer}")
+        try:
+            answer = json.loads(raw_answer)
+        except json.JSONDecodeError:
+            answer = None
+        if not isinstance(answer, dict):
+            logger.warning("Ollama batch response is not a JSON object, healing the locators one by one.")
+            healed = {
+                name: self.get_healed_locator_from_dom(failed_locator, dom_summary, description)
+                for name, (failed_locator, description) in failures.items()
+            }
+            return {name: xpath for name, xpath in healed.items() if xpath}
+        return {
+            name: xpath.strip()
+            for name, xpath in answer.items()
+            if name in failures and isinstance(xpath, str) and xpath.strip()
+        }
@@ -0,0 +1,165 @@
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of elements extracted from very large pages
+MAX_CANDIDATES = 3000
+# Rough prompt budget for the distilled page (about 4 characters per token)
+DEFAULT_TOKEN_BUDGET = 3000
+CHARS_PER_TOKEN = 4
+
+# Words that say nothing about which element is meant
+_STOPWORDS = {
+    "the", "a", "an", "of", "to", "and", "or", "for", "on", "in", "with",
+    "element", "field", "xpath", "contains", "normalize", "space", "text",
+}
+
+# Runs in the browser and returns only interactive and labelled elements with their stable
+# attributes, label, visibility and a short ancestry path, in document order.
+DISTILL_DOM_SCRIPT = """
+var maxCandidates = arguments[0];
+var INTERACTIVE = {A: 1, BUTTON: 1, INPUT: 1, SELECT: 1, TEXTAREA: 1, LABEL: 1, SUMMARY: 1};
+var SKIPPED = {SCRIPT: 1, STYLE: 1, NOSCRIPT: 1, TEMPLATE: 1, META: 1, LINK: 1};
+var ATTRS = ['id', 'name', 'type', 'placeholder', 'aria-label', 'title', 'role', 'alt', 'for', 'value',
+             'href', 'data-testid', 'data-test', 'data-qa'];
+function clean(text, limit) { return (text || '').replace(/\\s+/g, ' ').trim().slice(0, limit); }
+function ownText(el) {
+    var text = '';
+    for (var node = el.firstChild; node; node = node.nextSibling) {
+        if (node.nodeType === 3) { text += node.nodeValue; }
+    }
+    return clean(text, 80);
+}
+function classes(el) {
+    return typeof el.className === 'string' ? el.className.trim().split(/\\s+/).filter(Boolean).slice(0, 3) : [];
+}
+function short(el) {
+    var name = el.tagName.toLowerCase();
+    if (el.id) { return name + '#' + el.id; }
+    var cls = classes(el);
+    return cls.length ? name + '.' + cls.slice(0, 2).join('.') : name;
+}
+function ancestry(el) {
+    var parts = [];
+    for (var p = el.parentElement; p && p !== document.body && parts.length < 4; p = p.parentElement) {
+        parts.unshift(short(p));
+    }
+    return parts.join(' > ');
+}
+function labelOf(el) {
+    var label = null;
+    if (el.id) {
+        try { label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]'); } catch (e) { label = null; }
+    }
+    label = label || (el.closest && el.closest('label'));
+    return label && label !== el ? clean(label.textContent, 60) : '';
+}
+var out = [];
+var all = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < all.length && out.length < maxCandidates; i++) {
+    var el = all[i];
+    var tag = el.tagName.toUpperCase();
+    if (SKIPPED[tag]) { continue; }
+    var interactive = !!(INTERACTIVE[tag] || el.hasAttribute('role') || el.hasAttribute('onclick')
+        || el.isContentEditable || el.hasAttribute('tabindex'));
+    var text = ownText(el);
+    var labelled = el.hasAttribute('aria-label') || el.hasAttribute('data-testid') || el.hasAttribute('title')
+        || el.hasAttribute('alt') || el.hasAttribute('placeholder');
+    if (!interactive && !labelled && !(text && (el.id || /^H[1-6]$/.test(tag)))) { continue; }
+    var attrs = {};
+    for (var a = 0; a < ATTRS.length; a++) {
+        var value = el.getAttribute(ATTRS[a]);
+        if (value) { attrs[ATTRS[a]] = value.slice(0, 100); }
+    }
+    var cls = classes(el);
+    if (cls.length) { attrs['class'] = cls.join(' '); }
+    if (!text && interactive) { text = clean(el.innerText, 80); }
+    var rect = el.getBoundingClientRect();
+    out.push({
+        tag: tag.toLowerCase(),
+        attrs: attrs,
+        text: text,
+        label: INTERACTIVE[tag] ? labelOf(el) : '',
+        path: ancestry(el),
+        visible: rect.width > 0 && rect.height > 0,
+        interactive: interactive
+    });
+}
+return out;
+"""
+
+
+def _terms(*texts):
+    terms = set()
+    for text in texts:
+        for term in re.findall(r"[a-z0-9]+", (text or "").lower()):
+            if len(term) > 1 and term not in _STOPWORDS:
+                terms.add(term)
+    return terms
+
+
+def score_candidate(candidate, terms):
+    """Relevance of an extracted element to the searched terms (higher is better)."""
+    attrs = candidate["attrs"]
+    visible_terms = _terms(candidate["text"], candidate["label"], attrs.get("aria-label"), attrs.get("placeholder"), attrs.get("title"))
+    attribute_terms = _terms(*attrs.values())
+    score = 3 * len(terms & visible_terms) + 2 * len(terms & attribute_terms)
+    if candidate["tag"] in terms:
+        score += 1
+    if candidate["visible"]:
+        score += 1
+    if candidate["interactive"]:
+        score += 0.5
+    return score
+
+
+def format_candidate(candidate):
+    """Compact one-line representation, e.g. <input id="username" type="text" label="Username"> in form#login."""
+    parts = [candidate["tag"]]
+    parts.extend(f'{name}={json.dumps(value)}' for name, value in candidate["attrs"].items())
+    if candidate["label"]:
+        parts.append(f'label={json.dumps(candidate["label"])}')
+    if candidate["text"]:
+        parts.append(f'text={json.dumps(candidate["text"])}')
+    if not candidate["visible"]:
+        parts.append("hidden")
+    line = f"<{' '.join(parts)}>"
+    return f"{line} in {candidate['path']}" if candidate["path"] else line
+
+
+def rank_candidates(candidates, description, failed_locator=""):
+    """Sort the extracted elements by relevance to the description and the failed locator (stable)."""
+    terms = _terms(description, failed_locator)
+    return sorted(candidates, key=lambda candidate: score_candidate(candidate, terms), reverse=True)
+
+
+def distill_dom(driver, description, failed_locator="", token_budget=DEFAULT_TOKEN_BUDGET):
+    """
+    Build a compact, relevance-ranked description of the current page for the healer.
+
+    The extraction runs in the browser in one execute_script call, so neither the full
+    page source nor a regex over it is needed.
+
+    Args:
+        driver: WebDriver instance.
+        description (str): Description of the element being healed.
+        failed_locator (str, optional): The locator value that failed.
+        token_budget (int, optional): Approximate token budget of the result.
+
+    Returns:
+        str: One element per line, most relevant first.
+    """
+    candidates = driver.execute_script(DISTILL_DOM_SCRIPT, MAX_CANDIDATES) or []
+    budget = token_budget * CHARS_PER_TOKEN
+    lines = []
+    used = 0
+    for candidate in rank_candidates(candidates, description, failed_locator):
+        line = format_candidate(candidate)
+        if used + len(line) + 1 > budget:
+            break
+        lines.append(line)
+        used += len(line) + 1
+    logger.info(f"Distilled {len(candidates)} page elements into {len(lines)} lines (~{used // CHARS_PER_TOKEN} tokens).")
+    return "\n".join(lines)
@@ -0,0 +1,170 @@
+import logging
+
+from self_healing_agent.locator_store_helper import get_locator_store
+
+logger = logging.getLogger(__name__)
+
+# A match is accepted without the LLM when it scores at least ACCEPT_SCORE (0..1)
+# and beats the runner-up by MIN_MARGIN; anything else is escalated.
+ACCEPT_SCORE = 0.75
+MIN_MARGIN = 0.15
+# Fingerprint attributes that identify the element; classes, text and position change with
+# state (toggled classes, live counters, re-layouts) and do not justify rewriting a fingerprint
+STABLE_ATTRIBUTES = ("tag", "id", "name", "type", "label", "placeholder", "aria_label")
+
+# Attribute fingerprint of arguments[0]; position is rounded so re-layouts do not rewrite it
+FINGERPRINT_SCRIPT = """
+var el = arguments[0];
+function clean(text, limit) { return (text || '').replace(/\\s+/g, ' ').trim().slice(0, limit); }
+var label = null;
+if (el.id) {
+    try { label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]'); } catch (e) { label = null; }
+}
+label = label || el.closest('label');
+var rect = el.getBoundingClientRect();
+return {
+    tag: el.tagName.toLowerCase(),
+    id: el.id || '',
+    name: el.getAttribute('name') || '',
+    type: el.getAttribute('type') || '',
+    classes: typeof el.className === 'string' ? el.className.trim().split(/\\s+/).filter(Boolean) : [],
+    text: clean(el.innerText || el.value, 80),
+    label: label && label !== el ? clean(label.textContent, 60) : '',
+    placeholder: el.getAttribute('placeholder') || '',
+    aria_label: el.getAttribute('aria-label') || '',
+    x: Math.round((rect.left + window.scrollX) / 10) * 10,
+    y: Math.round((rect.top + window.scrollY) / 10) * 10
+};
+"""
+
+# Scores every element of the page against the fingerprint arguments[0] in one pass and returns
+# the best two as [{element, score, xpath, absolute}], best first; absolute marks a positional
+# XPath (no unique id, name or text). Weights only count attributes the fingerprint has, so
+# scores stay comparable between sparse and rich elements. Labels are only looked up for
+# elements of the fingerprint's tag, the querySelector per element being the costly part.
+MATCH_FINGERPRINT_SCRIPT = """
+var fp = arguments[0];
+function clean(text, limit) { return (text || '').replace(/\\s+/g, ' ').trim().slice(0, limit); }
+function jaccard(a, b) {
+    if (!a.length && !b.length) { return 1; }
+    var shared = a.filter(function (x) { return b.indexOf(x) >= 0; }).length;
+    return shared / (a.length + b.length - shared);
+}
+function xpathLiteral(value) {
+    if (value.indexOf("'") < 0) { return "'" + value + "'"; }
+    if (value.indexOf('"') < 0) { return '"' + value + '"'; }
+    return "concat('" + value.split("'").join("', \\"'\\", '") + "')";
+}
+function unique(xpath) {
+    return document.evaluate('count(' + xpath + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue === 1;
+}
+function xpathFor(el) {
+    var tag = el.tagName.toLowerCase();
+    var candidates = [];
+    if (el.id) { candidates.push('//' + tag + '[@id=' + xpathLiteral(el.id) + ']'); }
+    if (el.getAttribute('name')) { candidates.push('//' + tag + '[@name=' + xpathLiteral(el.getAttribute('name')) + ']'); }
+    var text = clean(el.innerText, 60);
+    if (text) { candidates.push('//' + tag + '[normalize-space()=' + xpathLiteral(text) + ']'); }
+    for (var c = 0; c < candidates.length; c++) {
+        try { if (unique(candidates[c])) { return {xpath: candidates[c], absolute: false}; } } catch (e) { /* try the next form */ }
+    }
+    var parts = [];
+    for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+        var index = 1;
+        for (var sib = node.previousElementSibling; sib; sib = sib.previousElementSibling) {
+            if (sib.tagName === node.tagName) { index++; }
+        }
+        parts.unshift(node.tagName.toLowerCase() + '[' + index + ']');
+    }
+    return {xpath: '/' + parts.join('/'), absolute: true};
+}
+var weights = {tag: 1, id: 3, name: 2, type: 1, classes: 2, text: 3, label: 2, placeholder: 1, aria_label: 2, position: 1};
+var best = [];
+var score, total;
+function add(key, similarity) { total += weights[key]; score += weights[key] * similarity; }
+var all = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < all.length; i++) {
+    var el = all[i];
+    var rect = el.getBoundingClientRect();
+    if (rect.width === 0 && rect.height === 0) { continue; }
+    score = 0;
+    total = 0;
+    var sameTag = el.tagName.toLowerCase() === fp.tag;
+    add('tag', sameTag ? 1 : 0);
+    if (fp.id) { add('id', el.id === fp.id ? 1 : 0); }
+    if (fp.name) { add('name', el.getAttribute('name') === fp.name ? 1 : 0); }
+    if (fp.type) { add('type', el.getAttribute('type') === fp.type ? 1 : 0); }
+    if (fp.classes.length) {
+        add('classes', jaccard(fp.classes, typeof el.className === 'string' ? el.className.trim().split(/\\s+/).filter(Boolean) : []));
+    }
+    if (fp.text) { add('text', clean(el.innerText || el.value, 80) === fp.text ? 1 : 0); }
+    if (fp.label) {
+        var label = null;
+        if (sameTag) {
+            label = el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null;
+            label = label || el.closest('label');
+        }
+        add('label', label && clean(label.textContent, 60) === fp.label ? 1 : 0);
+    }
+    if (fp.placeholder) { add('placeholder', el.getAttribute('placeholder') === fp.placeholder ? 1 : 0); }
+    if (fp.aria_label) { add('aria_label', el.getAttribute('aria-label') === fp.aria_label ? 1 : 0); }
+    var distance = Math.abs(rect.left + window.scrollX - fp.x) + Math.abs(rect.top + window.scrollY - fp.y);
+    add('position', Math.max(0, 1 - distance / 500));
+    var entry = {element: el, score: score / total};
+    if (!best[0] || entry.score > best[0].score) { best.unshift(entry); }
+    else if (!best[1] || entry.score > best[1].score) { best[1] = entry; }
+    best.length = Math.min(best.length, 2);
+}
+if (best[0]) {
+    var located = xpathFor(best[0].element);
+    best[0].xpath = located.xpath;
+    best[0].absolute = located.absolute;
+}
+return best;
+"""
+
+
+class FingerprintHealer:
+    """
+    Local healing tier: remembers an attribute fingerprint of every element a locator
+    resolved to, and on failure finds the most similar element of the current page
+    in a single in-browser pass. Only ambiguous matches need the LLM.
+    """
+
+    def __init__(self, filepath="self_healing_agent/locator_fingerprints.json"):
+        self.store = get_locator_store(filepath)
+
+    def record(self, driver, key, element, replace=False):
+        """
+        Store the fingerprint of the element the locator key resolved to.
+
+        Without replace, a locator that already has a fingerprint costs no browser round trip,
+        so successful lookups stay cheap. With replace (after a heal), the stored fingerprint
+        is rewritten only when a stable attribute of the element changed.
+        """
+        stored = self.store.get_fix(key)
+        if stored is not None and not replace:
+            return
+        fingerprint = driver.execute_script(FINGERPRINT_SCRIPT, element)
+        if stored is not None and all(stored.get(name) == fingerprint.get(name) for name in STABLE_ATTRIBUTES):
+            return
+        self.store.save_fix(key, fingerprint)
+
+    def heal(self, driver, key):
+        """
+        Returns (element, xpath, score, absolute) of a confident match for the locator key, or
+        None when there is no fingerprint or the best match is ambiguous. absolute is True when
+        the XPath is only positional, which breaks with the next layout change.
+        """
+        fingerprint = self.store.get_fix(key)
+        if not fingerprint:
+            return None
+        matches = driver.execute_script(MATCH_FINGERPRINT_SCRIPT, fingerprint) or []
+        if not matches:
+            return None
+        best = matches[0]
+        runner_up = matches[1]["score"] if len(matches) > 1 else 0.0
+        logger.info(f"Fingerprint match for {key}: score {best['score']:.2f}, runner-up {runner_up:.2f}")
+        if best["score"] < ACCEPT_SCORE or best["score"] - runner_up < MIN_MARGIN:
+            return None
+        return best["element"], best["xpath"], best["score"], best.get("absolute", False)
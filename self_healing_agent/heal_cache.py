@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from helpers.driver_resolver import FileLock
+
+logger = logging.getLogger(__name__)
+
+HEAL_CACHE_DIR = "self_healing_agent/.heal_cache"
+# Heal results older than this are asked again
+HEAL_CACHE_TTL = 7 * 24 * 3600
+# Entries kept in memory and on disk (least recently used are evicted first)
+HEAL_CACHE_MAX_ENTRIES = 500
+# Longest time a worker waits for another worker's model call on the same key
+SINGLE_FLIGHT_TIMEOUT = 180
+# Age after which a single-flight lock is taken to be left behind by a dead worker; longer than
+# the wait, so a worker still asking the model never has its lock broken by a waiting one
+SINGLE_FLIGHT_STALE_AFTER = 2 * SINGLE_FLIGHT_TIMEOUT
+
+# Path segments that vary between pages of the same kind (ids, hashes, dates)
+_VARIABLE_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8,}|[0-9a-f-]{36}|\d{4}-\d{2}-\d{2})$", re.IGNORECASE)
+
+# FNV-1a hash of the page structure: tag, id, name and type of the interactive and landmark
+# elements, which change with a redesign but not with the data shown on the page.
+DOM_SIGNATURE_SCRIPT = """
+var STRUCTURAL = {A: 1, BUTTON: 1, INPUT: 1, SELECT: 1, TEXTAREA: 1, LABEL: 1, FORM: 1, IFRAME: 1,
+                  NAV: 1, HEADER: 1, FOOTER: 1, MAIN: 1, SECTION: 1, H1: 1, H2: 1, H3: 1};
+var hash = 0x811c9dc5;
+var all = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < all.length; i++) {
+    var el = all[i];
+    if (!STRUCTURAL[el.tagName.toUpperCase()]) { continue; }
+    var token = el.tagName + '#' + (el.id || '') + '@' + (el.getAttribute('name') || '') + ':' + (el.getAttribute('type') || '') + ';';
+    for (var c = 0; c < token.length; c++) {
+        hash ^= token.charCodeAt(c);
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+}
+return hash.toString(16);
+"""
+
+
+def url_pattern(url):
+    """Host and path of a URL with variable segments replaced by '*' (query and fragment dropped)."""
+    parts = urlsplit(url)
+    segments = ["*" if _VARIABLE_SEGMENT.match(segment) else segment for segment in parts.path.split("/")]
+    return f"{parts.netloc.lower()}{'/'.join(segments)}"
+
+
+def page_key(driver):
+    """(URL pattern, DOM structural hash) of the current page."""
+    return url_pattern(driver.current_url), driver.execute_script(DOM_SIGNATURE_SCRIPT)
+
+
+class HealCache:
+    """
+    Heal results keyed by (locator, page URL pattern, DOM structural hash), shared by all
+    workers through files under cache_dir, with TTL expiry and LRU eviction.
+
+    get_or_compute() is single-flight across processes: the first worker that misses takes
+    a per-key file lock and asks the model, the others wait for the lock and read its answer.
+
+    Every hit touches the entry's file, so eviction drops the entries least recently used by
+    any worker. The in-memory copy of an entry is only used while its file is unchanged, so
+    invalidations and new results of other workers are seen.
+    """
+
+    def __init__(self, cache_dir=HEAL_CACHE_DIR, ttl=HEAL_CACHE_TTL, max_entries=HEAL_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "computed": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _digest(key):
+        return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _read(self, digest):
+        path = self._path(digest)
+        try:
+            # The inode changes when a worker replaces the entry, touching it on a hit keeps it
+            file_id = os.stat(path).st_ino
+        except FileNotFoundError:
+            self._memory.pop(digest, None)
+            return None
+        cached = self._memory.get(digest)
+        if cached and cached[1] == file_id:
+            entry = cached[0]
+        else:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                return None
+        if time.time() - entry["created"] > self.ttl:
+            self._remove(digest)
+            return None
+        self._remember(digest, entry, file_id)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return entry
+
+    def _remember(self, digest, entry, file_id):
+        self._memory[digest] = (entry, file_id)
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _remove(self, digest):
+        self._memory.pop(digest, None)
+        try:
+            os.remove(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key):
+        """Returns the cached heal result of key, or None."""
+        entry = self._read(self._digest(key))
+        self.stats["hits" if entry else "misses"] += 1
+        return entry["value"] if entry else None
+
+    def put(self, key, value):
+        digest = self._digest(key)
+        entry = {"key": key, "value": value, "created": time.time()}
+        tmp_path = f"{self._path(digest)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(digest))
+        self._remember(digest, entry, os.stat(self._path(digest)).st_ino)
+        self._evict()
+
+    def invalidate(self, key):
+        """Forget a result that turned out to be wrong."""
+        self._remove(self._digest(key))
+
+    def _evict(self):
+        entries = [name for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+        if len(entries) <= self.max_entries:
+            return
+        paths = sorted((os.path.join(self.cache_dir, name) for name in entries), key=os.path.getmtime)
+        for path in paths[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached result of key, or computes it with compute() exactly once across
+        all workers and caches it. Results that are None or empty are not cached.
+        """
+        value = self.get(key)
+        if value:
+            return value
+        digest = self._digest(key)
+        lock = FileLock(
+            os.path.join(self.cache_dir, f"{digest}.lock"),
+            timeout=SINGLE_FLIGHT_TIMEOUT,
+            stale_after=SINGLE_FLIGHT_STALE_AFTER,
+        )
+        try:
+            lock.acquire()
+        except TimeoutError as e:
+            logger.warning(f"{e} Computing the heal result without waiting for the other worker.")
+            return self._compute(key, compute)
+        try:
+            # Another worker may have computed it while we waited for the lock
+            entry = self._read(digest)
+            if entry:
+                logger.info("Heal result computed by another worker reused.")
+                return entry["value"]
+            return self._compute(key, compute)
+        finally:
+            lock.release()
+
+    def _compute(self, key, compute):
+        value = compute()
+        self.stats["computed"] += 1
+        if value:
+            self.put(key, value)
+        return value
+
+
+_heal_cache = None
+
+
+def get_heal_cache():
+    """Returns the process-wide HealCache."""
+    global _heal_cache
+    if _heal_cache is None:
+        _heal_cache = HealCache()
+    return _heal_cache
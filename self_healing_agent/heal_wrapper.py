@@ -1,61 +1,256 @@
 from selenium.webdriver.common.by import By
-from self_healing_agent.locator_store_helper import LocatorStore
-from helpers.webdriver_actions import find_element
+from self_healing_agent.locator_store_helper import get_locator_store
+from helpers.webdriver_actions import find_element, find_elements, get_wait_timeout, POLL_FREQUENCY
 from selenium.common.exceptions import (
     NoSuchElementException,
     ElementNotVisibleException,
     InvalidSelectorException,
+    WebDriverException,
 )
 from self_healing_agent.ai_healing import OllamaHealer
+from self_healing_agent.dom_distiller import distill_dom
+from self_healing_agent.fingerprint_healer import FingerprintHealer
+from self_healing_agent.heal_cache import get_heal_cache, page_key
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
+# Locator strategies of selenium's By (e.g. "xpath", "css selector")
+LOCATOR_STRATEGIES = {value for name, value in vars(By).items() if name.isupper() and isinstance(value, str)}
+
+
+def collect_locators(locator_module, names=None):
+    """
+    Returns the (strategy, value) locators defined in a locators.* module, by variable name.
+
+    Args:
+        locator_module (module): E.g. locators.herokuapp_login_locators.
+        names (iterable, optional): Only these locators (those expected on the current page).
+    """
+    return {
+        name: value
+        for name, value in vars(locator_module).items()
+        if not name.startswith("_")
+        and isinstance(value, tuple)
+        and len(value) == 2
+        and value[0] in LOCATOR_STRATEGIES
+        and (names is None or name in names)
+    }
+
 
 class SmartDriver:
     def __init__(self, driver):
         self.driver = driver
         self.healer = OllamaHealer()
-        self.store = LocatorStore()
+        self.store = get_locator_store()
+        self.fingerprints = FingerprintHealer()
+        self.heal_cache = get_heal_cache()
+
+    def _page_key(self):
+        """(URL pattern, DOM structural hash) of the current page, part of every heal cache key."""
+        try:
+            return list(page_key(self.driver))
+        except WebDriverException as e:
+            logger.warning(f"Could not compute the page signature ({e.msg}); heal results are cached by locator only.")
+            return ["", ""]
+
+    def _record_fingerprint(self, key, element, replace=False):
+        try:
+            self.fingerprints.record(self.driver, key, element, replace)
+        except WebDriverException as e:
+            logger.warning(f"Could not record fingerprint for: {key} ({e.msg})")
+
+    def _heal_locally(self, broken_value, fingerprint_key):
+        """Try the stored fix, then the fingerprint match; returns the element or None."""
+        # First, check if we have a stored fix
+        healed_locator = self.store.get_fix(broken_value)
+        if healed_locator:
+            logger.info(f"Using stored healed locator for: {broken_value}")
+            healed_locator_tuple = (By.XPATH, healed_locator)
+            try:
+                element = find_element(healed_locator_tuple)
+                self._record_fingerprint(fingerprint_key, element)
+                return element
+            except (NoSuchElementException, ElementNotVisibleException, InvalidSelectorException):
+                logger.warning(
+                    f"Stored healed locator failed for: {broken_value}. Proceeding with AI healing..."
+                )
+        else:
+            logger.info(f"No cached fix found for: {broken_value}")
+
+        # Then look for the element most similar to the one the locator used to find
+        try:
+            match = self.fingerprints.heal(self.driver, fingerprint_key)
+        except WebDriverException as e:
+            logger.warning(f"Fingerprint healing failed for: {broken_value} ({e.msg})")
+            match = None
+        if match:
+            element, new_xpath, score, absolute = match
+            logger.info(f"Healed {broken_value} locally by fingerprint (score {score:.2f}) -> {new_xpath}")
+            if absolute:
+                # A positional XPath only holds for this layout: match the fingerprint again next time
+                logger.info(f"Not storing positional XPath as a fix for: {broken_value}")
+            else:
+                self.store.save_fix(broken_value, new_xpath)
+            return element
+        return None
 
     def find_element_smart(self, locator, value=None, description=""):
+        fingerprint_key = locator[1] if value is None else f"{locator[1]}::{value}"
         try:
-            return find_element(locator, value)
+            element = find_element(locator, value)
+            self._record_fingerprint(fingerprint_key, element)
+            return element
         except (NoSuchElementException, ElementNotVisibleException):
-            # First, check if we have a stored fix
             broken_value = locator[1]
-            healed_locator = self.store.get_fix(broken_value)
-            if healed_locator:
-                logger.info(f"Using stored healed locator for: {broken_value}")
-                healed_locator_tuple = (By.XPATH, healed_locator)
-                try:
-                    return find_element(healed_locator_tuple)
-                except (NoSuchElementException, ElementNotVisibleException, InvalidSelectorException):
-                    logger.warning(
-                        f"Stored healed locator failed for: {broken_value}. Proceeding with AI healing..."
-                    )
-            else:
-                logger.info(f"No cached fix found for: {broken_value}")
-
-            # If no stored fix, use AI to suggest a new locator
-            logger.info(
-                f"⚠️ No cache found for '{broken_value}'. Healing with Ollama..."
-            )
-            page_source = self.driver.page_source
+            element = self._heal_locally(broken_value, fingerprint_key)
+            if element is not None:
+                return element
 
-            # Get new locator from AI healer
-            new_xpath = self.healer.get_healed_locator(
-                broken_value, page_source, description
+            # If no stored fix, use AI to suggest a new locator (once for all workers hitting the same page)
+            heal_key = [broken_value, *self._page_key()]
+            new_xpath = self.heal_cache.get_or_compute(
+                heal_key, lambda: self._ask_ollama(broken_value, description)
             )
             
             #formatted_xpath = f'"{new_xpath}"'
-            # Save the new locator for future use
-            logger.info(f"Saving healed locator for: {broken_value} -> {new_xpath}")
-            self.store.save_fix(broken_value, new_xpath)
-           
             # Attempt to find with the new healed locator (only XPath)
             logger.info(f"💡 Ollama suggested new XPath: {new_xpath}")
             
             ai_healed_locator = (By.XPATH, new_xpath)
-            return find_element(ai_healed_locator)
+            try:
+                element = find_element(ai_healed_locator)
+            except (NoSuchElementException, InvalidSelectorException):
+                self.heal_cache.invalidate(heal_key)
+                raise
+            # Save the new locator for future use, once it is known to resolve
+            logger.info(f"Saving healed locator for: {broken_value} -> {new_xpath}")
+            self.store.save_fix(broken_value, new_xpath)
+            self._record_fingerprint(fingerprint_key, element, replace=True)
+            return element
+
+    def _ask_ollama(self, broken_value, description):
+        logger.info(
+            f"⚠️ No cache found for '{broken_value}'. Healing with Ollama..."
+        )
+        # Get new locator from AI healer, from a distilled view of the page when possible
+        try:
+            dom_summary = distill_dom(self.driver, description, broken_value)
+            return self.healer.get_healed_locator_from_dom(
+                broken_value, dom_summary, description
+            )
+        except WebDriverException as e:
+            logger.warning(f"DOM distillation failed ({e.msg}); healing from the page source.")
+            page_source = self.driver.page_source
+            return self.healer.get_healed_locator(
+                broken_value, page_source, description
+            )
+
+    def find_elements_smart(self, locators, timeout=None):
+        """
+        Resolve several locators of the current page, healing all broken ones with at most
+        one Ollama generation over one distilled DOM.
+
+        Args:
+            locators (dict): name -> (locator, description) or (locator, value, description).
+            timeout (float, optional): Overall deadline for the pre-flight lookup of all locators.
+                Defaults to the current lookup deadline.
+
+        Returns:
+            dict: name -> WebElement.
+
+        Raises:
+            NoSuchElementException: If some locators could not be healed.
+        """
+        entries = {
+            name: (spec[0], None, spec[1]) if len(spec) == 2 else tuple(spec)
+            for name, spec in locators.items()
+        }
+        found = self._preflight(entries, get_wait_timeout() if timeout is None else timeout)
+        broken = {}
+        for name, (locator, value, description) in entries.items():
+            fingerprint_key = locator[1] if value is None else f"{locator[1]}::{value}"
+            if name in found:
+                self._record_fingerprint(fingerprint_key, found[name])
+                continue
+            element = self._heal_locally(locator[1], fingerprint_key)
+            if element is not None:
+                found[name] = element
+            else:
+                broken[name] = (locator[1], description, fingerprint_key)
+        if not broken:
+            return found
+
+        page = self._page_key()
+        healed = {}
+        for name, (broken_value, _, _) in broken.items():
+            cached = self.heal_cache.get([broken_value, *page])
+            if cached:
+                healed[name] = cached
+        remaining = {name: entry for name, entry in broken.items() if name not in healed}
+        if remaining:
+            batch_key = ["batch", sorted([name, entry[0]] for name, entry in remaining.items()), *page]
+            answer = self.heal_cache.get_or_compute(batch_key, lambda: self._ask_ollama_batch(remaining)) or {}
+            for name, new_xpath in answer.items():
+                if name in remaining:
+                    healed[name] = new_xpath
+                    self.heal_cache.put([remaining[name][0], *page], new_xpath)
+        for name, new_xpath in healed.items():
+            broken_value, _, fingerprint_key = broken[name]
+            logger.info(f"💡 Ollama suggested new XPath for {name}: {new_xpath}")
+            try:
+                found[name] = find_element((By.XPATH, new_xpath))
+            except (NoSuchElementException, InvalidSelectorException):
+                self.heal_cache.invalidate([broken_value, *page])
+                raise
+            # Only XPaths that resolved on the page become stored fixes
+            self.store.save_fix(broken_value, new_xpath)
+            self._record_fingerprint(fingerprint_key, found[name], replace=True)
+        missing = [name for name in broken if name not in healed]
+        if missing:
+            raise NoSuchElementException(f"Could not heal locators: {', '.join(missing)}")
+        return found
+
+    def _ask_ollama_batch(self, broken):
+        logger.info(f"⚠️ Healing {len(broken)} locators with one Ollama call: {', '.join(broken)}")
+        dom_summary = distill_dom(
+            self.driver,
+            " ".join(description for _, description, _ in broken.values()),
+            " ".join(broken_value for broken_value, _, _ in broken.values()),
+        )
+        return self.healer.get_healed_locators_batch(
+            {name: (broken_value, description) for name, (broken_value, description, _) in broken.items()},
+            dom_summary,
+        )
+
+    def heal_page(self, locator_module, names=None, timeout=None):
+        """
+        Pre-flight a page object's locator module: resolve its locators (or only names, the
+        ones expected on the current page) and batch-heal the broken ones.
+        Descriptions are derived from the variable names (login_button -> "login button").
+        """
+        locators = {
+            name: (locator, name.replace("_", " "))
+            for name, locator in collect_locators(locator_module, names).items()
+        }
+        return self.find_elements_smart(locators, timeout)
+
+    def _preflight(self, entries, timeout):
+        """Poll all locators together until each is found or the shared deadline passes."""
+        found = {}
+        pending = dict(entries)
+        end_time = time.time() + timeout
+        while True:
+            for name, (locator, value, _) in list(pending.items()):
+                try:
+                    elements = find_elements(locator, replace_value=value, timeout=0)
+                except InvalidSelectorException:
+                    elements = []
+                if elements:
+                    found[name] = elements[0]
+                    del pending[name]
+            if not pending or time.time() >= end_time:
+                return found
+            time.sleep(POLL_FREQUENCY)
@@ -1,11 +1,39 @@
 import json
+import logging
 import os
+import time
+
+from helpers.driver_resolver import FileLock
+
+logger = logging.getLogger(__name__)
+
+# Journal records after which the journal is folded back into the JSON snapshot
+COMPACT_AFTER = 200
+
+_stores = {}
 
 
 class LocatorStore:
-    def __init__(self, filepath="self_healing_agent/healed_locators.json"):
+    """
+    Healed locators shared by all test workers.
+
+    Lookups are served from an in-memory index built from the JSON snapshot
+    (healed_locators.json) plus an append-only journal (<snapshot>.journal) that every
+    worker appends its new fixes to. Reads are lock-free and pick up the fixes of other
+    workers incrementally; appends and compaction take a cross-process file lock.
+    """
+
+    def __init__(self, filepath="self_healing_agent/healed_locators.json", compact_after=COMPACT_AFTER):
         self.filepath = filepath
-        self.cache = self._load_cache()
+        self.journal_path = f"{filepath}.journal"
+        self.compact_after = compact_after
+        self._lock = FileLock(f"{filepath}.lock", timeout=30)
+        self.cache = {}
+        self._snapshot_id = None
+        self._journal_id = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._reload()
 
     def _load_cache(self):
         if os.path.exists(self.filepath):
@@ -16,12 +44,103 @@ class LocatorStore:
                 return {}
         return {}
 
+    def _file_id(self, path):
+        """Identity of a file, which changes when another worker replaces it; None when missing."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino, stat.st_mtime_ns
+
+    def _reload(self):
+        # Taken before reading, so a snapshot replaced meanwhile is reloaded on the next read
+        self._snapshot_id = self._file_id(self.filepath)
+        self.cache = self._load_cache()
+        self._journal_id = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._read_journal()
+
+    def _read_journal(self):
+        """Apply the journal records appended since the last read."""
+        if self._file_id(self.filepath) != self._snapshot_id:
+            # Another worker compacted into a new snapshot (possibly before this store saw a journal)
+            self._reload()
+            return
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return
+        journal_id = (stat.st_dev, stat.st_ino)
+        if self._journal_id is not None and (journal_id != self._journal_id or stat.st_size < self._journal_offset):
+            # Another worker compacted the journal: start over from the new snapshot
+            self._reload()
+            return
+        self._journal_id = journal_id
+        if stat.st_size == self._journal_offset:
+            return
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            data = f.read(stat.st_size - self._journal_offset)
+        # A record still being written is picked up by the next read
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping corrupt record in {self.journal_path}")
+                continue
+            self.cache[record["broken"]] = record["healed"]
+            self._journal_records += 1
+        self._journal_offset += complete
+
+    def refresh(self):
+        """Pick up the fixes other workers saved since the last lookup."""
+        self._read_journal()
+
     def get_fix(self, broken_value):
-        """Returns the healed locator if it exists, else None."""
+        """Returns the healed locator if it exists, else None (re-heals by other workers included)."""
+        # A stat call when nothing changed, so fixes replaced by other workers are never served stale
+        self.refresh()
         return self.cache.get(broken_value)
 
     def save_fix(self, broken_value, new_xpath):
-        """Updates the cache and persists it to disk."""
-        self.cache[broken_value] = new_xpath
-        with open(self.filepath, "w") as f:
-            json.dump(self.cache, f, indent=4)
\ No newline at end of file
+        """Updates the cache and appends the fix to the shared journal."""
+        if self.cache.get(broken_value) == new_xpath:
+            return
+        record = json.dumps({"broken": broken_value, "healed": new_xpath, "ts": round(time.time(), 3)}) + "\n"
+        with self._lock:
+            self._read_journal()
+            if self.cache.get(broken_value) == new_xpath:
+                return
+            with open(self.journal_path, "ab") as f:
+                f.write(record.encode("utf-8"))
+            self.cache[broken_value] = new_xpath
+            self._read_journal()
+            if self._journal_records >= self.compact_after:
+                self._compact()
+
+    def compact(self):
+        """Fold the journal into the JSON snapshot and start an empty journal."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        self._read_journal()
+        tmp_path = f"{self.filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.cache, f, indent=4)
+        os.replace(tmp_path, self.filepath)
+        # A new file (new inode) tells readers to reload instead of reading on from their offset
+        tmp_journal = f"{self.journal_path}.{os.getpid()}.tmp"
+        open(tmp_journal, "wb").close()
+        os.replace(tmp_journal, self.journal_path)
+        logger.info(f"Compacted {self._journal_records} healed locator records into {self.filepath}")
+        self._reload()
+
+
+def get_locator_store(filepath="self_healing_agent/healed_locators.json"):
+    """Returns the process-wide LocatorStore of filepath, so SmartDriver instances share one index."""
+    if filepath not in _stores:
+        _stores[filepath] = LocatorStore(filepath)
+    return _stores[filepath]
@@ -0,0 +1,58 @@
+from mitmproxy.test import taddons, tflow
+
+from helpers.ads_blocker_proxy import HarReplay, StaticAssetCache
+
+
+def _font_flow():
+    flow = tflow.tflow()
+    flow.request.url = "https://fonts.gstatic.com/s/roboto/v30/roboto.woff2"
+    return flow
+
+
+def test_cached_asset_is_served_with_its_original_headers(tmp_path):
+    addon = StaticAssetCache()
+    with taddons.context(addon) as tctx:
+        tctx.configure(addon, asset_cache_dir=str(tmp_path))
+        first = _font_flow()
+        first.response = tflow.tresp(content=b"font-bytes")
+        first.response.headers.clear()
+        first.response.headers["Content-Type"] = "font/woff2"
+        first.response.headers["Access-Control-Allow-Origin"] = "*"
+        first.response.headers["Set-Cookie"] = "id=1"
+        addon.response(first)
+
+        second = _font_flow()
+        addon.request(second)
+
+    assert second.metadata["asset_cache_hit"]
+    assert second.response.content == b"font-bytes"
+    assert second.response.headers["Access-Control-Allow-Origin"] == "*"
+    assert second.response.headers["Content-Type"] == "font/woff2"
+    assert "Set-Cookie" not in second.response.headers
+
+
+def test_recorded_exchange_is_replayed_through_the_addon(tmp_path):
+    recorder = HarReplay()
+    with taddons.context(recorder) as tctx:
+        tctx.configure(recorder, replay_dir=str(tmp_path), replay_mode="record", replay_name="gw0")
+        flow = tflow.tflow(resp=True)
+        flow.request.url = "https://www.yatra.com/api/search?q=goa&_=1700000000"
+        flow.response.headers["Content-Type"] = "application/json"
+        flow.response.content = b'{"results": []}'
+        recorder.response(flow)
+        recorder.done()
+
+    replayer = HarReplay()
+    with taddons.context(replayer) as tctx:
+        tctx.configure(replayer, replay_dir=str(tmp_path), replay_mode="replay")
+        replayed = tflow.tflow()
+        replayed.request.url = "https://www.yatra.com/api/search?q=goa&_=1700000999"
+        replayer.request(replayed)
+        missing = tflow.tflow()
+        missing.request.url = "https://www.yatra.com/api/other"
+        replayer.request(missing)
+
+    assert replayed.metadata["replayed"]
+    assert replayed.response.content == b'{"results": []}'
+    assert replayed.response.headers["Content-Type"] == "application/json"
+    assert missing.response.status_code == 404
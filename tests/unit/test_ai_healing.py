@@ -0,0 +1,40 @@
+import pytest
+
+from self_healing_agent import ai_healing
+from self_healing_agent.ai_healing import OllamaHealer
+
+FAILURES = {
+    "username": ("//input[@id='user']", "Username input field"),
+    "login_button": ("//button[@id='go']", "Login button"),
+}
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """Queue of model responses; records the prompts it was asked."""
+    queue = []
+    prompts = []
+
+    def generate(model, prompt, **kwargs):
+        prompts.append((prompt, kwargs))
+        return {"response": queue.pop(0)}
+
+    monkeypatch.setattr(ai_healing.ollama, "generate", generate)
+    return queue, prompts
+
+
+def test_batch_answer_is_mapped_by_name(answers):
+    queue, prompts = answers
+    queue.append('{"username": " //input[@name=\'username\'] ", "login_button": "//button", "other": "//a"}')
+    healed = OllamaHealer().get_healed_locators_batch(FAILURES, "<input name=\"username\">")
+    assert healed == {"username": "//input[@name='username']", "login_button": "//button"}
+    assert len(prompts) == 1 and prompts[0][1] == {"format": "json"}
+
+
+@pytest.mark.parametrize("raw_answer", ['["//input", "//button"]', "not json"], ids=["list", "invalid"])
+def test_answer_that_is_not_an_object_falls_back_to_one_call_per_locator(answers, raw_answer):
+    queue, prompts = answers
+    queue.extend([raw_answer, "//input[@name='username']", ""])
+    healed = OllamaHealer().get_healed_locators_batch(FAILURES, "<input name=\"username\">")
+    assert healed == {"username": "//input[@name='username']"}
+    assert len(prompts) == 3
@@ -0,0 +1,123 @@
+import os
+
+from helpers.asset_cache import AssetCache, is_cacheable_response, is_cacheable_url
+
+FONT_URL = "https://fonts.gstatic.com/s/roboto/v30/roboto.woff2"
+FONT_HEADERS = [
+    ("Content-Type", "font/woff2"),
+    ("Access-Control-Allow-Origin", "*"),
+    ("Cache-Control", "public, max-age=31536000"),
+    ("Content-Encoding", "br"),
+    ("Content-Length", "1234"),
+    ("Set-Cookie", "id=1"),
+    ("Vary", "Origin"),
+    ("Vary", "Accept-Encoding"),
+]
+
+
+def test_miss_then_hit(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    assert cache.get(FONT_URL) is None
+    cache.put(FONT_URL, b"font-bytes", FONT_HEADERS)
+    content, _ = cache.get(FONT_URL)
+    assert content == b"font-bytes"
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_response_headers_are_replayed_without_encoding_and_cookies(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put(FONT_URL, b"font-bytes", FONT_HEADERS)
+    _, headers = cache.get(FONT_URL)
+    assert headers == [
+        ("Content-Type", "font/woff2"),
+        ("Access-Control-Allow-Origin", "*"),
+        ("Cache-Control", "public, max-age=31536000"),
+        ("Vary", "Origin"),
+        ("Vary", "Accept-Encoding"),
+    ]
+
+
+def test_index_and_headers_survive_a_restart(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put(FONT_URL, b"font-bytes", FONT_HEADERS)
+    cache.save_index()
+    reopened = AssetCache(str(tmp_path))
+    content, headers = reopened.get(FONT_URL)
+    assert content == b"font-bytes"
+    assert ("Access-Control-Allow-Origin", "*") in headers
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put("https://a.com/lib.js", b"same", [("Content-Type", "text/javascript")])
+    cache.put("https://b.com/lib.js", b"same", [("Content-Type", "text/javascript")])
+    assert cache.total_bytes == len(b"same")
+    objects = [name for _, _, names in os.walk(tmp_path / "objects") for name in names]
+    assert len(objects) == 1
+
+
+def test_changed_body_replaces_the_entry(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put("https://a.com/app.js", b"v1")
+    cache.put("https://a.com/app.js", b"version-2")
+    assert cache.get("https://a.com/app.js")[0] == b"version-2"
+    assert cache.total_bytes == len(b"version-2")
+
+
+def test_least_recently_used_assets_are_evicted(tmp_path):
+    cache = AssetCache(str(tmp_path), max_bytes=10)
+    cache.put("https://a.com/1.js", b"1111")
+    cache.put("https://a.com/2.js", b"2222")
+    cache.get("https://a.com/1.js")
+    cache.put("https://a.com/3.js", b"3333")
+    assert cache.get("https://a.com/2.js") is None
+    assert cache.get("https://a.com/1.js") is not None
+    assert cache.get("https://a.com/3.js") is not None
+    assert cache.stats["evictions"] == 1
+    assert cache.total_bytes == 8
+
+
+def test_shared_body_is_kept_until_its_last_url_is_evicted(tmp_path):
+    cache = AssetCache(str(tmp_path), max_bytes=8)
+    cache.put("https://a.com/lib.js", b"same")
+    cache.put("https://b.com/lib.js", b"same")
+    cache.put("https://a.com/other.js", b"othr")
+    cache.put("https://a.com/more.js", b"more")
+    assert cache.get("https://a.com/lib.js") is None
+    assert cache.get("https://b.com/lib.js") is None
+    assert cache.total_bytes == 8
+
+
+def test_assets_larger_than_the_cache_are_not_stored(tmp_path):
+    cache = AssetCache(str(tmp_path), max_bytes=3)
+    cache.put("https://a.com/big.js", b"too big")
+    assert cache.get("https://a.com/big.js") is None
+
+
+def test_missing_object_file_is_a_miss(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put("https://a.com/app.css", b"body{}")
+    for root, _, names in os.walk(tmp_path / "objects"):
+        for name in names:
+            os.remove(os.path.join(root, name))
+    assert cache.get("https://a.com/app.css") is None
+    assert cache.total_bytes == 0
+
+
+def test_index_written_before_headers_were_stored_is_read(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put("https://a.com/app.css", b"body{}")
+    cache._index["https://a.com/app.css"] = {
+        "digest": cache._index["https://a.com/app.css"]["digest"], "content_type": "text/css", "size": 6,
+    }
+    cache.save_index()
+    assert AssetCache(str(tmp_path)).get("https://a.com/app.css")[1] == [("Content-Type", "text/css")]
+
+
+def test_cacheable_checks():
+    assert is_cacheable_url("https://a.com/app.min.js?v=3")
+    assert not is_cacheable_url("https://a.com/api/search")
+    assert is_cacheable_response("https://a.com/app.js", 200, {})
+    assert is_cacheable_response("https://a.com/font", 200, {"content-type": "font/woff2"})
+    assert not is_cacheable_response("https://a.com/app.js", 304, {})
+    assert not is_cacheable_response("https://a.com/app.js", 200, {"cache-control": "private, max-age=60"})
@@ -0,0 +1,56 @@
+import asyncio
+import inspect
+
+import pytest
+
+from helpers import async_webdriver_actions, webdriver_actions
+
+# Sync helpers without an async counterpart, and why
+SYNC_ONLY = {
+    "run_with_driver": "thread entry point; tasks use use_driver() or run_flows()",
+}
+
+
+def _public_functions(module):
+    return {
+        name for name, obj in vars(module).items()
+        if not name.startswith("_") and inspect.isfunction(obj)
+    }
+
+
+def test_async_module_mirrors_the_sync_api():
+    sync_names = {
+        name for name in _public_functions(webdriver_actions)
+        if getattr(webdriver_actions, name).__module__ == webdriver_actions.__name__
+    }
+    missing = sync_names - set(SYNC_ONLY) - _public_functions(async_webdriver_actions)
+    assert not missing, f"No async counterpart for: {sorted(missing)}"
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_implicit_wait_changes_the_deadline_of_the_calling_task():
+    async def flow():
+        await async_webdriver_actions.implicit_wait(3)
+        return webdriver_actions.get_wait_timeout()
+
+    assert asyncio.run(flow()) == 3
+
+
+def test_clear_driver_quits_and_unbinds_the_calling_task_driver():
+    driver = FakeDriver()
+
+    async def flow():
+        webdriver_actions.set_driver(driver)
+        await async_webdriver_actions.clear_driver()
+        with pytest.raises(RuntimeError):
+            webdriver_actions.get_driver()
+
+    asyncio.run(flow())
+    assert driver.quit_called
@@ -0,0 +1,150 @@
+import pytest
+
+from helpers.browser_pool import BrowserPool
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_handle = handle
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """Records the WebDriver calls the pool makes; execute_cdp_cmd only exists when cdp=True."""
+
+    def __init__(self, cdp=False, origins=()):
+        self.calls = []
+        self.handles = ["main"]
+        self.current_handle = "main"
+        self.switch_to = _SwitchTo(self)
+        self.alive = True
+        self.quit_called = False
+        self.fail_reset = False
+        self._origins = list(origins)
+        if cdp:
+            self.execute_cdp_cmd = lambda cmd, params: self.calls.append((cmd, params))
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise RuntimeError("browser crashed")
+        return list(self.handles)
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+
+    def execute_script(self, script, *args):
+        if self.fail_reset:
+            raise RuntimeError("reset failed")
+        self.calls.append(("execute_script",))
+        return self._origins if "performance.getEntriesByType" in script else None
+
+    def delete_all_cookies(self):
+        self.calls.append(("delete_all_cookies",))
+
+    def implicitly_wait(self, seconds):
+        self.calls.append(("implicitly_wait", seconds))
+
+    def get(self, url):
+        self.calls.append(("get", url))
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(size=1, **driver_kwargs):
+    created = []
+
+    def factory():
+        created.append(FakeDriver(**driver_kwargs))
+        return created[-1]
+
+    return BrowserPool(factory, size=size), created
+
+
+def test_warm_up_launches_the_configured_size():
+    pool, created = _pool(size=2)
+    pool.warm_up()
+    pool.warm_up()
+    assert len(created) == 2
+
+
+def test_released_browser_is_reused():
+    pool, created = _pool()
+    driver = pool.lease()
+    pool.release(driver)
+    assert pool.lease() is driver
+    assert len(created) == 1
+
+
+def test_lease_times_out_when_all_browsers_are_leased():
+    pool, _ = _pool()
+    pool.lease()
+    with pytest.raises(TimeoutError):
+        pool.lease(timeout=0.01)
+
+
+def test_reset_closes_extra_tabs_and_loads_blank_page():
+    pool, _ = _pool()
+    driver = pool.lease()
+    driver.handles.extend(["popup", "new_tab"])
+    pool.release(driver)
+    assert driver.handles == ["main"]
+    assert driver.current_handle == "main"
+    assert driver.calls[-1] == ("get", "about:blank")
+    assert ("implicitly_wait", 0) in driver.calls
+
+
+def test_reset_without_cdp_deletes_current_origin_cookies():
+    pool, _ = _pool()
+    driver = pool.lease()
+    pool.release(driver)
+    assert ("delete_all_cookies",) in driver.calls
+
+
+def test_reset_with_cdp_clears_cookies_and_storage_of_every_origin():
+    origins = ["https://www.yatra.com", "https://ads.example.com"]
+    pool, _ = _pool(cdp=True, origins=origins)
+    driver = pool.lease()
+    pool.release(driver)
+    cdp_calls = [call for call in driver.calls if call[0] not in ("execute_script", "implicitly_wait", "get")]
+    assert cdp_calls[0] == ("Network.clearBrowserCookies", {})
+    assert cdp_calls[1:] == [
+        ("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}) for origin in origins
+    ]
+    assert ("delete_all_cookies",) not in driver.calls
+
+
+def test_browser_failing_reset_is_discarded_and_replaced():
+    pool, created = _pool()
+    driver = pool.lease()
+    driver.fail_reset = True
+    pool.release(driver)
+    assert driver.quit_called
+    replacement = pool.lease()
+    assert replacement is not driver
+    assert len(created) == 2
+
+
+def test_dead_browser_is_discarded_on_lease():
+    pool, created = _pool()
+    pool.warm_up()
+    created[0].alive = False
+    driver = pool.lease()
+    assert created[0].quit_called
+    assert driver is created[1]
+
+
+def test_close_quits_leased_and_idle_browsers():
+    pool, created = _pool(size=2)
+    pool.warm_up()
+    pool.lease()
+    pool.close()
+    assert all(driver.quit_called for driver in created)
+    with pytest.raises(RuntimeError):
+        pool.lease()
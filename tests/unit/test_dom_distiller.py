@@ -0,0 +1,57 @@
+from self_healing_agent.dom_distiller import DISTILL_DOM_SCRIPT, MAX_CANDIDATES, distill_dom
+
+
+def _candidate(tag, text="", label="", path="form#login", visible=True, interactive=True, **attrs):
+    return {"tag": tag, "attrs": attrs, "text": text, "label": label, "path": path,
+            "visible": visible, "interactive": interactive}
+
+
+CANDIDATES = [
+    _candidate("a", text="Elemental Selenium", href="http://elementalselenium.com/", path="div.footer"),
+    _candidate("h2", text="Login Page", path="div#content", interactive=False),
+    _candidate("button", text="Login", type="submit", **{"class": "radius"}),
+    _candidate("input", id="password", name="password", type="password", label="Password"),
+    _candidate("input", id="username", name="username", type="text", label="Username"),
+    _candidate("input", name="username_hint", type="hidden", visible=False),
+]
+
+
+class FakeDriver:
+    """Returns the canned DISTILL_DOM_SCRIPT extraction and records its arguments."""
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.candidates
+
+
+def test_extraction_runs_in_one_script_call():
+    driver = FakeDriver(CANDIDATES)
+    distill_dom(driver, "Username input field")
+    assert driver.calls == [(DISTILL_DOM_SCRIPT, (MAX_CANDIDATES,))]
+
+
+def test_candidates_are_ranked_by_description_and_broken_locator():
+    lines = distill_dom(FakeDriver(CANDIDATES), "Username input field", "//input[@id='user-name']").splitlines()
+    assert lines[0] == '<input id="username" name="username" type="text" label="Username"> in form#login'
+    # Matching attribute but hidden ranks below the visible match
+    assert lines[1] == '<input name="username_hint" type="hidden" hidden> in form#login'
+    assert lines[-1].startswith("<h2 ")
+
+
+def test_broken_locator_tokens_rank_candidates_without_a_description():
+    lines = distill_dom(FakeDriver(CANDIDATES), "", "//button[@type='submit']").splitlines()
+    assert lines[0] == '<button type="submit" class="radius" text="Login"> in form#login'
+
+
+def test_result_is_trimmed_to_the_token_budget():
+    lines = distill_dom(FakeDriver(CANDIDATES), "Login button", token_budget=20).splitlines()
+    assert sum(len(line) + 1 for line in lines) <= 20 * 4
+    assert lines == ['<button type="submit" class="radius" text="Login"> in form#login']
+
+
+def test_empty_page_gives_an_empty_summary():
+    assert distill_dom(FakeDriver(None), "Login button") == ""
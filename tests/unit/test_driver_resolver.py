@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from helpers import driver_resolver
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    monkeypatch.setattr(driver_resolver, "LOCK_FILE", str(tmp_path / "drivers.lock.json"))
+    monkeypatch.setattr(driver_resolver, "CACHE_DIR", str(tmp_path / ".drivers"))
+    monkeypatch.setattr(driver_resolver, "OFFLINE", False)
+    monkeypatch.setattr(driver_resolver, "_resolved", {})
+    monkeypatch.setattr(driver_resolver, "_rejected", set())
+    monkeypatch.setattr(driver_resolver, "get_browser_major_version", lambda browser: "120")
+    monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: None)
+    return tmp_path
+
+
+def _downloaded(tmp_path, monkeypatch, version):
+    binary = tmp_path / "downloaded" / "chromedriver"
+    binary.parent.mkdir()
+    binary.write_text("binary")
+    monkeypatch.setattr(driver_resolver, "_download", lambda browser, pinned: str(binary))
+    monkeypatch.setattr(driver_resolver, "get_binary_version", lambda path: version)
+
+
+def test_downloaded_version_is_pinned(resolver, monkeypatch):
+    _downloaded(resolver, monkeypatch, "120.0.6099.109")
+    driver_resolver.resolve_driver_binary("chrome")
+    assert json.loads((resolver / "drivers.lock.json").read_text()) == {"chrome": "120.0.6099.109"}
+
+
+def test_unknown_version_is_not_pinned(resolver, monkeypatch):
+    _downloaded(resolver, monkeypatch, None)
+    path = driver_resolver.resolve_driver_binary("chrome")
+    assert path.endswith("chromedriver")
+    assert not (resolver / "drivers.lock.json").exists()
+
+
+def test_unknown_pin_is_ignored(resolver, monkeypatch):
+    (resolver / "drivers.lock.json").write_text(json.dumps({"chrome": "unknown"}))
+    _downloaded(resolver, monkeypatch, "120.0.6099.109")
+    download = driver_resolver._download
+    requested = []
+    monkeypatch.setattr(driver_resolver, "_download", lambda browser, pinned: requested.append(pinned) or download(browser, pinned))
+    driver_resolver.resolve_driver_binary("chrome")
+    assert requested == [None]
+
+
+def test_binary_on_path_is_checked_with_one_version_call(resolver, monkeypatch):
+    calls = []
+    monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: "/usr/bin/chromedriver")
+    monkeypatch.setattr(driver_resolver, "get_binary_version", lambda path: calls.append(path) or "120.0.1")
+    assert driver_resolver._find_on_path("chromedriver", "120", "120") == "/usr/bin/chromedriver"
+    assert calls == ["/usr/bin/chromedriver"]
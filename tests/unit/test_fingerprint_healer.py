@@ -0,0 +1,66 @@
+from self_healing_agent.fingerprint_healer import FINGERPRINT_SCRIPT, FingerprintHealer
+
+FINGERPRINT = {"tag": "button", "id": "submit", "text": "Search", "x": 100, "y": 200}
+
+
+class FakeDriver:
+    """Answers the fingerprint scripts with canned results and counts the round trips."""
+
+    def __init__(self, fingerprint=None, matches=()):
+        self.fingerprint = fingerprint
+        self.matches = list(matches)
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.fingerprint if script == FINGERPRINT_SCRIPT else self.matches
+
+
+def _healer(tmp_path):
+    return FingerprintHealer(str(tmp_path / "fingerprints.json"))
+
+
+def _journal_size(healer):
+    with open(healer.store.journal_path, "rb") as f:
+        return len(f.read())
+
+
+def test_known_locator_is_not_fingerprinted_again(tmp_path):
+    healer = _healer(tmp_path)
+    driver = FakeDriver(fingerprint=FINGERPRINT)
+    healer.record(driver, "//button", element=None)
+    size = _journal_size(healer)
+    driver.fingerprint = dict(FINGERPRINT, id="search")
+    healer.record(driver, "//button", element=None)
+    assert driver.calls == 1
+    assert _journal_size(healer) == size
+
+
+def test_replace_rewrites_only_when_a_stable_attribute_changed(tmp_path):
+    healer = _healer(tmp_path)
+    driver = FakeDriver(fingerprint=FINGERPRINT)
+    healer.record(driver, "//button", element=None)
+    size = _journal_size(healer)
+    driver.fingerprint = dict(FINGERPRINT, text="Search (3)", y=300)
+    healer.record(driver, "//button", element=None, replace=True)
+    assert _journal_size(healer) == size
+    driver.fingerprint = dict(FINGERPRINT, id="search")
+    healer.record(driver, "//button", element=None, replace=True)
+    assert _journal_size(healer) > size
+    assert healer.store.get_fix("//button")["id"] == "search"
+
+
+def test_confident_match_is_returned_with_its_xpath_kind(tmp_path):
+    healer = _healer(tmp_path)
+    healer.record(FakeDriver(fingerprint=FINGERPRINT), "//button", element=None)
+    matches = [{"element": "el", "score": 0.9, "xpath": "/html[1]/body[1]/button[2]", "absolute": True},
+               {"element": "other", "score": 0.4}]
+    assert healer.heal(FakeDriver(matches=matches), "//button") == ("el", "/html[1]/body[1]/button[2]", 0.9, True)
+
+
+def test_ambiguous_or_unknown_match_is_escalated(tmp_path):
+    healer = _healer(tmp_path)
+    healer.record(FakeDriver(fingerprint=FINGERPRINT), "//button", element=None)
+    close = [{"element": "a", "score": 0.9, "xpath": "//a", "absolute": False}, {"element": "b", "score": 0.85}]
+    assert healer.heal(FakeDriver(matches=close), "//button") is None
+    assert healer.heal(FakeDriver(matches=close), "//unknown") is None
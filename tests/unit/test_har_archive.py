@@ -0,0 +1,29 @@
+from helpers.har_archive import normalize_url
+
+
+def test_volatile_query_parameters_are_ignored():
+    assert normalize_url("https://x.com/api?q=goa&_=1700000000&utm_source=mail&cb=42") == "https://x.com/api?q=goa"
+
+
+def test_query_parameters_are_sorted():
+    assert normalize_url("https://x.com/api?b=2&a=1") == normalize_url("https://x.com/api?a=1&b=2")
+
+
+def test_scheme_and_host_are_lowercased_but_path_is_not():
+    assert normalize_url("HTTPS://WWW.Yatra.com/Flights/Search") == "https://www.yatra.com/Flights/Search"
+
+
+def test_fragment_is_dropped():
+    assert normalize_url("https://x.com/page#section") == "https://x.com/page"
+
+
+def test_blank_values_are_kept():
+    assert normalize_url("https://x.com/api?filter=&page=1") == "https://x.com/api?filter=&page=1"
+
+
+def test_repeated_parameters_are_kept():
+    assert normalize_url("https://x.com/api?id=2&id=1") == "https://x.com/api?id=1&id=2"
+
+
+def test_parameter_names_are_matched_case_insensitively():
+    assert normalize_url("https://x.com/api?TS=1&UTM_Campaign=x&q=1") == "https://x.com/api?q=1"
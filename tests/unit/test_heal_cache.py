@@ -0,0 +1,82 @@
+import os
+import time
+
+from self_healing_agent import heal_cache
+from self_healing_agent.heal_cache import HealCache, url_pattern
+
+KEY = ["//button[@id='old']", "www.yatra.com/flights", "1a2b3c"]
+
+
+def _compute(value, calls):
+    def compute():
+        calls.append(value)
+        return value
+    return compute
+
+
+def test_url_pattern_drops_variable_segments():
+    assert url_pattern("https://WWW.Yatra.com/hotels/12345/2024-05-01?x=1#top") == "www.yatra.com/hotels/*/*"
+
+
+def test_result_is_computed_once_and_then_served(tmp_path):
+    cache = HealCache(str(tmp_path))
+    calls = []
+    assert cache.get_or_compute(KEY, _compute("//button[@id='new']", calls)) == "//button[@id='new']"
+    assert cache.get_or_compute(KEY, _compute("//other", calls)) == "//button[@id='new']"
+    assert calls == ["//button[@id='new']"]
+
+
+def test_empty_result_is_not_cached(tmp_path):
+    cache = HealCache(str(tmp_path))
+    cache.get_or_compute(KEY, lambda: "")
+    assert cache.get(KEY) is None
+
+
+def test_expired_result_is_dropped(tmp_path):
+    HealCache(str(tmp_path)).put(KEY, "//new")
+    cache = HealCache(str(tmp_path), ttl=-1)
+    assert cache.get(KEY) is None
+    assert not os.path.exists(cache._path(cache._digest(KEY)))
+
+
+def test_invalidation_by_another_worker_is_seen(tmp_path):
+    cache = HealCache(str(tmp_path))
+    other_worker = HealCache(str(tmp_path))
+    cache.put(KEY, "//new")
+    assert cache.get(KEY) == "//new"
+    other_worker.invalidate(KEY)
+    assert cache.get(KEY) is None
+
+
+def test_new_result_of_another_worker_replaces_the_memory_copy(tmp_path):
+    cache = HealCache(str(tmp_path))
+    other_worker = HealCache(str(tmp_path))
+    cache.put(KEY, "//first")
+    other_worker.put(KEY, "//second")
+    assert cache.get(KEY) == "//second"
+
+
+def test_eviction_drops_the_least_recently_used_entry_of_all_workers(tmp_path):
+    cache = HealCache(str(tmp_path), max_entries=2)
+    other_worker = HealCache(str(tmp_path), max_entries=2)
+    cache.put(["a"], "//a")
+    cache.put(["b"], "//b")
+    past = time.time() - 100
+    os.utime(cache._path(cache._digest(["a"])), (past, past))
+    os.utime(cache._path(cache._digest(["b"])), (past + 10, past + 10))
+    # a is the oldest file, but another worker has just used it
+    assert other_worker.get(["a"]) == "//a"
+    cache.put(["c"], "//c")
+    assert other_worker.get(["a"]) == "//a"
+    assert other_worker.get(["b"]) is None
+
+
+def test_lock_timeout_falls_back_to_computing(tmp_path, monkeypatch):
+    monkeypatch.setattr(heal_cache, "SINGLE_FLIGHT_TIMEOUT", 0.3)
+    cache = HealCache(str(tmp_path))
+    # Another worker is still asking the model for the same key
+    open(os.path.join(str(tmp_path), f"{cache._digest(KEY)}.lock"), "w").close()
+    calls = []
+    assert cache.get_or_compute(KEY, _compute("//new", calls)) == "//new"
+    assert calls == ["//new"]
+    assert cache.get(KEY) == "//new"
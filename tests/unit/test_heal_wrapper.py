@@ -0,0 +1,90 @@
+import types
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from self_healing_agent import heal_wrapper
+from self_healing_agent.fingerprint_healer import FINGERPRINT_SCRIPT, FingerprintHealer
+from self_healing_agent.heal_cache import DOM_SIGNATURE_SCRIPT, HealCache
+from self_healing_agent.heal_wrapper import SmartDriver, collect_locators
+from self_healing_agent.locator_store_helper import LocatorStore
+
+# Stand-in for a locators.* module
+login_locators = types.ModuleType("login_locators")
+login_locators.xpath = By.XPATH
+login_locators.username = (By.XPATH, "//input[@id='user']")
+login_locators.password = (By.ID, "pass")
+login_locators.login_button = (By.XPATH, "//button[@id='go']")
+login_locators.TIMEOUT = 5
+login_locators.window_size = (1280, 720)
+login_locators._private = (By.ID, "hidden")
+
+
+class FakeDriver:
+    """Answers the page signature and fingerprint scripts of the self-healing layer."""
+
+    current_url = "https://the-internet.herokuapp.com/login"
+
+    def execute_script(self, script, *args):
+        if script == DOM_SIGNATURE_SCRIPT:
+            return "abc123"
+        if script == FINGERPRINT_SCRIPT:
+            return {"tag": "input", "id": "", "classes": [], "text": "", "x": 0, "y": 0}
+        return []
+
+
+@pytest.fixture
+def smart_driver(tmp_path, monkeypatch):
+    """SmartDriver whose stores live in tmp_path and whose lookups see page_elements only."""
+    page_elements = {}
+    monkeypatch.setattr(heal_wrapper, "get_locator_store", lambda: LocatorStore(str(tmp_path / "healed.json")))
+    monkeypatch.setattr(heal_wrapper, "FingerprintHealer", lambda: FingerprintHealer(str(tmp_path / "fp.json")))
+    monkeypatch.setattr(heal_wrapper, "get_heal_cache", lambda: HealCache(str(tmp_path / "heal_cache")))
+
+    def find_elements(locator, replace_value=None, timeout=None):
+        return [page_elements[locator]] if locator in page_elements else []
+
+    def find_element(locator, replace_value=None):
+        if locator not in page_elements:
+            raise NoSuchElementException(str(locator))
+        return page_elements[locator]
+
+    monkeypatch.setattr(heal_wrapper, "find_elements", find_elements)
+    monkeypatch.setattr(heal_wrapper, "find_element", find_element)
+    driver = SmartDriver(FakeDriver())
+    driver.page_elements = page_elements
+    return driver
+
+
+def test_collect_locators_keeps_locator_tuples_only():
+    assert collect_locators(login_locators) == {
+        "username": login_locators.username,
+        "password": login_locators.password,
+        "login_button": login_locators.login_button,
+    }
+    assert collect_locators(login_locators, names=["password"]) == {"password": login_locators.password}
+
+
+def test_heal_page_resolves_the_locators_of_the_module(smart_driver):
+    for name in ("username", "password", "login_button"):
+        smart_driver.page_elements[getattr(login_locators, name)] = f"<{name}>"
+    assert smart_driver.heal_page(login_locators, timeout=0) == {
+        "username": "<username>", "password": "<password>", "login_button": "<login_button>",
+    }
+
+
+def test_heal_page_batch_heals_broken_locators_with_derived_descriptions(smart_driver, monkeypatch):
+    smart_driver.page_elements[login_locators.username] = "<username>"
+    smart_driver.page_elements[(By.XPATH, "//button[@type='submit']")] = "<login_button>"
+    asked = []
+
+    def ask_ollama_batch(broken):
+        asked.append({name: description for name, (_, description, _) in broken.items()})
+        return {"login_button": "//button[@type='submit']"}
+
+    monkeypatch.setattr(smart_driver, "_ask_ollama_batch", ask_ollama_batch)
+    found = smart_driver.heal_page(login_locators, names=["username", "login_button"], timeout=0)
+    assert found == {"username": "<username>", "login_button": "<login_button>"}
+    assert asked == [{"login_button": "login button"}]
+    assert smart_driver.store.get_fix("//button[@id='go']") == "//button[@type='submit']"
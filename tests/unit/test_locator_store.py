@@ -0,0 +1,73 @@
+import json
+import multiprocessing
+
+from self_healing_agent.locator_store_helper import LocatorStore
+
+WRITERS = 4
+FIXES_PER_WRITER = 25
+
+
+def _journal_lines(store):
+    with open(store.journal_path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_fix_is_appended_to_the_journal(tmp_path):
+    store = LocatorStore(str(tmp_path / "healed.json"))
+    store.save_fix("//old", "//new")
+    assert store.get_fix("//old") == "//new"
+    assert [(r["broken"], r["healed"]) for r in _journal_lines(store)] == [("//old", "//new")]
+
+
+def test_unchanged_fix_is_not_appended_again(tmp_path):
+    store = LocatorStore(str(tmp_path / "healed.json"))
+    store.save_fix("//old", "//new")
+    store.save_fix("//old", "//new")
+    assert len(_journal_lines(store)) == 1
+
+
+def test_fixes_of_another_worker_are_seen(tmp_path):
+    path = str(tmp_path / "healed.json")
+    reader = LocatorStore(path)
+    writer = LocatorStore(path)
+    writer.save_fix("//old", "//first")
+    assert reader.get_fix("//old") == "//first"
+    # A re-heal replaces a fix the reader already has in memory
+    writer.save_fix("//old", "//second")
+    assert reader.get_fix("//old") == "//second"
+
+
+def test_journal_is_compacted_into_the_snapshot(tmp_path):
+    path = tmp_path / "healed.json"
+    reader = LocatorStore(str(path))
+    store = LocatorStore(str(path), compact_after=3)
+    for i in range(3):
+        store.save_fix(f"//old{i}", f"//new{i}")
+    assert json.loads(path.read_text()) == {f"//old{i}": f"//new{i}" for i in range(3)}
+    assert _journal_lines(store) == []
+    store.save_fix("//old3", "//new3")
+    # The reader notices the new journal and starts over from the snapshot
+    assert {f"//old{i}": reader.get_fix(f"//old{i}") for i in range(4)} == {
+        f"//old{i}": f"//new{i}" for i in range(4)
+    }
+
+
+def _write_fixes(path, writer):
+    store = LocatorStore(path, compact_after=10)
+    for i in range(FIXES_PER_WRITER):
+        store.save_fix(f"//w{writer}/old{i}", f"//w{writer}/new{i}")
+
+
+def test_concurrent_writers_lose_no_fix(tmp_path):
+    path = str(tmp_path / "healed.json")
+    processes = [multiprocessing.Process(target=_write_fixes, args=(path, w)) for w in range(WRITERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+    store = LocatorStore(path)
+    assert len(store.cache) == WRITERS * FIXES_PER_WRITER
+    assert all(
+        store.get_fix(f"//w{w}/old{i}") == f"//w{w}/new{i}" for w in range(WRITERS) for i in range(FIXES_PER_WRITER)
+    )
@@ -0,0 +1,41 @@
+import datetime
+
+import pytest
+
+from helpers.page_helpers import calculate_calendar_clicks
+
+
+def _month_index(days_offset=0):
+    date = datetime.date.today() + datetime.timedelta(days=days_offset)
+    return date.year * 12 + date.month - 1
+
+
+def test_target_in_displayed_months_needs_no_clicks():
+    current = _month_index()
+    assert calculate_calendar_clicks([current, current + 1], 0) == 0
+
+
+def test_target_in_second_displayed_month_needs_no_clicks():
+    current = _month_index()
+    target = _month_index(35)
+    assert calculate_calendar_clicks([target - 1, target], 35) == 0
+    assert target - current in (1, 2)
+
+
+@pytest.mark.parametrize("days_offset", [60, 120, 365])
+def test_future_target_clicks_forward_from_last_displayed_month(days_offset):
+    current = _month_index()
+    displayed = [current, current + 1]
+    assert calculate_calendar_clicks(displayed, days_offset) == _month_index(days_offset) - (current + 1)
+
+
+def test_past_target_clicks_back_from_first_displayed_month():
+    current = _month_index()
+    displayed = [current + 2, current + 3]
+    assert calculate_calendar_clicks(displayed, 0) == -2
+
+
+def test_year_boundary_is_crossed():
+    target = _month_index(100)
+    displayed = [target - 13, target - 12]
+    assert calculate_calendar_clicks(displayed, 100) == 12
@@ -0,0 +1,66 @@
+import http.server
+import os
+import socket
+import threading
+
+import pytest
+
+from helpers import proxy_launcher
+from helpers.proxy_launcher import ProxyProcess
+
+
+class _ForeignProxy(http.server.BaseHTTPRequestHandler):
+    """Answers every proxied request like another worker's proxy would."""
+
+    def do_GET(self):
+        body = b"another-instance"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def foreign_proxy():
+    server = http.server.HTTPServer(("127.0.0.1", 0), _ForeignProxy)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_proxy_answers_with_its_own_instance(tmp_path):
+    proxy = ProxyProcess(options={"asset_cache_dir": str(tmp_path / "cache")}).start()
+    try:
+        assert proxy._probe_instance() == proxy.instance_id
+    finally:
+        proxy.stop()
+
+
+def test_taken_auto_port_is_retried_on_another_port(tmp_path, foreign_proxy, monkeypatch):
+    ports = iter([foreign_proxy])
+    real_find_free_port = proxy_launcher.find_free_port
+    monkeypatch.setattr(proxy_launcher, "find_free_port", lambda host: next(ports, None) or real_find_free_port(host))
+    proxy = ProxyProcess(options={"asset_cache_dir": str(tmp_path / "cache")}).start()
+    try:
+        assert proxy.port != foreign_proxy
+        assert proxy._probe_instance() == proxy.instance_id
+    finally:
+        proxy.stop()
+
+
+def test_taken_explicit_port_fails(tmp_path, foreign_proxy):
+    with pytest.raises(RuntimeError):
+        ProxyProcess(port=foreign_proxy, options={"asset_cache_dir": str(tmp_path / "cache")}).start(attempts=1)
+
+
+def test_worker_proxy_gets_its_own_asset_cache(monkeypatch):
+    started = []
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setattr(ProxyProcess, "start", lambda self: started.append(self) or self)
+    proxy_launcher.start_worker_proxy({"adblock": True})
+    assert started[0].options == {"asset_cache_dir": os.path.join(".asset_cache", "gw3"), "adblock": True}
+    os.environ.pop(proxy_launcher.PROXY_ADDRESS_ENV, None)
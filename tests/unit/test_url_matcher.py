@@ -0,0 +1,130 @@
+import pytest
+
+from helpers.url_matcher import AhoCorasick, HostnameSuffixTrie, UrlMatcher
+
+
+def _matcher(*rules):
+    matcher = UrlMatcher()
+    for rule in rules:
+        matcher._add_rule(rule)
+    return matcher.compile()
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "hers", "doubleclick"])
+    assert automaton.search("ushers") in ("she", "he")
+    assert automaton.search("ad.doubleclick.net") == "doubleclick"
+    assert automaton.search("example.com") is None
+
+
+def test_aho_corasick_follows_failure_links():
+    # "abd" fails at "d" after "ab" and must continue from the "b" state of "bd"
+    automaton = AhoCorasick(["abc", "bd"])
+    assert automaton.search("xabd") == "bd"
+
+
+def test_aho_corasick_ignores_empty_patterns():
+    automaton = AhoCorasick([""])
+    assert len(automaton) == 0
+    assert automaton.search("anything") is None
+
+
+def test_hostname_trie_matches_domain_and_subdomains_only():
+    trie = HostnameSuffixTrie(["doubleclick.net"])
+    assert trie.search("doubleclick.net") == "doubleclick.net"
+    assert trie.search("ad.g.DoubleClick.net") == "doubleclick.net"
+    assert trie.search("notdoubleclick.net") is None
+    assert trie.search("doubleclick.net.example.com") is None
+
+
+@pytest.mark.parametrize(
+    "url, blocked",
+    [
+        ("https://doubleclick.net/ad.js", True),
+        ("https://stats.doubleclick.net/pixel", True),
+        ("https://mydoubleclick.net/", False),
+    ],
+    ids=["domain", "subdomain", "lookalike_domain"],
+)
+def test_domain_anchor_rule(url, blocked):
+    matcher = _matcher("||doubleclick.net^")
+    assert (matcher.match(url) is not None) is blocked
+
+
+def test_domain_anchor_rule_with_path_becomes_substring_rule():
+    matcher = _matcher("||example.com/ads/^")
+    assert matcher.match("https://example.com/ads/banner.png") == "example.com/ads/"
+    assert matcher.match("https://example.com/content/") is None
+
+
+def test_start_anchor_and_separator_are_stripped():
+    matcher = _matcher("|https://tracker.example^")
+    assert matcher.match("https://tracker.example/collect") == "https://tracker.example"
+
+
+def test_wildcard_rule_uses_longest_literal_part():
+    matcher = _matcher("/ad/*/sponsored_banner_")
+    assert matcher.match("https://site.com/ad/300x250/sponsored_banner_1.gif") == "/sponsored_banner_"
+    assert matcher.match("https://site.com/ad/300x250/logo.gif") is None
+
+
+def test_too_generic_rules_are_skipped():
+    matcher = UrlMatcher()
+    assert matcher._add_rule("*ad*") is False
+    assert matcher.rule_count == 0
+
+
+@pytest.mark.parametrize(
+    "rule",
+    ["! comment", "[Adblock Plus 2.0]", "example.com##.ad", "/ads?[0-9]/", ""],
+    ids=["comment", "header", "element_hiding", "regex", "empty"],
+)
+def test_unsupported_lines_are_skipped(rule):
+    assert UrlMatcher()._add_rule(rule) is False
+
+
+def test_options_are_stripped_from_rules():
+    matcher = _matcher("||adserver.example^$third-party,domain=yatra.com|~news.yatra.com", "/popunder.$script,domain=a.com")
+    assert matcher.match("https://cdn.adserver.example/x.js") == "adserver.example"
+    assert matcher.match("https://site.com/js/popunder.js") == "/popunder."
+
+
+def test_domain_exception_overrides_blocking_rule():
+    matcher = _matcher("||ads.example^", "@@||safe.ads.example^")
+    assert matcher.match("https://img.ads.example/a.png") == "ads.example"
+    assert matcher.match("https://safe.ads.example/lib.js") is None
+
+
+def test_keyword_exception_overrides_blocking_rule():
+    matcher = _matcher("analytics", "@@/analytics/consent.js$script")
+    assert matcher.match("https://site.com/analytics/track.js") == "analytics"
+    assert matcher.match("https://site.com/analytics/consent.js") is None
+
+
+def test_exception_rules_do_not_count_as_blocking_rules():
+    matcher = _matcher("@@||cdn.example^")
+    assert matcher.rule_count == 0
+    assert matcher.match("https://cdn.example/app.js") is None
+
+
+def test_match_is_case_insensitive():
+    matcher = UrlMatcher(keywords=["AdServer"], domains=["Tracker.COM"]).compile()
+    assert matcher.match("https://x.com/ADSERVER/banner") == "adserver"
+    assert matcher.match("https://WWW.tracker.com/") == "tracker.com"
+
+
+def test_load_rules_counts_supported_lines(tmp_path):
+    rules = tmp_path / "easylist.txt"
+    rules.write_text("! Title: test\n||ads.example^\n@@||ok.example^\nexample.com##.banner\n/adframe.\n")
+    matcher = UrlMatcher()
+    assert matcher.load_rules(str(rules)) == 3
+
+
+def test_to_url_patterns_excludes_exceptions():
+    matcher = _matcher("||ads.example^", "/adframe.", "@@||ok.example^")
+    assert matcher.to_url_patterns() == ["*://ads.example/*", "*.ads.example/*", "*/adframe.*"]
+
+
+def test_to_url_patterns_keep_the_rule_spelling_for_case_sensitive_matching():
+    matcher = UrlMatcher(keywords=["NativeAd", "doubleclick"]).compile()
+    assert matcher.to_url_patterns() == ["*doubleclick*", "*NativeAd*", "*nativead*"]
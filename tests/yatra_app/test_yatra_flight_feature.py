@@ -9,6 +9,7 @@ yatra_data = file_handling.load_test_data("../testdata/yatra_flight_data.json")
 yatra_common_data = file_handling.load_test_data("../testdata/yatra_common_data.json")
 
 @pytest.mark.positive
+@pytest.mark.lean_page
 def test_one_way_search_flights(load_base_url):
     logger.info("Starting test: test_one_way_search_flights")
     select_yatra_service(yatra_common_data["flights"])
@@ -29,8 +30,8 @@ def test_round_trip_search_international_flights(load_base_url):
     departure_city_input(yatra_data["round_trip_flight"]["from_city"], yatra_data["default_departure_city"])
     arrival_city_input(yatra_data["round_trip_flight"]["to_city"], yatra_data["default_arrival_city"])
     select_departure_date(yatra_data["round_trip_flight"]["departure_after_days"], yatra_data["departure_calendar"])
-    implicit_wait(2)
-    select_return_date(yatra_data["round_trip_flight"]["return_after_days"], yatra_data["return_calendar"])
+    with wait_timeout(2):
+        select_return_date(yatra_data["round_trip_flight"]["return_after_days"], yatra_data["return_calendar"])
     click_search_button()
     logger.info("Verifying that search results are displayed for round-trip flight search.")
     assert is_search_results_displayed_for_round_trip() is True, "Search results are not displayed for round-trip flight search."
@@ -97,8 +98,8 @@ def test_search_flight_with_max_allowed_adults_and_infants(load_base_url):
     select_yatra_service(yatra_common_data["flights"])
     select_flight_way(yatra_data["one_way"])
     select_passenger([adult_traveller, max_adult],[infant_traveller, max_infant])
-    implicit_wait(5)
-    click_search_button()
+    with wait_timeout(5):
+        click_search_button()
     logger.info("Verifying that search results are displayed for edge case flight search.")
     assert is_search_results_displayed_for_one_way() is True, "Search results are not displayed for edge case flight search."
 
@@ -10,6 +10,7 @@ yatra_common_data = file_handling.load_test_data("../testdata/yatra_common_data.
 
 
 @pytest.mark.positive
+@pytest.mark.lean_page
 def test_search_hotels_in_major_city_for_two_adults(driver, load_base_url):
     logger.info("Starting test: test_search_hotels_in_major_city_for_two_adults")
     select_yatra_service(yatra_common_data["hotels"])